@@ -0,0 +1,181 @@
+"""
+TC Insight – Mesure mémoire du modèle (__slots__)
+
+Construit le modèle depuis un Excel métier (par défaut le template
+Cameroon) comme generate_spec, puis affiche :
+
+- la mémoire allouée par les builders (tracemalloc : courante / pic) ;
+- par classe du modèle : nombre d'objets vivants, taille d'un objet
+  avec __slots__ et taille du même objet avec un __dict__ par instance
+  (sys.getsizeof de l'objet + de son dict).
+
+Usage :
+    PYTHONPATH=src python benchmarks/model_memory.py [excel.xlsx]
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+
+from tc_spec.builder import (
+    build_anomalies,
+    build_back_checks,
+    build_lists,
+    build_questions,
+    build_rules,
+    build_sections,
+)
+from tc_spec.builder.interning import RuleInterner
+from tc_spec.excel import load_excel_all
+from tc_spec.model import (
+    Anomaly,
+    BackCheckRules,
+    ColumnarSpecList,
+    Condition,
+    ListItem,
+    Question,
+    Rule,
+    Section,
+    Spec,
+    SpecList,
+)
+from tc_spec.pipeline import map_excel_to_machine_first
+from tc_spec.validation import validate_excel
+
+DEFAULT_EXCEL = (
+    Path(__file__).parent.parent / "TC Insight Cameroon JTI Questionnaire Template.xlsx"
+)
+
+MODEL_CLASSES = (
+    Spec,
+    Section,
+    Question,
+    Rule,
+    Condition,
+    Anomaly,
+    SpecList,
+    ColumnarSpecList,
+    ListItem,
+    BackCheckRules,
+)
+
+
+def build_model(sheets) -> Spec:
+    """
+    Mêmes builders, dans le même ordre, que main.generate_spec.
+    """
+    token = validate_excel(sheets)
+    interner = RuleInterner()
+    rules = build_rules(sheets["VISIBILITY_RULES"], interner)
+    questions = build_questions(
+        sheets["QUESTIONS"], sheets["QUESTION_TYPES"], rules, interner, token=token
+    )
+    sections = build_sections(sheets["SECTIONS"], questions, rules, interner)
+    lists = build_lists(sheets["LISTS"], interner, token=token)
+
+    anomalies = {}
+    if "ANOMALIES" in sheets and not sheets["ANOMALIES"].empty:
+        anomalies = build_anomalies(sheets["ANOMALIES"], rules)
+
+    back_checks = None
+    if "BACK_CHECKS" in sheets and not sheets["BACK_CHECKS"].empty:
+        back_checks = build_back_checks(sheets["BACK_CHECKS"])
+
+    return Spec(
+        name="TC Insight Spec",
+        version="2.0.0",
+        sections=sections,
+        lists=lists,
+        anomalies=anomalies,
+        back_checks=back_checks,
+    )
+
+
+def _slot_names(cls) -> list:
+    return [
+        name
+        for klass in cls.__mro__
+        for name in getattr(klass, "__slots__", ())
+    ]
+
+
+_PLAIN_CLASSES = {}
+
+
+def dict_equivalent_size(obj) -> int:
+    """
+    Taille du même objet sans __slots__ : instance d'une classe ordinaire
+    (une par classe du modèle, dicts à clés partagées) portant les mêmes
+    attributs.
+    """
+    cls = type(obj)
+    if cls not in _PLAIN_CLASSES:
+        _PLAIN_CLASSES[cls] = type(f"Plain{cls.__name__}", (), {})
+    plain = _PLAIN_CLASSES[cls]()
+    for name in _slot_names(cls):
+        if hasattr(obj, name):
+            setattr(plain, name, getattr(obj, name))
+    return sys.getsizeof(plain) + sys.getsizeof(plain.__dict__)
+
+
+def slotted_size(obj) -> int:
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def model_objects():
+    """
+    Objets vivants du modèle, groupés par classe.
+    """
+    objects = defaultdict(list)
+    for obj in gc.get_objects():
+        if type(obj) in MODEL_CLASSES:
+            objects[type(obj)].append(obj)
+    return objects
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("excel", nargs="?", type=Path, default=DEFAULT_EXCEL)
+    args = parser.parse_args(argv)
+
+    sheets = map_excel_to_machine_first(load_excel_all(args.excel))
+
+    gc.collect()
+    tracemalloc.start()
+    spec = build_model(sheets)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"Excel : {args.excel.name}")
+    print(f"Builders : {current / 1024:.1f} KiB retenus, pic {peak / 1024:.1f} KiB")
+    print()
+    print(f"{'classe':<18}{'objets':>8}{'slots (o)':>11}{'dict (o)':>10}{'gain (KiB)':>12}")
+
+    total_slotted = total_dict = 0
+    for cls, objects in sorted(model_objects().items(), key=lambda e: e[0].__name__):
+        slotted = sum(slotted_size(obj) for obj in objects)
+        with_dict = sum(dict_equivalent_size(obj) for obj in objects)
+        total_slotted += slotted
+        total_dict += with_dict
+        print(
+            f"{cls.__name__:<18}{len(objects):>8}"
+            f"{slotted / len(objects):>11.0f}{with_dict / len(objects):>10.0f}"
+            f"{(with_dict - slotted) / 1024:>12.1f}"
+        )
+
+    print()
+    print(
+        f"Total (objets seuls) : {total_slotted / 1024:.1f} KiB avec __slots__, "
+        f"{total_dict / 1024:.1f} KiB avec __dict__"
+    )
+    del spec
+
+
+if __name__ == "__main__":
+    main()
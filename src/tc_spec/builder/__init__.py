@@ -10,6 +10,7 @@ from tc_spec.builder.questions import build_questions
 from tc_spec.builder.sections import build_sections
 from tc_spec.builder.lists import build_lists
 from tc_spec.builder.anomalies import build_anomalies
+from tc_spec.builder.back_checks import build_back_checks
 
 __all__ = [
     "build_rules",
@@ -17,6 +18,7 @@ __all__ = [
     "build_sections",
     "build_lists",
     "build_anomalies",
+    "build_back_checks",
 ]
 
 from tc_spec.builder import (
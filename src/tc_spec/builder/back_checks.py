@@ -0,0 +1,61 @@
+from typing import Dict
+
+import pandas as pd
+
+from tc_spec.model.back_check import BackCheckRules
+from tc_spec.utils.errors import ExcelValidationError
+
+BACK_CHECKS_REQUIRED_COLS = {
+    "rule_key",
+    "value",
+}
+
+def _validate_columns(df: pd.DataFrame):
+    missing = BACK_CHECKS_REQUIRED_COLS - set(df.columns)
+    if missing:
+        raise ExcelValidationError(
+            f"BACK_CHECKS missing columns: {missing}"
+        )
+
+def build_back_checks(back_checks_df: pd.DataFrame) -> BackCheckRules:
+    """
+    Construit le jeu de règles de back-check du spec.
+
+    Les doublons exacts sont ignorés ; une même règle définie avec des
+    valeurs différentes pour la même portée est une erreur. Toutes les
+    contradictions sont signalées en une fois.
+    """
+    _validate_columns(back_checks_df)
+
+    df = back_checks_df
+    if "question" not in df.columns:
+        df = df.assign(question=None)
+
+    questions = df["question"].astype(object)
+    df = df.assign(question=questions.where(questions.notna(), None))
+    df = df.drop_duplicates(subset=["rule_key", "question", "value"])
+
+    conflicts = df[df.duplicated(subset=["rule_key", "question"], keep=False)]
+    if not conflicts.empty:
+        details = "\n".join(
+            f"- '{key}'"
+            + (f" ({question})" if question else "")
+            + f": {sorted(map(str, group['value']))}"
+            for (key, question), group in conflicts.groupby(
+                ["rule_key", conflicts["question"].fillna("")],
+                sort=False,
+            )
+        )
+        raise ExcelValidationError(
+            f"Conflicting back check rules ({len(conflicts)} row(s)):\n{details}"
+        )
+
+    rules: Dict[str, object] = {}
+    by_question: Dict[str, Dict[str, object]] = {}
+    for key, question, value in zip(df["rule_key"], df["question"], df["value"]):
+        if question is None:
+            rules[key] = value
+        else:
+            by_question.setdefault(question, {})[key] = value
+
+    return BackCheckRules(rules=rules, by_question=by_question)
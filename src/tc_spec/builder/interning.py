@@ -0,0 +1,120 @@
+"""
+TC Insight – Partage des conditions, règles et libellés
+
+La même condition (ex: A-10 = "Yes") et les mêmes libellés reviennent
+sur de nombreuses questions. Un RuleInterner est créé pour une
+génération et partagé par les builders : il retourne une instance
+unique (immuable) de Condition / Rule par contenu, et une seule copie
+de chaque chaîne de libellé ou de code de langue.
+"""
+
+import sys
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from tc_spec.model.rule import Condition, Rule
+
+# (ref, opérateur, type de valeur, type Python de la valeur, valeur) :
+# le type évite de confondre 1, 1.0 et True, sérialisés différemment.
+ConditionKey = Tuple[str, str, str, type, Hashable]
+
+
+def intern_text(value: Any) -> Any:
+    """
+    Copie partagée d'une chaîne ; les autres valeurs sont inchangées.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+class RuleInterner:
+    """
+    Fabrique de Condition / Rule partagées et pool de chaînes.
+    """
+
+    def __init__(self):
+        self._conditions: Dict[ConditionKey, Condition] = {}
+        self._rules: Dict[Tuple[Condition, ...], Rule] = {}
+        self._or_rules: Dict[Tuple[Condition, ...], Rule] = {}
+
+    def condition(
+        self,
+        ref: str,
+        operator: str,
+        value_type: str,
+        value: Any,
+    ) -> Condition:
+        key = (ref, operator, value_type, type(value), value)
+        try:
+            condition = self._conditions.get(key)
+        except TypeError:
+            # Valeur non hashable (liste…) : instance non partagée
+            return Condition(ref, operator, value_type, value)
+
+        if condition is None:
+            condition = Condition(
+                intern_text(ref),
+                operator,
+                value_type,
+                intern_text(value),
+            )
+            self._conditions[key] = condition
+        return condition
+
+    def rule(self, condition: Condition) -> Rule:
+        key = (condition,)
+        rule = self._rules.get(key)
+        if rule is None:
+            rule = self._rules[key] = Rule(condition=condition)
+        return rule
+
+    def or_rule(self, conditions: List[Condition]) -> Rule:
+        key = tuple(conditions)
+        rule = self._or_rules.get(key)
+        if rule is None:
+            rule = self._or_rules[key] = Rule(or_conditions=key)
+        return rule
+
+    def from_parsed(self, parsed_rules: List[Dict[str, Any]]) -> List[Rule]:
+        """
+        Convertit les règles parsées (visibility_parser) en Rule partagées.
+
+        Format :
+        - condition simple : {"r": "Q-10", "o": "=", "v": "value"}
+        - OR : {"or": [{"r": "Q-10", "o": "=", "v": "v1"}, ...]}
+        """
+        rules = []
+        for rule_dict in parsed_rules:
+            if "or" in rule_dict:
+                rules.append(self.or_rule([
+                    self.condition(c["r"], c["o"], "v", c["v"])
+                    for c in rule_dict["or"]
+                ]))
+            else:
+                rules.append(self.rule(
+                    self.condition(rule_dict["r"], rule_dict["o"], "v", rule_dict["v"])
+                ))
+        return rules
+
+    def text(self, value: Any) -> Any:
+        return intern_text(value)
+
+    def texts(self, texts: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Dictionnaire multilingue dont codes de langue et libellés sont partagés.
+        """
+        return {
+            intern_text(lang): intern_text(text)
+            for lang, text in texts.items()
+        }
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "conditions": len(self._conditions),
+            "rules": len(self._rules) + len(self._or_rules),
+        }
+
+
+def get_interner(interner: Optional[RuleInterner]) -> RuleInterner:
+    """
+    Interner fourni par l'appelant, sinon un interner propre à l'appel.
+    """
+    return interner if interner is not None else RuleInterner()
@@ -1,8 +1,10 @@
-from typing import Dict
+from typing import Dict, Optional, Union
 
 import pandas as pd
 
-from tc_spec.model.list import SpecList, ListItem
+from tc_spec.builder.interning import RuleInterner, get_interner, intern_text
+from tc_spec.model.list import ColumnarSpecList, SpecList
+from tc_spec.model.trusted import ValidationToken, trusted
 from tc_spec.utils.errors import ExcelValidationError
 
 LISTS_REQUIRED_COLS = {
@@ -18,9 +20,59 @@ def _validate_columns(df: pd.DataFrame):
             f"LISTS missing columns: {missing}"
         )
 
-def build_lists(lists_df: pd.DataFrame) -> Dict[str, SpecList]:
+# Au-delà, une liste est stockée en colonnes (ColumnarSpecList)
+COLUMNAR_LIST_THRESHOLD = 1000
+
+def _build_columnar_list(list_code: str, group: pd.DataFrame) -> ColumnarSpecList:
+    labels = {
+        intern_text(col.replace("lang_", "")): [
+            intern_text(text) if pd.notna(text) else None
+            for text in group[col]
+        ]
+        for col in group.columns
+        if col.startswith("lang_")
+    }
+    parents = None
+    if _has_parents(group):
+        parents = [
+            intern_text(str(parent)) if pd.notna(parent) else None
+            for parent in group["parent"]
+        ]
+    return ColumnarSpecList(
+        code=list_code,
+        values=[str(value) for value in group["value"]],
+        labels=labels,
+        parents=parents,
+    )
+
+def _has_parents(group: pd.DataFrame) -> bool:
+    return "parent" in group.columns and group["parent"].notna().any()
+
+def _group_children(group: pd.DataFrame) -> pd.DataFrame:
+    """
+    Rend contigus les enfants d'un même parent (listes hiérarchiques),
+    parents dans l'ordre de première apparition, ordre conservé entre
+    frères.
+    """
+    if not _has_parents(group):
+        return group
+    parent_rank = pd.Series(pd.factorize(group["parent"])[0], index=group.index)
+    return group.loc[parent_rank.sort_values(kind="stable").index]
+
+def build_lists(
+    lists_df: pd.DataFrame,
+    interner: Optional[RuleInterner] = None,
+    columnar_threshold: int = COLUMNAR_LIST_THRESHOLD,
+    token: Optional[ValidationToken] = None,
+) -> Dict[str, Union[SpecList, ColumnarSpecList]]:
     """
     Construit les listes du spec.
+    Les listes de plus de `columnar_threshold` items sont stockées
+    en colonnes (ColumnarSpecList). Dans une liste hiérarchique (AREA),
+    chaque item garde son parent et les enfants d'un même parent sont
+    regroupés (index parent -> enfants du spec).
+    Avec le jeton de validate_excel, les items sont créés sans contrôle
+    individuel (voir SpecList.from_validated_frame).
 
     Retour :
       {
@@ -30,29 +82,18 @@ def build_lists(lists_df: pd.DataFrame) -> Dict[str, SpecList]:
     """
 
     _validate_columns(lists_df)
-    lists: Dict[str, SpecList] = {}
+    interner = get_interner(interner)
+    lists: Dict[str, Union[SpecList, ColumnarSpecList]] = {}
+
+    # Jeton vérifié une fois pour toute la feuille
+    validated = trusted(token, "LISTS", lists_df)
 
     grouped = lists_df.sort_values("order").groupby("list_code")
     for list_code, group in grouped:
-        items = []
-
-        for _, row in group.iterrows():
-            labels = {
-                k.replace("lang_", ""): v
-                for k, v in row.items()
-                if k.startswith("lang_") and pd.notna(v)
-            }
-
-            item = ListItem(
-                value=str(row["value"]),
-                labels=labels,
-            )
-
-            items.append(item)
-        spec_list = SpecList(
-            code=list_code,
-            items=items,
-        )
+        group = _group_children(group)
+        if len(group) > columnar_threshold:
+            lists[list_code] = _build_columnar_list(list_code, group)
+            continue
 
-        lists[list_code] = spec_list
+        lists[list_code] = SpecList.from_validated_frame(group, validated, interner.text)
     return lists
@@ -1,9 +1,11 @@
-from typing import Dict, List, Any
+from typing import Dict, Optional
+import re
 
 import pandas as pd
 
+from tc_spec.builder.interning import RuleInterner, get_interner, intern_text
 from tc_spec.model.question import Question
-from tc_spec.model.rule import Rule, Condition
+from tc_spec.model.trusted import ValidationToken, trusted
 from tc_spec.utils.errors import ExcelValidationError
 
 QUESTIONS_REQUIRED_COLS = {
@@ -21,78 +23,144 @@ def _validate_columns(df: pd.DataFrame, required: set, sheet: str):
             f"{sheet} missing columns: {missing}"
         )
 
-def _build_qtype(row: pd.Series) -> dict:
-    qtype = {"t": row["type"]}
+# Contraintes (colonnes QUESTION_TYPES) -> clé qtype
+CONSTRAINT_KEYS = {
+    "min": "-",
+    "max": "+",
+    "default": "d",
+    "regex": "regex",
+    "choice_limit": "c",
+}
 
-    if pd.notna(row.get("min")):
-        qtype["-"] = row["min"]
+# Contraintes acceptées par chaque type (branches typeX du schéma) et
+# genre de valeur attendu
+QTYPE_CONSTRAINTS = {
+    "O": {"c": "choice"},
+    "T": {"-": "integer", "+": "integer", "d": "string", "regex": "string"},
+    "TM": {"-": "integer", "d": "string"},
+    "N": {"-": "number", "+": "number", "d": "number"},
+    "C": {"-": "integer", "+": "integer"},
+    "I": {"-": "integer"},
+}
 
-    if pd.notna(row.get("max")):
-        qtype["+"] = row["max"]
 
-    if pd.notna(row.get("default")):
-        qtype["d"] = row["default"]
+def _constraint_value(kind: str, value):
+    """
+    Valeur convertie au genre attendu, None si elle ne convient pas.
+    """
+    if kind == "string":
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return value if isinstance(value, str) else str(value)
+
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, str):
+        try:
+            value = float(value)
+        except ValueError:
+            return None
+    if not isinstance(value, (int, float)):
+        return None
+
+    if kind == "number":
+        return int(value) if float(value).is_integer() else float(value)
+    if not float(value).is_integer():
+        return None
+    if kind == "choice" and int(value) != 1:
+        return None
+    return int(value)
+
+
+def _constraint_errors(question_types_df: pd.DataFrame) -> list:
+    """
+    Contraintes que le type de la question n'accepte pas, ou dont la
+    valeur n'a pas le genre attendu.
+    """
+    fields = [f for f in CONSTRAINT_KEYS if f in question_types_df.columns]
+    if not fields:
+        return []
 
-    if pd.notna(row.get("regex")):
-        qtype["regex"] = row["regex"]
+    constrained = question_types_df[question_types_df[fields].notna().any(axis=1)]
+    errors = []
+    for _, row in constrained.iterrows():
+        ref = f"{row['section']}-{row['q_num']}"
+        allowed = QTYPE_CONSTRAINTS.get(row["type"], {})
+        for field in fields:
+            value = row[field]
+            if pd.isna(value):
+                continue
+            kind = allowed.get(CONSTRAINT_KEYS[field])
+            if kind is None:
+                errors.append(
+                    f"{ref}: {field} {value!r} not allowed for type {row['type']!r}"
+                )
+            elif _constraint_value(kind, value) is None:
+                expected = "1" if kind == "choice" else f"a {kind}"
+                errors.append(f"{ref}: {field} {value!r} must be {expected}")
+    return errors
+
+
+def _regex_errors(question_types_df: pd.DataFrame) -> list:
+    """
+    Compile chaque regex distincte une seule fois.
+    """
+    if "regex" not in question_types_df.columns:
+        return []
+
+    with_regex = question_types_df[question_types_df["regex"].notna()]
+    refs = with_regex["section"].astype(str) + "-" + with_regex["q_num"].astype(str)
+
+    errors = []
+    for pattern, pattern_refs in refs.groupby(with_regex["regex"], sort=False):
+        try:
+            re.compile(pattern)
+        except (re.error, TypeError) as e:
+            errors.append(
+                f"{', '.join(pattern_refs)}: invalid regex {pattern!r} ({e})"
+            )
+    return errors
+
+
+def _validate_constraints(question_types_df: pd.DataFrame):
+    """
+    Regex invalides et contraintes hors schéma signalées ensemble.
+    """
+    errors = _regex_errors(question_types_df) + _constraint_errors(question_types_df)
+    if errors:
+        raise ExcelValidationError(
+            f"Invalid constraints in QUESTION_TYPES ({len(errors)} error(s)):\n- "
+            + "\n- ".join(errors)
+        )
+
+def _build_qtype(row: pd.Series) -> dict:
+    qtype = {"t": row["type"]}
+    allowed = QTYPE_CONSTRAINTS.get(row["type"], {})
+
+    for field, key in CONSTRAINT_KEYS.items():
+        if pd.notna(row.get(field)):
+            qtype[key] = _constraint_value(allowed[key], row[field])
 
     if pd.notna(row.get("list_code")):
         qtype["o"] = row["list_code"]
 
-    if pd.notna(row.get("choice_limit")):
-        qtype["c"] = int(row["choice_limit"])
-
     if pd.notna(row.get("auto_code")):
         qtype["i"] = row["auto_code"]
 
     return qtype
 
 
-def _convert_visibility_rules(parsed_rules: List[Dict[str, Any]]) -> List[Rule]:
-    """
-    Convert parsed visibility rules (dicts) to Rule objects.
-    
-    Parsed rules format:
-    - Simple condition: {"r": "Q-10", "o": "=", "v": "value"}
-    - OR conditions: {"or": [{"r": "Q-10", "o": "=", "v": "v1"}, ...]}
-    """
-    rules = []
-    
-    for rule_dict in parsed_rules:
-        if "or" in rule_dict:
-            # OR rule with multiple conditions
-            conditions = []
-            for cond_dict in rule_dict["or"]:
-                condition = Condition(
-                    ref=cond_dict["r"],
-                    operator=cond_dict["o"],
-                    value_type="v",  # Default to "v" (value)
-                    value=cond_dict["v"]
-                )
-                conditions.append(condition)
-            
-            rule = Rule(or_conditions=conditions)
-            rules.append(rule)
-        else:
-            # Simple condition
-            condition = Condition(
-                ref=rule_dict["r"],
-                operator=rule_dict["o"],
-                value_type="v",  # Default to "v" (value)
-                value=rule_dict["v"]
-            )
-            rule = Rule(condition=condition)
-            rules.append(rule)
-    
-    return rules
-
 def build_questions(
     questions_df: pd.DataFrame,
     question_types_df: pd.DataFrame,
     rules_by_target: Dict[str, list],
+    interner: Optional[RuleInterner] = None,
+    token: Optional[ValidationToken] = None,
 ) -> Dict[str, Question]:
     """
     Construit toutes les questions du spec.
+    Avec le jeton de validate_excel, les questions sont créées en masse
+    sans contrôle individuel (voir Question.bulk_from_records).
 
     Retour :
       {
@@ -102,6 +170,8 @@ def build_questions(
     """
     _validate_columns(questions_df, QUESTIONS_REQUIRED_COLS, "QUESTIONS")
     _validate_columns(question_types_df, QUESTION_TYPES_REQUIRED_COLS, "QUESTION_TYPES")
+    _validate_constraints(question_types_df)
+    interner = get_interner(interner)
 
     type_index = {}
 
@@ -114,7 +184,7 @@ def build_questions(
         type_index[ref] = _build_qtype(row)
 
 
-    questions: Dict[str, Question] = {}
+    records = []
 
     for _, row in questions_df.iterrows():
         ref = f"{row['section']}-{row['q_num']}"
@@ -124,11 +194,11 @@ def build_questions(
                 f"Missing question type for {ref}"
             )
 
-        texts = {
+        texts = interner.texts({
             k.replace("lang_", ""): v
             for k, v in row.items()
             if k.startswith("lang_") and pd.notna(v)
-        }
+        })
 
         roles = []
         if pd.notna(row.get("roles")):
@@ -143,17 +213,20 @@ def build_questions(
             # Convert them to Rule objects
             parsed_rules = row.get("visibility")
             if isinstance(parsed_rules, list):
-                visibility = _convert_visibility_rules(parsed_rules)
-
-        question = Question(
-            ref=ref,
-            label=row["label"],
-            texts=texts,
-            qtype=type_index[ref],
-            roles=roles,
-            visibility=visibility,
+                visibility = interner.from_parsed(parsed_rules)
+
+        records.append({
+            "ref": ref,
+            "label": intern_text(row["label"]),
+            "texts": texts,
+            "qtype": type_index[ref],
+            "roles": roles,
+            "visibility": visibility,
+        })
+
+    return {
+        question.ref: question
+        for question in Question.bulk_from_records(
+            records, trusted(token, "QUESTIONS", questions_df)
         )
-
-        questions[ref] = question
-
-    return questions
+    }
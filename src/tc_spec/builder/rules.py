@@ -1,8 +1,9 @@
 from collections import defaultdict
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import pandas as pd
 
+from tc_spec.builder.interning import RuleInterner, get_interner
 from tc_spec.model.rule import Rule, Condition
 from tc_spec.utils.errors import ExcelValidationError
 
@@ -22,9 +23,9 @@ def _validate_columns(df: pd.DataFrame):
             f"VISIBILITY_RULES missing columns: {missing}"
         )
 
-def _build_condition(row: pd.Series) -> Condition:
+def _build_condition(row: pd.Series, interner: RuleInterner) -> Condition:
     try:
-        return Condition(
+        return interner.condition(
             ref=str(row["r_ref"]).strip(),
             operator=str(row["operator"]).strip(),
             value_type=str(row["value_type"]).strip(),
@@ -35,9 +36,13 @@ def _build_condition(row: pd.Series) -> Condition:
             f"Invalid rule condition on row {row.name}: {e}"
         ) from e
 
-def build_rules(df: pd.DataFrame) -> Dict[str, List[Rule]]:
+def build_rules(
+    df: pd.DataFrame,
+    interner: Optional[RuleInterner] = None,
+) -> Dict[str, List[Rule]]:
     """
     Construit des règles à partir d'un DataFrame Excel.
+    Conditions et règles identiques sont partagées (voir interning).
 
     Retour :
       {
@@ -48,6 +53,7 @@ def build_rules(df: pd.DataFrame) -> Dict[str, List[Rule]]:
     """
 
     _validate_columns(df)
+    interner = get_interner(interner)
 
     rules_by_target: Dict[str, List[Rule]] = defaultdict(list)
 
@@ -65,19 +71,15 @@ def build_rules(df: pd.DataFrame) -> Dict[str, List[Rule]]:
 
         for or_key, or_group in or_groups:
             conditions = [
-                _build_condition(row)
+                _build_condition(row, interner)
                 for _, row in or_group.iterrows()
             ]
 
             if or_key == "__AND__":
                 # AND implicite → une règle par condition
                 for cond in conditions:
-                    rules_by_target[key].append(
-                        Rule(condition=cond)
-                    )
+                    rules_by_target[key].append(interner.rule(cond))
             else:
                 # OR explicite
-                rules_by_target[key].append(
-                    Rule(or_conditions=conditions)
-                )
+                rules_by_target[key].append(interner.or_rule(conditions))
     return rules_by_target
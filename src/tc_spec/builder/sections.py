@@ -1,10 +1,11 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Optional
 
 import pandas as pd
 
+from tc_spec.builder.interning import RuleInterner, get_interner
 from tc_spec.model.section import Section
 from tc_spec.model.question import Question
-from tc_spec.model.rule import Rule, Condition
+from tc_spec.model.rule import Rule
 from tc_spec.utils.errors import ExcelValidationError
 
 SECTIONS_REQUIRED_COLS = {
@@ -21,48 +22,11 @@ def _validate_columns(df: pd.DataFrame):
         )
 
 
-def _convert_visibility_rules(parsed_rules: List[Dict[str, Any]]) -> List[Rule]:
-    """
-    Convert parsed visibility rules (dicts) to Rule objects.
-    
-    Parsed rules format:
-    - Simple condition: {"r": "Q-10", "o": "=", "v": "value"}
-    - OR conditions: {"or": [{"r": "Q-10", "o": "=", "v": "v1"}, ...]}
-    """
-    rules = []
-    
-    for rule_dict in parsed_rules:
-        if "or" in rule_dict:
-            # OR rule with multiple conditions
-            conditions = []
-            for cond_dict in rule_dict["or"]:
-                condition = Condition(
-                    ref=cond_dict["r"],
-                    operator=cond_dict["o"],
-                    value_type="v",  # Default to "v" (value)
-                    value=cond_dict["v"]
-                )
-                conditions.append(condition)
-            
-            rule = Rule(or_conditions=conditions)
-            rules.append(rule)
-        else:
-            # Simple condition
-            condition = Condition(
-                ref=rule_dict["r"],
-                operator=rule_dict["o"],
-                value_type="v",  # Default to "v" (value)
-                value=rule_dict["v"]
-            )
-            rule = Rule(condition=condition)
-            rules.append(rule)
-    
-    return rules
-
 def build_sections(
     sections_df: pd.DataFrame,
     questions: Dict[str, Question],
     rules_by_target: Dict[str, List[Rule]],
+    interner: Optional[RuleInterner] = None,
 ) -> Dict[str, Section]:
     """
     Construit les sections du spec.
@@ -74,6 +38,7 @@ def build_sections(
       }
     """
     _validate_columns(sections_df)
+    interner = get_interner(interner)
     questions_by_section: Dict[str, List[Question]] = {}
 
     for ref, question in questions.items():
@@ -100,7 +65,7 @@ def build_sections(
         if code in section_visibility_rules:
             parsed_rules = section_visibility_rules[code]
             if isinstance(parsed_rules, list):
-                visibility = _convert_visibility_rules(parsed_rules)
+                visibility = interner.from_parsed(parsed_rules)
         
         section = Section(
             code=code,
@@ -11,7 +11,22 @@ import sys
 from pathlib import Path
 
 from tc_spec.main import generate_spec
-from tc_spec.utils.errors import SpecError
+from tc_spec.utils.errors import SchemaValidationError, SpecError
+from tc_spec.validation.schema_compiler import compile_schema
+from tc_spec.validation.schema_levels import (
+    DEFAULT_SAMPLE_RATE,
+    SCHEMA_VALIDATION_LEVELS,
+    check_sample_rate,
+)
+from tc_spec.validation.streaming_validation import validate_spec_file
+
+def _sample_rate(text: str) -> float:
+    try:
+        return check_sample_rate(float(text))
+    except (ValueError, SchemaValidationError) as e:
+        raise argparse.ArgumentTypeError(
+            f"invalid sample rate '{text}' (expected 0 < rate <= 1)"
+        ) from e
 
 def create_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
@@ -62,6 +77,78 @@ def create_parser() -> argparse.ArgumentParser:
         help="Excel format: 'machine' (default) or 'metier' (requires mapping)",
     )
 
+    generate.add_argument(
+        "--check-refs",
+        action="store_true",
+        help="Fail on broken cross references (rule refs, list values, list codes)",
+    )
+
+    generate.add_argument(
+        "--report",
+        type=Path,
+        help="Collect all validation issues with their Excel cells into this "
+        "file (.json or .csv) instead of stopping at the first one",
+    )
+
+    generate.add_argument(
+        "--schema-validation",
+        default="off",
+        choices=SCHEMA_VALIDATION_LEVELS,
+        help="Validation of the generated spec: 'off' (default), 'structural' "
+        "(cross references and question type discriminators), 'full' "
+        "(JSON Schema), 'subtree' (JSON Schema per section, list and "
+        "anomaly, unchanged ones served from cache) or 'sampled' (JSON "
+        "Schema on a random subset)",
+    )
+
+    generate.add_argument(
+        "--sample-rate",
+        type=_sample_rate,
+        default=DEFAULT_SAMPLE_RATE,
+        help="Share of questions and lists checked with --schema-validation sampled",
+    )
+
+    generate.add_argument(
+        "--fingerprint",
+        action="store_true",
+        help="Write the spec content fingerprint into the output (meta.fp)",
+    )
+
+    compile_cmd = subparsers.add_parser(
+        "compile-schema",
+        help="Compile a JSON Schema into a specialized Python validator",
+    )
+
+    compile_cmd.add_argument(
+        "schema",
+        type=Path,
+        help="Path to the JSON Schema file",
+    )
+
+    compile_cmd.add_argument(
+        "--out",
+        type=Path,
+        help="Output module path (default: next to the schema)",
+    )
+
+    validate_json = subparsers.add_parser(
+        "validate-json",
+        help="Validate a spec JSON file against the schema (streamed)",
+    )
+
+    validate_json.add_argument(
+        "spec",
+        type=Path,
+        help="Path to the spec JSON file",
+    )
+
+    validate_json.add_argument(
+        "--schema",
+        required=True,
+        type=Path,
+        help="Path to the JSON Schema file",
+    )
+
     return parser
 
 def main():
@@ -75,6 +162,12 @@ def main():
     )
 
     if args.command == "generate":
+        if args.schema_validation != "off":
+            # Durée de la validation affichée quel que soit le niveau de log
+            logging.getLogger("tc_spec.validation.schema_levels").setLevel(
+                min(logging.INFO, logging.getLogger().level)
+            )
+
         if not args.validate_only and not args.out:
             print(
                 "Error: --out is required unless --validate-only is set",
@@ -89,6 +182,11 @@ def main():
                 schema_path=args.schema,
                 excel_mode=args.excel_mode,
                 validate_only=args.validate_only,
+                check_references=args.check_refs,
+                report_path=args.report,
+                schema_validation=args.schema_validation,
+                sample_rate=args.sample_rate,
+                fingerprint=args.fingerprint,
             )
 
             if args.validate_only:
@@ -107,5 +205,24 @@ def main():
                 file=sys.stderr,
             )
             sys.exit(99)
+
+    if args.command == "compile-schema":
+        try:
+            output = compile_schema(args.schema, args.out)
+            print(f"✔ Schema validator compiled: {output}")
+            sys.exit(0)
+        except SpecError as e:
+            print(f"✖ Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    if args.command == "validate-json":
+        try:
+            validate_spec_file(args.spec, args.schema)
+            print(f"✔ Spec is valid: {args.spec}")
+            sys.exit(0)
+        except SpecError as e:
+            print(f"✖ Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,134 @@
+"""
+TC Insight – Provenance des lignes machine-first
+
+Chaque ligne produite par les mappers garde la feuille et la ligne
+Excel (1-based) dont elle provient, dans deux colonnes dédiées. La
+colonne Excel de chaque champ est enregistrée par feuille dans
+`df.attrs["source_columns"]` : {feuille: {champ: lettre}}.
+
+Les erreurs de validation peuvent ainsi être rattachées à une cellule
+A1 du classeur d'origine (ex: 'Volume'!C12). Pour un Excel
+machine-first, la position se déduit directement de la feuille.
+"""
+
+from typing import Dict, Hashable, Iterable, Mapping, Optional, Tuple
+
+import pandas as pd
+
+SOURCE_SHEET = "source_sheet"
+SOURCE_ROW = "source_row"
+SOURCE_COLUMNS_ATTR = "source_columns"
+# {en-tête: position} posé par la détection d'en-tête (feuilles header=None)
+COLUMN_POSITIONS_ATTR = "column_positions"
+
+SOURCE_COLUMNS = [SOURCE_SHEET, SOURCE_ROW]
+
+# En-tête machine-first sur la ligne 1 : la ligne d'index 0 est la ligne 2
+_MACHINE_FIRST_ROW_OFFSET = 2
+
+
+def column_letter(position: int) -> str:
+    """
+    Lettre de colonne Excel d'une position 0-based (0 -> A, 27 -> AB).
+    """
+    letters = ""
+    position += 1
+    while position:
+        position, rest = divmod(position - 1, 26)
+        letters = chr(ord("A") + rest) + letters
+    return letters
+
+
+def column_positions(header_values: Iterable[str]) -> Dict[str, int]:
+    """
+    Position d'origine de chaque en-tête détecté (première occurrence).
+    """
+    positions: Dict[str, int] = {}
+    for i, header in enumerate(header_values):
+        positions.setdefault(header, i)
+    return positions
+
+
+def field_columns(df: pd.DataFrame, cols: Mapping[str, Optional[str]]) -> Dict[str, str]:
+    """
+    Lettres de colonne des champs résolus ({champ: en-tête}) d'une feuille
+    dont l'en-tête a été détecté.
+    """
+    positions = df.attrs.get(COLUMN_POSITIONS_ATTR, {})
+    return {
+        field: column_letter(positions[header])
+        for field, header in cols.items()
+        if header is not None and header in positions
+    }
+
+
+def tag_source(frame: pd.DataFrame, sheet: str, raw_index: Iterable[Hashable]) -> pd.DataFrame:
+    """
+    Ajoute la provenance à `frame` : `raw_index` est l'index 0-based des
+    lignes dans la feuille brute (header=None).
+    """
+    frame[SOURCE_SHEET] = sheet
+    frame[SOURCE_ROW] = [int(i) + 1 for i in raw_index]
+    return frame
+
+
+def merge_source_columns(frames: Iterable[pd.DataFrame]) -> Dict[str, Dict[str, str]]:
+    merged: Dict[str, Dict[str, str]] = {}
+    for frame in frames:
+        for sheet, letters in frame.attrs.get(SOURCE_COLUMNS_ATTR, {}).items():
+            merged.setdefault(sheet, {}).update(letters)
+    return merged
+
+
+def source_cell(
+    df: pd.DataFrame,
+    index: Hashable,
+    field: Optional[str],
+    sheet: str,
+) -> Tuple[str, Optional[str]]:
+    """
+    Feuille et cellule A1 d'origine du champ `field` de la ligne `index`.
+
+    Si la colonne du champ est inconnue, la cellule est la ligne entière
+    (ex: "12:12"). Si `df` ne vient pas du mapping, c'est la feuille
+    machine-first `sheet` telle que chargée (en-tête en ligne 1).
+    """
+    if SOURCE_SHEET in df.columns:
+        source_sheet = df.at[index, SOURCE_SHEET]
+        source_row = df.at[index, SOURCE_ROW]
+        if source_sheet is None or pd.isna(source_row):
+            return sheet, None
+        letters = df.attrs.get(SOURCE_COLUMNS_ATTR, {}).get(source_sheet, {})
+        letter = letters.get(field)
+        row = int(source_row)
+        return source_sheet, (f"{letter}{row}" if letter else f"{row}:{row}")
+
+    if SOURCE_COLUMNS_ATTR in df.attrs:
+        # Feuille produite par le mapping, sans ligne d'origine
+        return sheet, None
+
+    try:
+        row = int(index) + _MACHINE_FIRST_ROW_OFFSET
+    except (TypeError, ValueError):
+        return sheet, None
+    if field in df.columns:
+        return sheet, f"{column_letter(df.columns.get_loc(field))}{row}"
+    return sheet, f"{row}:{row}"
+
+
+def find_source_cell(
+    df: pd.DataFrame,
+    sheet: str,
+    key_column: str,
+    key: Hashable,
+    field: Optional[str],
+) -> Tuple[str, Optional[str]]:
+    """
+    Comme source_cell, pour la première ligne où `key_column` vaut `key`.
+    """
+    if key_column not in df.columns:
+        return sheet, None
+    matches = df.index[(df[key_column] == key).to_numpy()]
+    if len(matches) == 0:
+        return sheet, None
+    return source_cell(df, matches[0], field, sheet)
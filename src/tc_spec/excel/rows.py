@@ -0,0 +1,146 @@
+"""
+TC Insight – Modèles de lignes machine-first
+
+Un modèle pydantic par feuille machine-first. Chaque feuille est validée
+en un seul appel TypeAdapter(list[Row]).validate_python(records) : le
+validateur compilé applique coercition et contrôles d'énumération sur
+toutes les lignes et retourne toutes les erreurs en une passe.
+"""
+
+from functools import lru_cache
+from typing import Annotated, Any, Dict, Hashable, List, Literal, Optional, Tuple, Type
+
+import pandas as pd
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+
+from tc_spec.utils.errors import ExcelValidationError
+
+NonEmptyStr = Annotated[str, Field(min_length=1)]
+
+QuestionTypeCode = Literal["O", "T", "TM", "N", "C", "I", "A", "-"]
+TargetType = Literal["question", "section", "anomaly"]
+Operator = Literal["=", "!", ">", "<", ">=", "<=", "e", "!e"]
+ValueType = Literal["v", "a"]
+
+
+class _Row(BaseModel):
+    # Colonnes supplémentaires (lang_*, attributs métier) ignorées ;
+    # les codes numériques lus depuis Excel sont acceptés comme texte.
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        coerce_numbers_to_str=True,
+        str_strip_whitespace=True,
+    )
+
+
+class QuestionRow(_Row):
+    section: NonEmptyStr
+    q_num: NonEmptyStr
+    label: NonEmptyStr
+
+
+class QuestionTypeRow(_Row):
+    section: NonEmptyStr
+    q_num: NonEmptyStr
+    type: QuestionTypeCode
+    list_code: Optional[str] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    regex: Optional[str] = None
+    choice_limit: Optional[int] = None
+
+
+class SectionRow(_Row):
+    section_code: NonEmptyStr
+    section_label: NonEmptyStr
+    order: int
+
+
+class ListRow(_Row):
+    list_code: Annotated[str, Field(pattern=r"^LST-")]
+    value: NonEmptyStr
+    order: Optional[int] = None
+
+
+class VisibilityRuleRow(_Row):
+    target_type: TargetType
+    target_ref: NonEmptyStr
+    r_ref: NonEmptyStr
+    operator: Operator
+    value_type: ValueType
+    value: Any = None
+    or_group: Optional[str] = None
+
+
+class AnomalyRow(_Row):
+    anomaly_code: NonEmptyStr
+    weight: Annotated[int, Field(gt=0)]
+
+
+SHEET_ROW_MODELS: Dict[str, Type[_Row]] = {
+    "QUESTIONS": QuestionRow,
+    "QUESTION_TYPES": QuestionTypeRow,
+    "SECTIONS": SectionRow,
+    "LISTS": ListRow,
+    "VISIBILITY_RULES": VisibilityRuleRow,
+    "ANOMALIES": AnomalyRow,
+}
+
+
+@lru_cache(maxsize=None)
+def _sheet_adapter(row_model: Type[_Row]) -> TypeAdapter:
+    # Le schéma de validation n'est compilé qu'une fois par modèle
+    return TypeAdapter(List[row_model])
+
+
+def _records(df: pd.DataFrame) -> List[dict]:
+    # NaN / NA -> None pour que les champs optionnels restent optionnels
+    return df.astype(object).where(df.notna(), None).to_dict("records")
+
+
+def _row_issue(df: pd.DataFrame, error: dict) -> Tuple[Hashable, str, str]:
+    position, *field = error["loc"]
+    field_name = ".".join(str(f) for f in field) or "row"
+    index = df.index[position]
+    return (
+        index,
+        field_name,
+        f"Invalid {field_name} {error.get('input')!r} "
+        f"(row {index}): {error['msg']}",
+    )
+
+
+def sheet_row_issues(sheet: str, df: pd.DataFrame) -> List[Tuple[Hashable, str, str]]:
+    """
+    Valide toutes les lignes d'une feuille et retourne les erreurs
+    (index de ligne, champ, message).
+    """
+    row_model = SHEET_ROW_MODELS[sheet]
+    try:
+        _sheet_adapter(row_model).validate_python(_records(df))
+    except ValidationError as e:
+        return [_row_issue(df, error) for error in e.errors()]
+    return []
+
+
+def sheet_row_errors(sheet: str, df: pd.DataFrame) -> List[str]:
+    """
+    Valide toutes les lignes d'une feuille et retourne les erreurs.
+    """
+    return [message for _, _, message in sheet_row_issues(sheet, df)]
+
+
+def validate_sheet_rows(sheet: str, df: pd.DataFrame) -> None:
+    """
+    Valide les lignes d'une feuille ; toutes les erreurs sont levées
+    ensemble dans une seule ExcelValidationError.
+    """
+    errors = sheet_row_errors(sheet, df)
+    if len(errors) == 1:
+        raise ExcelValidationError(f"{sheet}: {errors[0]}")
+    if errors:
+        raise ExcelValidationError(
+            f"{sheet}: {len(errors)} invalid value(s):\n- "
+            + "\n- ".join(errors)
+        )
@@ -1,22 +1,67 @@
-from typing import Dict, Set, Tuple
+from typing import Dict, Hashable, List, Optional
 
 import pandas as pd
 
+from tc_spec.excel.provenance import source_cell
+from tc_spec.excel.rows import sheet_row_issues, validate_sheet_rows
+from tc_spec.model.trusted import ValidationToken
 from tc_spec.utils.errors import ExcelValidationError
+from tc_spec.utils.report import ValidationReport
 
 _ALLOW_EMPTY_SHEETS = {
     "VISIBILITY_RULES",
     "ANOMALIES",
 }
 
-def _validate_non_empty(sheets: Dict[str, pd.DataFrame]):
+def _fail(
+    report: Optional[ValidationReport],
+    message: str,
+    sheet: str,
+    df: Optional[pd.DataFrame] = None,
+    index: Optional[Hashable] = None,
+    field: Optional[str] = None,
+) -> None:
+    """
+    Sans rapport : lève immédiatement (fail fast).
+    Avec rapport : enregistre le problème avec sa cellule d'origine.
+    """
+    if report is None:
+        raise ExcelValidationError(message)
+
+    cell = None
+    if df is not None and index is not None:
+        sheet, cell = source_cell(df, index, field, sheet)
+    report.add("excel", message, sheet, cell)
+
+def _validate_non_empty(sheets: Dict[str, pd.DataFrame], report=None):
     for name, df in sheets.items():
         if name in _ALLOW_EMPTY_SHEETS:
             continue
         if df.empty:
-            raise ExcelValidationError(
-                f"Sheet '{name}' must not be empty"
-            )
+            _fail(report, f"Sheet '{name}' must not be empty", name)
+
+def _validate_rows(sheet: str, df: pd.DataFrame, report=None):
+    if report is None:
+        validate_sheet_rows(sheet, df)
+        return
+    for index, field, message in sheet_row_issues(sheet, df):
+        _fail(report, f"{sheet}: {message}", sheet, df, index, field)
+
+def _question_keys(df: pd.DataFrame) -> pd.Series:
+    """
+    Clé (section, q_num) de chaque ligne, sous forme de tuples str.
+    """
+    return pd.Series(
+        list(zip(df["section"].astype(str), df["q_num"].astype(str))),
+        index=df.index,
+        dtype=object,
+    )
+
+def _flagged(mask: pd.Series) -> List[Hashable]:
+    """
+    Index des lignes en erreur, dans l'ordre de la feuille.
+    """
+    return mask.index[mask.to_numpy()].tolist()
 
 QUESTIONS_REQUIRED_COLS = {
     "section",
@@ -24,35 +69,39 @@ QUESTIONS_REQUIRED_COLS = {
     "label",
 }
 
-def _validate_questions(df: pd.DataFrame):
+def _validate_questions(df: pd.DataFrame, report=None):
     missing = QUESTIONS_REQUIRED_COLS - set(df.columns)
     if missing:
-        raise ExcelValidationError(
-            f"QUESTIONS missing columns: {missing}"
-        )
+        _fail(report, f"QUESTIONS missing columns: {missing}", "QUESTIONS")
+        return
 
-    seen: Set[Tuple[str, str]] = set()
+    _validate_rows("QUESTIONS", df, report)
 
-    for idx, row in df.iterrows():
-        key = (str(row["section"]), str(row["q_num"]))
+    keys = _question_keys(df)
 
-        if key in seen:
-            raise ExcelValidationError(
-                f"Duplicate question {key} in QUESTIONS (row {idx})"
-            )
-        seen.add(key)
+    for idx in _flagged(keys.duplicated()):
+        _fail(
+            report,
+            f"Duplicate question {keys[idx]} in QUESTIONS (row {idx})",
+            "QUESTIONS", df, idx, "label",
+        )
 
-        # au moins une langue
-        lang_cols = [c for c in df.columns if c.startswith("lang_")]
-        if not lang_cols:
-            raise ExcelValidationError(
-                "QUESTIONS must define at least one lang_* column"
-            )
+    # au moins une langue
+    lang_cols = [c for c in df.columns if str(c).startswith("lang_")]
+    if not lang_cols and not df.empty:
+        _fail(
+            report,
+            "QUESTIONS must define at least one lang_* column",
+            "QUESTIONS",
+        )
+        return
 
-        if all(pd.isna(row[c]) for c in lang_cols):
-            raise ExcelValidationError(
-                f"Question {key} has no label in any language (row {idx})"
-            )
+    for idx in _flagged(~df[lang_cols].notna().any(axis=1)):
+        _fail(
+            report,
+            f"Question {keys[idx]} has no label in any language (row {idx})",
+            "QUESTIONS", df, idx, "lang_SYS",
+        )
 
 QUESTION_TYPES_REQUIRED_COLS = {
     "section",
@@ -60,48 +109,51 @@ QUESTION_TYPES_REQUIRED_COLS = {
     "type",
 }
 
-ALLOWED_TYPES = {"O", "T", "TM", "N", "C", "I", "A", "-"}
-
-def _validate_question_types(df: pd.DataFrame):
+def _validate_question_types(df: pd.DataFrame, report=None):
     missing = QUESTION_TYPES_REQUIRED_COLS - set(df.columns)
     if missing:
-        raise ExcelValidationError(
-            f"QUESTION_TYPES missing columns: {missing}"
-        )
+        _fail(report, f"QUESTION_TYPES missing columns: {missing}", "QUESTION_TYPES")
+        return
 
-    seen: Set[Tuple[str, str]] = set()
+    # Types autorisés et bornes contrôlés par QuestionTypeRow
+    _validate_rows("QUESTION_TYPES", df, report)
 
-    for idx, row in df.iterrows():
-        key = (str(row["section"]), str(row["q_num"]))
-
-        if key in seen:
-            raise ExcelValidationError(
-                f"Multiple types defined for question {key} (row {idx})"
-            )
-        seen.add(key)
+    keys = _question_keys(df)
 
-        if row["type"] not in ALLOWED_TYPES:
-            raise ExcelValidationError(
-                f"Invalid question type '{row['type']}' for {key}"
-            )
+    for idx in _flagged(keys.duplicated()):
+        _fail(
+            report,
+            f"Multiple types defined for question {keys[idx]} (row {idx})",
+            "QUESTION_TYPES", df, idx, "type",
+        )
 
 def _validate_questions_have_types(
     questions_df: pd.DataFrame,
     types_df: pd.DataFrame,
+    report=None,
 ):
-    q_keys = {
-        (str(r["section"]), str(r["q_num"]))
-        for _, r in questions_df.iterrows()
-    }
-    t_keys = {
-        (str(r["section"]), str(r["q_num"]))
-        for _, r in types_df.iterrows()
-    }
-
-    missing = q_keys - t_keys
-    if missing:
-        raise ExcelValidationError(
-            f"Questions without types: {missing}"
+    if not (
+        QUESTIONS_REQUIRED_COLS <= set(questions_df.columns)
+        and QUESTION_TYPES_REQUIRED_COLS <= set(types_df.columns)
+    ):
+        # Colonnes manquantes déjà signalées
+        return
+
+    q_keys = _question_keys(questions_df)
+    untyped = ~q_keys.isin(set(_question_keys(types_df)))
+
+    if report is None:
+        if untyped.any():
+            raise ExcelValidationError(
+                f"Questions without types: {set(q_keys[untyped])}"
+            )
+        return
+
+    for idx in _flagged(untyped):
+        _fail(
+            report,
+            f"Question {q_keys[idx]} has no type",
+            "QUESTIONS", questions_df, idx, "type",
         )
 
 SECTIONS_REQUIRED_COLS = {
@@ -110,30 +162,40 @@ SECTIONS_REQUIRED_COLS = {
     "order",
 }
 
-def _validate_sections(df: pd.DataFrame, questions_df: pd.DataFrame):
+def _validate_sections(df: pd.DataFrame, questions_df: pd.DataFrame, report=None):
     missing = SECTIONS_REQUIRED_COLS - set(df.columns)
     if missing:
-        raise ExcelValidationError(
-            f"SECTIONS missing columns: {missing}"
-        )
+        _fail(report, f"SECTIONS missing columns: {missing}", "SECTIONS")
+        return
+
+    _validate_rows("SECTIONS", df, report)
 
-    if df["section_code"].duplicated().any():
-        raise ExcelValidationError(
-            "Duplicate section_code in SECTIONS"
+    for idx in _flagged(df["section_code"].duplicated()):
+        _fail(
+            report,
+            "Duplicate section_code in SECTIONS",
+            "SECTIONS", df, idx, "section_code",
         )
 
-    if df["order"].duplicated().any():
-        raise ExcelValidationError(
-            "Duplicate order in SECTIONS"
+    for idx in _flagged(df["order"].duplicated()):
+        _fail(
+            report,
+            "Duplicate order in SECTIONS",
+            "SECTIONS", df, idx, "order",
         )
 
+    if "section" not in questions_df.columns:
+        return
+
     question_sections = set(questions_df["section"].astype(str))
     declared_sections = set(df["section_code"].astype(str))
 
     orphan = question_sections - declared_sections
     if orphan:
-        raise ExcelValidationError(
-            f"Questions reference undefined sections: {orphan}"
+        _fail(
+            report,
+            f"Questions reference undefined sections: {orphan}",
+            "SECTIONS",
         )
 
 LISTS_REQUIRED_COLS = {
@@ -141,17 +203,20 @@ LISTS_REQUIRED_COLS = {
     "value",
 }
 
-def _validate_lists(df: pd.DataFrame):
+def _validate_lists(df: pd.DataFrame, report=None):
     missing = LISTS_REQUIRED_COLS - set(df.columns)
     if missing:
-        raise ExcelValidationError(
-            f"LISTS missing columns: {missing}"
-        )
+        _fail(report, f"LISTS missing columns: {missing}", "LISTS")
+        return
+
+    _validate_rows("LISTS", df, report)
 
     duplicated = df.duplicated(subset=["list_code", "value"])
-    if duplicated.any():
-        raise ExcelValidationError(
-            "Duplicate (list_code, value) in LISTS"
+    for idx in _flagged(duplicated):
+        _fail(
+            report,
+            "Duplicate (list_code, value) in LISTS",
+            "LISTS", df, idx, "value",
         )
 
 VISIBILITY_REQUIRED_COLS = {
@@ -163,75 +228,64 @@ VISIBILITY_REQUIRED_COLS = {
     "value",
 }
 
-ALLOWED_TARGETS = {"question", "section", "anomaly"}
-ALLOWED_OPERATORS = {"=", "!", ">", "<", ">=", "<=", "e", "!e"}
-ALLOWED_VALUE_TYPES = {"v", "a"}
-
-def _validate_visibility_rules(df: pd.DataFrame):
+def _validate_visibility_rules(df: pd.DataFrame, report=None):
     missing = VISIBILITY_REQUIRED_COLS - set(df.columns)
     if missing:
-        raise ExcelValidationError(
-            f"VISIBILITY_RULES missing columns: {missing}"
-        )
+        _fail(report, f"VISIBILITY_RULES missing columns: {missing}", "VISIBILITY_RULES")
+        return
 
-    for idx, row in df.iterrows():
-        if row["target_type"] not in ALLOWED_TARGETS:
-            raise ExcelValidationError(
-                f"Invalid target_type '{row['target_type']}' (row {idx})"
-            )
-
-        if row["operator"] not in ALLOWED_OPERATORS:
-            raise ExcelValidationError(
-                f"Invalid operator '{row['operator']}' (row {idx})"
-            )
-
-        if row["value_type"] not in ALLOWED_VALUE_TYPES:
-            raise ExcelValidationError(
-                f"Invalid value_type '{row['value_type']}' (row {idx})"
-            )
+    # Cibles, opérateurs et types de valeur contrôlés par VisibilityRuleRow
+    _validate_rows("VISIBILITY_RULES", df, report)
 
 ANOMALIES_REQUIRED_COLS = {
     "anomaly_code",
     "weight",
 }
 
-def _validate_anomalies(df: pd.DataFrame):
+def _validate_anomalies(df: pd.DataFrame, report=None):
     missing = ANOMALIES_REQUIRED_COLS - set(df.columns)
     if missing:
-        raise ExcelValidationError(
-            f"ANOMALIES missing columns: {missing}"
+        _fail(report, f"ANOMALIES missing columns: {missing}", "ANOMALIES")
+        return
+
+    for idx in _flagged(df["anomaly_code"].duplicated()):
+        _fail(
+            report,
+            "Duplicate anomaly_code in ANOMALIES",
+            "ANOMALIES", df, idx, "anomaly_code",
         )
 
-    if df["anomaly_code"].duplicated().any():
-        raise ExcelValidationError(
-            "Duplicate anomaly_code in ANOMALIES"
-        )
+    # Poids entier strictement positif contrôlé par AnomalyRow
+    _validate_rows("ANOMALIES", df, report)
 
-    for idx, w in df["weight"].items():
-        try:
-            if int(w) <= 0:
-                raise ValueError
-        except Exception:
-            raise ExcelValidationError(
-                f"Invalid weight at row {idx}: must be > 0"
-            )
-
-def validate_excel_structure(sheets: Dict[str, pd.DataFrame]) -> None:
+def validate_excel_structure(
+    sheets: Dict[str, pd.DataFrame],
+    report: Optional[ValidationReport] = None,
+) -> Optional[ValidationToken]:
     """
     Validation complète de la structure Excel (machine-first).
+
+    Sans `report`, la première erreur est levée et un ValidationToken
+    couvrant les feuilles est retourné. Avec `report`, toutes les
+    vérifications sont exécutées et chaque problème y est ajouté avec
+    sa feuille et sa cellule d'origine (pas de jeton).
     """
-    _validate_non_empty(sheets)
+    _validate_non_empty(sheets, report)
 
-    _validate_questions(sheets["QUESTIONS"])
-    _validate_question_types(sheets["QUESTION_TYPES"])
+    _validate_questions(sheets["QUESTIONS"], report)
+    _validate_question_types(sheets["QUESTION_TYPES"], report)
     _validate_questions_have_types(
         sheets["QUESTIONS"],
         sheets["QUESTION_TYPES"],
+        report,
     )
     _validate_sections(
         sheets["SECTIONS"],
         sheets["QUESTIONS"],
+        report,
     )
-    _validate_lists(sheets["LISTS"])
-    _validate_visibility_rules(sheets["VISIBILITY_RULES"])
-    _validate_anomalies(sheets["ANOMALIES"])
+    _validate_lists(sheets["LISTS"], report)
+    _validate_visibility_rules(sheets["VISIBILITY_RULES"], report)
+    _validate_anomalies(sheets["ANOMALIES"], report)
+
+    return ValidationToken(sheets) if report is None else None
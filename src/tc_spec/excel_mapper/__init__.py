@@ -10,6 +10,9 @@ from tc_spec.excel_mapper.areas_mapper import map_areas_to_lists
 from tc_spec.excel_mapper.lists_mapper import map_lists
 from tc_spec.excel_mapper.questions_mapper import map_questions
 from tc_spec.excel_mapper.visibility_rules_mapper import map_visibility_rules
+from tc_spec.excel_mapper.anomalies_mapper import map_anomalies
+from tc_spec.excel_mapper.back_checks_mapper import map_back_checks
+from tc_spec.excel_mapper.constraints_mapper import map_constraints
 
 __all__ = [
     "map_skus_to_lists",
@@ -17,4 +20,7 @@ __all__ = [
     "map_lists",
     "map_questions",
     "map_visibility_rules",
+    "map_anomalies",
+    "map_back_checks",
+    "map_constraints",
 ]
@@ -0,0 +1,289 @@
+"""
+Anomalies Mapper
+
+Transforme la feuille "Anomalies" en entrées ANOMALIES et en règles
+VISIBILITY_RULES (target_type "anomaly") machine-first.
+
+Format de la feuille (une anomalie = un bloc de lignes) :
+
+    ANOMALY ID | Weight | Type | QUESTION ID | CONSTRAINT | VALUE | COMPARED QUESTION
+    ANO-E      | 1      | AND  | I-50        | =          | NO    |
+               |        | AND  | I-60        | =          | YES   |
+    ANO-J      | 1      |      | V-60-'1'-1  | >          | 50    |
+               |        | OR   | V-60-'2'-1  | >          | 50    |
+
+Les conditions sont parsées avec la grammaire des règles de visibilité.
+Une anomalie sans poids est considérée comme désactivée.
+
+Un code de plage (ANO-A1..A6, "copy this 6 times") est développé en une
+anomalie par indice SKU (ANO-A1 … ANO-A6), l'indice '1' des conditions
+(V-50-'1') étant remplacé par celui de l'anomalie.
+"""
+
+from typing import Dict, Tuple
+import logging
+import re
+import pandas as pd
+
+from tc_spec.excel.provenance import (
+    SOURCE_COLUMNS,
+    SOURCE_COLUMNS_ATTR,
+    field_columns,
+    tag_source,
+)
+from tc_spec.excel_mapper.columns import ANOMALY_COLUMNS
+from tc_spec.excel_mapper.questions_utils import with_detected_header
+from tc_spec.excel_mapper.visibility_parser import parse_condition
+from tc_spec.utils.helpers import normalize_str_series
+
+logger = logging.getLogger(__name__)
+
+ANOMALY_SHEET_NAME = "Anomalies"
+ANOMALY_HEADER_NEEDLES = frozenset({"ANOMALY ID"})
+
+ANOMALIES_COLUMNS = ["anomaly_code", "weight"]
+ANOMALY_RULES_COLUMNS = [
+    "target_type",
+    "target_ref",
+    "r_ref",
+    "operator",
+    "value_type",
+    "value",
+    "or_group",
+]
+
+# "(OR" ouvre un groupe OR ; "OR" et "OR)" rejoignent la ligne précédente
+_OR_OPEN = "(OR"
+_OR_JOIN = {"OR", "OR)"}
+
+# "ANO-A1..A6" ou "ANO-A1..6"
+_RANGE_CODE_RE = re.compile(
+    r"^(?P<prefix>.*?)(?P<start>\d+)\.\.(?P<repeat>\D*)(?P<end>\d+)$"
+)
+# Indice SKU d'une cellule de matrice : V-50-'1'
+_SKU_INDEX_RE = re.compile(r"'(\d+)'")
+
+
+def _empty_result() -> Tuple[pd.DataFrame, pd.DataFrame]:
+    return (
+        pd.DataFrame(columns=ANOMALIES_COLUMNS),
+        pd.DataFrame(columns=ANOMALY_RULES_COLUMNS),
+    )
+
+
+def _or_groups(codes: pd.Series, logic: pd.Series) -> pd.Series:
+    """
+    Calcule l'identifiant de groupe OR de chaque condition (None = AND).
+    """
+    joins_prev = logic.isin(_OR_JOIN)
+    same_anomaly_next = codes.shift(-1) == codes
+    opens_next = joins_prev.shift(-1, fill_value=False) & same_anomaly_next
+
+    in_group = (logic == _OR_OPEN) | joins_prev | opens_next
+    starts_group = in_group & ~joins_prev
+
+    group_ids = starts_group.cumsum().astype(str)
+    return (codes + ":or" + group_ids).where(in_group, None)
+
+
+def _range_codes(code: str, refs: pd.Series):
+    """
+    [(code, indice)] d'un code de plage, None si le code n'en est pas un.
+    Lève ValueError si la plage ne peut pas être développée sans ambiguïté.
+    """
+    match = _RANGE_CODE_RE.match(code)
+    if not match:
+        return None
+
+    prefix, repeat = match.group("prefix"), match.group("repeat")
+    start, end = int(match.group("start")), int(match.group("end"))
+    if not prefix.endswith(repeat) or start > end:
+        raise ValueError("invalid range")
+
+    # Les conditions doivent viser le SKU du premier code de la plage
+    indexes = {i for ref in refs.dropna() for i in _SKU_INDEX_RE.findall(ref)}
+    if indexes != {str(start)}:
+        raise ValueError(f"conditions use SKU indexes {sorted(indexes)}")
+
+    return [(f"{prefix}{index}", str(index)) for index in range(start, end + 1)]
+
+
+def _expand_range_codes(
+    anomalies: pd.DataFrame,
+    conditions: pd.DataFrame,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Développe les codes de plage (une anomalie par indice SKU) ; une
+    plage ambiguë est ignorée avec un avertissement.
+    """
+    anomaly_rows, condition_blocks = [], []
+    for position, code in enumerate(anomalies["anomaly_code"]):
+        row = anomalies.iloc[[position]]
+        block = conditions[conditions["target_ref"] == code]
+        refs = pd.concat([block["question"], block["compared"]])
+        try:
+            expanded = _range_codes(code, refs)
+        except ValueError as e:
+            logger.warning(
+                "Anomalies: '%s' skipped, cannot expand range code (%s)",
+                code,
+                e,
+            )
+            continue
+
+        if expanded is None:
+            anomaly_rows.append(row)
+            condition_blocks.append(block)
+            continue
+
+        template = f"'{_RANGE_CODE_RE.match(code).group('start')}'"
+        for new_code, index in expanded:
+            def substitute(ref, index=index):
+                if not isinstance(ref, str):
+                    return ref
+                return ref.replace(template, f"'{index}'")
+
+            anomaly_rows.append(row.assign(anomaly_code=new_code))
+            condition_blocks.append(block.assign(
+                target_ref=new_code,
+                question=block["question"].map(substitute),
+                compared=block["compared"].map(substitute),
+            ))
+
+    if not anomaly_rows:
+        return anomalies.iloc[0:0], conditions.iloc[0:0]
+    return (
+        pd.concat(anomaly_rows).reset_index(drop=True),
+        pd.concat(condition_blocks).reset_index(drop=True),
+    )
+
+
+def map_anomalies(
+    sheets: Dict[str, pd.DataFrame]
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Mappe la feuille Anomalies vers (ANOMALIES, VISIBILITY_RULES anomaly:*).
+    """
+    raw_df = sheets.get(ANOMALY_SHEET_NAME)
+    if raw_df is None or raw_df.empty:
+        return _empty_result()
+
+    # In excel-mode metier, sheets are loaded with header=None.
+    df = raw_df
+    if all(isinstance(c, int) for c in df.columns):
+        df = with_detected_header(df, ANOMALY_HEADER_NEEDLES)
+
+    cols = ANOMALY_COLUMNS.resolve(df)
+    missing = {"code", "weight", "question", "operator"} - set(cols)
+    if df.empty or missing:
+        logger.warning(
+            "Anomalies: sheet '%s' ignored (missing columns: %s)",
+            ANOMALY_SHEET_NAME,
+            sorted(missing),
+        )
+        return _empty_result()
+
+    def column(field: str) -> pd.Series:
+        if field in cols:
+            return normalize_str_series(df[cols[field]])
+        return pd.Series(None, index=df.index, dtype=object)
+
+    header_codes = column("code")
+    codes = header_codes.ffill()
+
+    # Une ligne d'en-tête par anomalie ; poids vide => anomalie désactivée
+    anomalies = tag_source(pd.DataFrame({
+        "anomaly_code": header_codes,
+        "weight": df[cols["weight"]],
+    }), ANOMALY_SHEET_NAME, df.index)[header_codes.notna()]
+
+    disabled = anomalies["weight"].isna()
+    if disabled.any():
+        logger.info(
+            "Anomalies: skipping disabled anomalies (no weight): %s",
+            anomalies.loc[disabled, "anomaly_code"].tolist(),
+        )
+    anomalies = anomalies[~disabled]
+
+    # Les poids non numériques restent tels quels pour être signalés par validate_excel
+    weights = pd.to_numeric(anomalies["weight"], errors="coerce")
+    anomalies["weight"] = anomalies["weight"].mask(weights.notna(), weights)
+
+    questions = column("question")
+    conditions = tag_source(pd.DataFrame({
+        "target_ref": codes,
+        "logic": column("logic").str.upper(),
+        "question": questions,
+        "operator": column("operator"),
+        "value": column("value"),
+        "compared": column("compared_question"),
+    }), ANOMALY_SHEET_NAME, df.index)[questions.notna() & codes.notna()]
+    conditions = conditions[
+        conditions["target_ref"].isin(anomalies["anomaly_code"])
+    ].reset_index(drop=True)
+    anomalies, conditions = _expand_range_codes(anomalies, conditions)
+
+    # Comparaison à une autre réponse (t = "a") si aucune valeur fixe
+    compares_answer = conditions["value"].isna() & conditions["compared"].notna()
+    rhs = conditions["value"].where(~compares_answer, conditions["compared"])
+    texts = (
+        conditions["question"]
+        + " "
+        + conditions["operator"].fillna("")
+        + " "
+        + rhs.fillna("")
+    )
+
+    # Chaque texte de condition distinct n'est parsé qu'une fois
+    parsed_by_text = {text: parse_condition(text) for text in texts.unique()}
+    parsed = texts.map(parsed_by_text)
+    valid = parsed.map(lambda c: isinstance(c, dict) and "r" in c)
+
+    invalid_codes = set(conditions.loc[~valid, "target_ref"])
+    for code, text in zip(conditions.loc[~valid, "target_ref"], texts[~valid]):
+        logger.warning(
+            "Anomalies: '%s' skipped, unsupported condition '%s'",
+            code,
+            text,
+        )
+
+    keep = ~conditions["target_ref"].isin(invalid_codes)
+    conditions = conditions[keep]
+    parsed = parsed[keep]
+
+    rules_df = pd.DataFrame({
+        "target_type": "anomaly",
+        "target_ref": conditions["target_ref"],
+        "r_ref": parsed.map(lambda c: c["r"]),
+        "operator": parsed.map(lambda c: c["o"]),
+        "value_type": compares_answer[keep].map({True: "a", False: "v"}),
+        "value": parsed.map(lambda c: c["v"]),
+        "or_group": _or_groups(conditions["target_ref"], conditions["logic"]),
+        **{col: conditions[col] for col in SOURCE_COLUMNS},
+    }, columns=ANOMALY_RULES_COLUMNS + SOURCE_COLUMNS).reset_index(drop=True)
+
+    # Une anomalie sans règle exploitable n'est pas émise
+    anomalies = anomalies[
+        anomalies["anomaly_code"].isin(rules_df["target_ref"])
+    ].reset_index(drop=True)
+
+    logger.info(
+        "Anomalies: mapped %d anomalies with %d conditions",
+        len(anomalies),
+        len(rules_df),
+    )
+
+    anomalies = anomalies[ANOMALIES_COLUMNS + SOURCE_COLUMNS]
+    letters = field_columns(df, {
+        "anomaly_code": cols["code"],
+        "target_ref": cols["code"],
+        "weight": cols["weight"],
+        "r_ref": cols["question"],
+        "operator": cols["operator"],
+        "value": cols.get("value"),
+        "or_group": cols.get("logic"),
+    })
+    for frame in (anomalies, rules_df):
+        frame.attrs[SOURCE_COLUMNS_ATTR] = {ANOMALY_SHEET_NAME: letters}
+
+    return anomalies, rules_df
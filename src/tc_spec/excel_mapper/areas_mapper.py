@@ -10,7 +10,15 @@ import logging
 import re
 import pandas as pd
 
-from tc_spec.utils.helpers import normalize_str
+from tc_spec.excel.provenance import (
+    COLUMN_POSITIONS_ATTR,
+    SOURCE_COLUMNS_ATTR,
+    column_positions,
+    field_columns,
+    tag_source,
+)
+from tc_spec.excel_mapper.columns import area_columns
+from tc_spec.utils.helpers import normalize_str_series
 from tc_spec.utils.errors import ExcelValidationError
 
 
@@ -56,6 +64,7 @@ def _normalize_area_sheet_df(raw_df: pd.DataFrame) -> pd.DataFrame:
 
     df = raw_df.iloc[header_row + 1 :].copy()
     df.columns = header_values
+    df.attrs[COLUMN_POSITIONS_ATTR] = column_positions(header_values)
     return df.dropna(axis=1, how="all")
 
 def get_area_sheets(sheets: Dict[str, pd.DataFrame]) -> List[tuple[int, str, pd.DataFrame]]:
@@ -85,14 +94,20 @@ def map_areas_to_lists(
 ) -> pd.DataFrame:
     """
     Mappe les feuilles AREA-LV* vers une DataFrame LISTS hiérarchique.
+
+    Chaque niveau est construit par opérations colonnes ; les parents
+    sont validés par anti-jointure sur les codes du niveau précédent et
+    toutes les erreurs sont remontées en une seule exception.
     """
 
     area_sheets = get_area_sheets(sheets)
 
-    rows: List[dict] = []
+    frames: List[pd.DataFrame] = []
+    errors: List[str] = []
+    source_columns: Dict[str, Dict[str, str]] = {}
 
-    # Dictionnaire pour vérifier l'existence des parents
-    values_by_level: Dict[int, set] = {}
+    # Codes connus par niveau pour l'anti-jointure des parents
+    values_by_level: Dict[int, pd.Index] = {}
 
     for level, sheet_name, df in area_sheets:
         if df.empty:
@@ -105,19 +120,9 @@ def map_areas_to_lists(
 
         list_code = LIST_CODE_TEMPLATE.format(level=level)
 
-        # Colonnes attendues (adaptables)
-        possible_code_cols = ["ID", "Code", "AREA_CODE", "Value"]
-        possible_label_cols = ["Name -Reporting", "Label", "Name", "Description"]
-        possible_parent_cols = [
-            f"Level {level - 1} ID",
-            f"Level {level - 1}ID",
-            "Parent",
-            "PARENT_CODE",
-            "ParentCode",
-        ]
-
-        code_col = next((c for c in possible_code_cols if c in df.columns), None)
-        label_col = next((c for c in possible_label_cols if c in df.columns), None)
+        cols = area_columns(level).resolve(df)
+        code_col = cols.get("code")
+        label_col = cols.get("label")
 
         if not code_col or not label_col:
             raise ExcelValidationError(
@@ -126,10 +131,7 @@ def map_areas_to_lists(
 
         parent_col = None
         if level > 1:
-            parent_col = next(
-                (c for c in possible_parent_cols if c in df.columns),
-                None
-            )
+            parent_col = cols.get("parent")
             if not parent_col:
                 logger.warning(
                     "AREA mapping: sheet '%s' (level %d) has no parent column; skipping this level. Available columns=%s",
@@ -139,48 +141,60 @@ def map_areas_to_lists(
                 )
                 continue
 
-        order = 1
-        current_values = set()
-
-        for _, row in df.iterrows():
-            value = normalize_str(row.get(code_col))
-            label = normalize_str(row.get(label_col))
-
-            if not value or not label:
-                continue
-
-            parent = None
-            if parent_col:
-                parent = normalize_str(row.get(parent_col))
-                if not parent:
-                    raise ExcelValidationError(
-                        f"Missing parent value in {sheet_name} for '{value}'"
-                    )
+        level_df = tag_source(pd.DataFrame({
+            "value": normalize_str_series(df[code_col]),
+            "lang_SYS": normalize_str_series(df[label_col]),
+            "parent": (
+                normalize_str_series(df[parent_col])
+                if parent_col
+                else pd.Series(None, index=df.index, dtype=object)
+            ),
+        }), sheet_name, df.index)
+        source_columns[sheet_name] = field_columns(df, {
+            "list_code": code_col,
+            "value": code_col,
+            "lang_SYS": label_col,
+            "parent": parent_col,
+        })
+        level_df = level_df[
+            level_df["value"].notna() & level_df["lang_SYS"].notna()
+        ].reset_index(drop=True)
+
+        if parent_col:
+            missing_parent = level_df["parent"].isna()
+            errors.extend(
+                f"Missing parent value in {sheet_name} for '{value}'"
+                for value in level_df.loc[missing_parent, "value"]
+            )
 
-                if parent not in values_by_level.get(level - 1, set()):
-                    raise ExcelValidationError(
-                        f"Invalid parent '{parent}' for '{value}' in {sheet_name}"
-                    )
+            known_parents = values_by_level.get(level - 1, pd.Index([]))
+            invalid = level_df[
+                ~missing_parent & ~level_df["parent"].isin(known_parents)
+            ]
+            errors.extend(
+                f"Invalid parent '{parent}' for '{value}' in {sheet_name}"
+                for value, parent in zip(invalid["value"], invalid["parent"])
+            )
 
-            rows.append({
-                "list_code": list_code,
-                "value": value,
-                "order": order,
-                "lang_SYS": label,
-                "parent": parent,
-            })
+        level_df.insert(0, "list_code", list_code)
+        level_df.insert(2, "order", range(1, len(level_df) + 1))
 
-            current_values.add(value)
-            order += 1
+        values_by_level[level] = pd.Index(level_df["value"])
+        frames.append(level_df)
 
-        values_by_level[level] = current_values
+    if errors:
+        raise ExcelValidationError(
+            f"Invalid AREA hierarchy ({len(errors)} error(s)):\n"
+            + "\n".join(f"- {e}" for e in errors)
+        )
 
-    lists_df = pd.DataFrame(rows)
+    lists_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
 
     if lists_df.empty:
         raise ExcelValidationError(
             "AREA mapping produced an empty LISTS DataFrame"
         )
+    lists_df.attrs[SOURCE_COLUMNS_ATTR] = source_columns
 
     if lists_df.duplicated(subset=["list_code", "value"]).any():
         raise ExcelValidationError(
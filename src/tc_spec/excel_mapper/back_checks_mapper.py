@@ -0,0 +1,146 @@
+"""
+Back Checks Mapper
+
+Transforme la feuille "Back Checking Rules" en entrées BACK_CHECKS
+machine-first (une règle = une clé, une valeur, une portée).
+
+Format de la feuille :
+
+    Rule                                   | <valeur> | Rule In words | ...
+    Number of enumerators                  | 20-25    | ...
+    Activate Field Back checkers           | NO       | ...
+
+Une colonne "QUESTION ID" optionnelle restreint une règle à une ou
+plusieurs questions ("V-50,60") ; sans elle la règle est globale.
+Une règle sans valeur n'est pas émise.
+"""
+
+from typing import Dict, Hashable, Optional
+import logging
+import re
+import pandas as pd
+
+from tc_spec.excel_mapper.columns import (
+    BACK_CHECK_COLUMN_ALIASES,
+    BACK_CHECK_COLUMNS,
+    normalize_header_key,
+)
+from tc_spec.excel_mapper.questions_utils import (
+    parse_question_refs,
+    with_detected_header,
+)
+from tc_spec.utils.helpers import normalize_str_series
+
+logger = logging.getLogger(__name__)
+
+BACK_CHECK_SHEET_NAME = "Back Checking Rules"
+BACK_CHECK_HEADER_NEEDLES = frozenset(BACK_CHECK_COLUMN_ALIASES["rule"])
+
+BACK_CHECKS_COLUMNS = ["rule_key", "question", "value"]
+
+# Libellé métier (normalisé, sans parenthèses) -> clé courte du spec
+BACK_CHECK_RULE_KEYS = {
+    "number of enumerators": "enumerators",
+    "number of team leaders": "team_leaders",
+    "number of telephone back checkers roles": "phone_bc",
+    "number of comparator roles": "comparators",
+    "number of analyst roles": "analysts",
+    "min. percentage of enum. to backcheck for each enumerator": "min_bc_pct",
+    "anomaly threshold to flag for guaranteed backchecking": "anomaly_threshold",
+    "activate field back checkers": "field_bc",
+    "number of field back-checkers": "field_bc_count",
+    "what is the capacity of outlets per day per field bc": "field_bc_capacity",
+    "are all rejections going to team leader": "reject_to_team_leader",
+    "are all rejections going to original enumerator": "reject_to_enumerator",
+    "are all rejection going to sales reps": "reject_to_sales_rep",
+    "what devices will be used by enumerators & team leaders": "enumerator_devices",
+    "what devices will be used by sales reps": "sales_rep_devices",
+}
+
+_PARENTHESIZED_RE = re.compile(r"\([^)]*\)")
+_NON_KEY_CHARS_RE = re.compile(r"[^a-z0-9]+")
+
+_BOOLEAN_VALUES = {"YES": True, "Y": True, "NO": False, "N": False}
+
+
+def _empty_result() -> pd.DataFrame:
+    return pd.DataFrame(columns=BACK_CHECKS_COLUMNS)
+
+
+def rule_key(label: str) -> str:
+    """
+    Clé stable d'une règle : table connue, sinon libellé en snake_case.
+    """
+    normalized = normalize_header_key(_PARENTHESIZED_RE.sub(" ", label))
+    key = BACK_CHECK_RULE_KEYS.get(normalized)
+    if key is not None:
+        return key
+    return _NON_KEY_CHARS_RE.sub("_", normalized).strip("_")
+
+
+def _coerce_value(value: object) -> object:
+    # YES / NO -> bool ; les nombres restent tels que lus par Excel
+    if isinstance(value, str):
+        return _BOOLEAN_VALUES.get(value.upper(), value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _value_column(df: pd.DataFrame, cols: Dict[str, Hashable]) -> Optional[Hashable]:
+    # La colonne valeur n'a pas d'en-tête dans le template : on prend
+    # la colonne qui suit directement "Rule".
+    if "value" in cols:
+        return cols["value"]
+    position = list(df.columns).index(cols["rule"]) + 1
+    if position < len(df.columns):
+        return df.columns[position]
+    return None
+
+
+def map_back_checks(sheets: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Mappe la feuille Back Checking Rules vers une DataFrame BACK_CHECKS.
+    """
+    raw_df = sheets.get(BACK_CHECK_SHEET_NAME)
+    if raw_df is None or raw_df.empty:
+        return _empty_result()
+
+    # In excel-mode metier, sheets are loaded with header=None.
+    df = raw_df
+    if all(isinstance(c, int) for c in df.columns):
+        df = with_detected_header(df, BACK_CHECK_HEADER_NEEDLES)
+
+    cols = BACK_CHECK_COLUMNS.resolve(df)
+    value_col = _value_column(df, cols) if "rule" in cols else None
+    if df.empty or value_col is None:
+        logger.warning(
+            "Back checks: sheet '%s' ignored (no rule/value columns)",
+            BACK_CHECK_SHEET_NAME,
+        )
+        return _empty_result()
+
+    labels = normalize_str_series(df[cols["rule"]])
+    values = df[value_col]
+    keep = labels.notna() & values.notna()
+
+    if "question" in cols:
+        questions = normalize_str_series(df[cols["question"]])[keep]
+    else:
+        questions = pd.Series(None, index=labels.index, dtype=object)[keep]
+
+    back_checks = pd.DataFrame({
+        "rule_key": labels[keep].map(rule_key),
+        "question": questions.map(
+            lambda cell: [f"{sec}-{num}" for sec, num in parse_question_refs(cell)]
+            or [None]
+        ),
+        "value": values[keep].map(_coerce_value),
+    })
+
+    # Une ligne par question référencée
+    back_checks = back_checks.explode("question", ignore_index=True)
+
+    logger.info("Back checks: mapped %d rules", len(back_checks))
+
+    return back_checks[BACK_CHECKS_COLUMNS]
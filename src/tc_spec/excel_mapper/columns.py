@@ -0,0 +1,152 @@
+"""
+Column Resolver
+
+Résout les en-têtes des feuilles Excel métier vers des noms de champs
+canoniques à partir d'une table d'alias déclarative.
+
+Les en-têtes sont comparés après normalisation (casse et espaces), si
+bien qu'une seule orthographe par alias suffit : "Visible ENUMERATOR",
+"visible  enumerator" et "VISIBLE ENUMERATOR" désignent le même champ.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, Hashable, Mapping, Optional, Sequence, Tuple
+
+import pandas as pd
+
+
+def normalize_header_key(header: Hashable) -> str:
+    """
+    Clé de comparaison d'un en-tête : casse ignorée, espaces compactés.
+    """
+    return " ".join(str(header).split()).casefold()
+
+
+class ColumnResolver:
+    """
+    Table d'alias compilée : champ canonique -> colonne réelle d'une feuille.
+
+    L'ordre des alias d'un champ définit leur priorité lorsque plusieurs
+    sont présents dans la même feuille. La résolution est faite en une
+    passe sur la ligne d'en-tête puis mise en cache par en-tête.
+    """
+
+    def __init__(self, aliases: Mapping[str, Sequence[str]]):
+        self._aliases: Dict[str, Tuple[str, ...]] = {
+            field: tuple(dict.fromkeys(normalize_header_key(a) for a in names))
+            for field, names in aliases.items()
+        }
+        self._cache: Dict[Tuple[Hashable, ...], Dict[str, Hashable]] = {}
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        return tuple(self._aliases)
+
+    def resolve(self, df: pd.DataFrame) -> Dict[str, Hashable]:
+        """
+        Retourne {champ canonique: colonne} pour les champs présents.
+        """
+        header = tuple(df.columns)
+        resolved = self._cache.get(header)
+        if resolved is not None:
+            return resolved
+
+        # Première occurrence de chaque en-tête normalisé
+        by_key: Dict[str, Hashable] = {}
+        for column in header:
+            by_key.setdefault(normalize_header_key(column), column)
+
+        resolved = {}
+        for field, keys in self._aliases.items():
+            column = next((by_key[k] for k in keys if k in by_key), None)
+            if column is not None:
+                resolved[field] = column
+
+        self._cache[header] = resolved
+        return resolved
+
+    def column(self, df: pd.DataFrame, field: str) -> Optional[Hashable]:
+        return self.resolve(df).get(field)
+
+    def has(self, df: pd.DataFrame, field: str) -> bool:
+        return field in self.resolve(df)
+
+
+QUESTION_COLUMN_ALIASES = {
+    "code": ["Code", "Q_CODE", "QuestionCode", "Question", "Question #", "ID"],
+    "label": [
+        "Label",
+        "Question Label",
+        "Text",
+        "Description",
+        "Question / Action Detail",
+        "QUESTION WORDING EN",
+        "QUESTION WORDING FR",
+    ],
+    "type": ["Type", "Q_TYPE", "ANSWER TYPE"],
+    "list": ["List", "ListCode", "LIST_CODE"],
+    "answer_options": ["ANSWER OPTIONS"],
+    "roles": ["Roles", "ROLE"],
+    "visible_enumerator": ["Visible ENUMERATOR"],
+    "visible_bc": ["VISIBLE BC", "Visible BackChecker"],
+    "prefilled_bc": ["PREFILLED FOR BC", "Prefield BC"],
+    "mandatory": ["Mandatory", "Required"],
+    "priority": [
+        "Question Priority 1 Keep 0 Discuss -1 remove ?",
+        "Question Priority",
+    ],
+    "visibility": ["Visibility rule", "Visibility"],
+}
+
+SKU_COLUMN_ALIASES = {
+    "code": ["SKU", "Code", "SKU Code"],
+    "label": ["Label", "Name", "Description"],
+}
+
+LOGIC_COLUMN_ALIASES = {
+    "code": ["Code"],
+    "depends_on": ["DependsOn"],
+    "show_if_value": ["ShowIfValue"],
+}
+
+ANOMALY_COLUMN_ALIASES = {
+    "code": ["ANOMALY ID", "Anomaly Code"],
+    "weight": ["Anomaly Weight", "Weight"],
+    "logic": ["Type"],
+    "question": ["QUESTION ID"],
+    "operator": ["CONSTRAINT", "Operator"],
+    "value": ["VALUE"],
+    "compared_question": ["COMPARED QUESTION"],
+}
+
+BACK_CHECK_COLUMN_ALIASES = {
+    "rule": ["Rule"],
+    "value": ["Value"],
+    "question": ["QUESTION ID"],
+}
+
+QUESTION_COLUMNS = ColumnResolver(QUESTION_COLUMN_ALIASES)
+SKU_COLUMNS = ColumnResolver(SKU_COLUMN_ALIASES)
+LOGIC_COLUMNS = ColumnResolver(LOGIC_COLUMN_ALIASES)
+ANOMALY_COLUMNS = ColumnResolver(ANOMALY_COLUMN_ALIASES)
+BACK_CHECK_COLUMNS = ColumnResolver(BACK_CHECK_COLUMN_ALIASES)
+
+
+@lru_cache(maxsize=None)
+def area_columns(level: int) -> ColumnResolver:
+    """
+    Résolveur des feuilles AREA ; l'alias parent dépend du niveau.
+    """
+    return ColumnResolver({
+        "code": ["ID", "Code", "AREA_CODE", "Value"],
+        "label": ["Name -Reporting", "Label", "Name", "Description"],
+        "parent": [
+            f"Level {level - 1} ID",
+            f"Level {level - 1}ID",
+            "Parent",
+            "PARENT_CODE",
+            "ParentCode",
+        ],
+    })
@@ -0,0 +1,181 @@
+"""
+Constraints Mapper
+
+Transforme le catalogue de la feuille "Constraint" en bornes de
+QUESTION_TYPES (min / max / default / regex / choice_limit).
+
+Le catalogue liste les types de réponse autorisés, les contraintes
+étant portées entre parenthèses :
+
+    Answer Options
+    NUMERICAL (0 to 7)                 -> min 0, max 7
+    MULTIPLE SELECTION (min 1, max 2)  -> min 1, max 2
+    MULTIPLE SELECTION (max 3)         -> max 3
+    TEXT (regex ^[0-9]{9}$)            -> regex
+    NUMERICAL (0 to 10, default 5)     -> min 0, max 10, default 5
+
+Les valeurs sont converties en nombres quand c'est possible ; le
+builder vérifie qu'elles conviennent au type de chaque question.
+
+Les questions référencent ces types dans leur colonne ANSWER TYPE :
+la jointure se fait donc sur le type de réponse normalisé, en un seul
+merge sur QUESTION_TYPES.
+"""
+
+from typing import Dict, Optional
+import logging
+import re
+import pandas as pd
+
+from tc_spec.excel_mapper.columns import normalize_header_key
+
+logger = logging.getLogger(__name__)
+
+CONSTRAINT_SHEET_NAME = "Constraint"
+CONSTRAINT_HEADER = "Answer Options"
+
+CONSTRAINT_FIELDS = ["min", "max", "default", "regex", "choice_limit"]
+CONSTRAINTS_COLUMNS = ["answer_type_key", *CONSTRAINT_FIELDS]
+
+# "(...)" en fin de libellé ; le contenu est une liste de clauses
+_CONSTRAINT_GROUP_RE = re.compile(r"\((?P<clauses>.*)\)\s*$")
+_NUMBER = r"-?\d+(?:\.\d+)?"
+_RANGE_RE = re.compile(
+    rf"^(?P<min>{_NUMBER})\s+to\s+(?P<max>{_NUMBER})$",
+    re.IGNORECASE,
+)
+_CLAUSE_RE = re.compile(
+    r"^(?P<key>min|max|default|regex|limit)\s+(?P<value>.+)$",
+    re.IGNORECASE,
+)
+_CLAUSE_FIELDS = {
+    "min": "min",
+    "max": "max",
+    "default": "default",
+    "regex": "regex",
+    "limit": "choice_limit",
+}
+
+
+def answer_type_key(value: object) -> Optional[str]:
+    """
+    Clé de jointure d'un type de réponse (casse et espaces ignorés).
+    """
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    return normalize_header_key(value) or None
+
+
+def _number(text: str) -> object:
+    try:
+        number = float(text)
+    except ValueError:
+        return text
+    return int(number) if number.is_integer() else number
+
+
+def parse_answer_type_constraints(answer_type: str) -> Dict[str, object]:
+    """
+    Extrait les contraintes d'un libellé de type de réponse.
+    """
+    match = _CONSTRAINT_GROUP_RE.search(answer_type)
+    if not match:
+        return {}
+
+    clauses = match.group("clauses").strip()
+
+    # La regex peut contenir des virgules : elle consomme toute la parenthèse
+    regex_clause = _CLAUSE_RE.match(clauses)
+    if regex_clause and regex_clause.group("key").lower() == "regex":
+        return {"regex": regex_clause.group("value").strip()}
+
+    constraints: Dict[str, object] = {}
+    for clause in clauses.split(","):
+        clause = " ".join(clause.split())
+        if not clause:
+            continue
+
+        bounds = _RANGE_RE.match(clause)
+        if bounds:
+            constraints["min"] = _number(bounds.group("min"))
+            constraints["max"] = _number(bounds.group("max"))
+            continue
+
+        parsed = _CLAUSE_RE.match(clause)
+        if not parsed:
+            # Ex: "(allow to insert numbers)" : pas une contrainte
+            logger.debug(
+                "Constraints: clause '%s' of '%s' ignored",
+                clause,
+                answer_type,
+            )
+            continue
+
+        field = _CLAUSE_FIELDS[parsed.group("key").lower()]
+        value = parsed.group("value").strip()
+        constraints[field] = _number(value)
+
+    return constraints
+
+
+def map_constraints(sheets: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Mappe la feuille Constraint vers une DataFrame de contraintes
+    indexée par type de réponse.
+    """
+    raw_df = sheets.get(CONSTRAINT_SHEET_NAME)
+    if raw_df is None or raw_df.empty:
+        return pd.DataFrame(columns=CONSTRAINTS_COLUMNS, dtype=object)
+
+    # Le catalogue occupe la première colonne, sous l'en-tête "Answer Options"
+    answer_types = raw_df.iloc[:, 0]
+    header = answer_types.map(answer_type_key) == answer_type_key(CONSTRAINT_HEADER)
+    if header.any():
+        answer_types = answer_types[~header.cumsum().eq(0) & ~header]
+
+    records = []
+    for answer_type in answer_types.dropna().unique():
+        constraints = parse_answer_type_constraints(str(answer_type))
+        if constraints:
+            records.append({"answer_type_key": answer_type_key(answer_type), **constraints})
+
+    constraints_df = pd.DataFrame(records, columns=CONSTRAINTS_COLUMNS, dtype=object)
+    constraints_df = constraints_df.drop_duplicates(subset=["answer_type_key"])
+
+    logger.info(
+        "Constraints: %d answer types with constraints",
+        len(constraints_df),
+    )
+
+    return constraints_df.reset_index(drop=True)
+
+
+def join_constraints(
+    question_types_df: pd.DataFrame,
+    constraints_df: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    Joint les contraintes sur QUESTION_TYPES (colonne answer_type) en un
+    seul merge. Les valeurs déjà présentes sur QUESTION_TYPES priment.
+    """
+    if constraints_df.empty or "answer_type" not in question_types_df.columns:
+        return question_types_df
+
+    keys = question_types_df["answer_type"].map(answer_type_key)
+    joined = question_types_df.assign(answer_type_key=keys).merge(
+        constraints_df,
+        on="answer_type_key",
+        how="left",
+        suffixes=("", "_constraint"),
+        validate="many_to_one",
+    )
+
+    for field in CONSTRAINT_FIELDS:
+        from_constraint = f"{field}_constraint"
+        if from_constraint in joined.columns:
+            joined[field] = joined[field].where(joined[field].notna(), joined[from_constraint])
+            joined = joined.drop(columns=[from_constraint])
+
+    joined = joined.drop(columns=["answer_type_key"])
+    joined.index = question_types_df.index
+    return joined
@@ -11,11 +11,19 @@ import logging
 import pandas as pd
 
 from tc_spec.utils.errors import ExcelValidationError
+from tc_spec.excel.provenance import (
+    SOURCE_COLUMNS,
+    SOURCE_COLUMNS_ATTR,
+    SOURCE_ROW,
+    SOURCE_SHEET,
+    column_letter,
+    merge_source_columns,
+)
 from tc_spec.excel_mapper.areas_mapper import map_areas_to_lists
 from tc_spec.excel_mapper.skus_mapper import map_skus_to_lists
 from tc_spec.excel_mapper.constants_mapper import map_constants_lists
+from tc_spec.excel_mapper.columns import QUESTION_COLUMNS
 from tc_spec.excel_mapper.metier_utils import (
-    ANSWER_OPTIONS_COLS,
     answer_options_is_yes_no,
     normalize_sheet_df,
     parse_sheet_cell_ref,
@@ -54,6 +62,7 @@ def _map_dynamic_lists_from_answer_options(
 ) -> pd.DataFrame:
     rows: List[dict] = []
     seen: set[tuple[str, str]] = set()
+    source_columns: Dict[str, Dict[str, str]] = {}
 
     logger.info("Dynamic lists: scanning %d sheets for ANSWER OPTIONS", len(sheets))
 
@@ -66,7 +75,7 @@ def _map_dynamic_lists_from_answer_options(
             logger.debug("Dynamic lists: sheet '%s' ignored (empty or header not detected)", sheet_name)
             continue
 
-        answer_col = next((c for c in ANSWER_OPTIONS_COLS if c in df.columns), None)
+        answer_col = QUESTION_COLUMNS.column(df, "answer_options")
         if not answer_col:
             logger.debug("Dynamic lists: sheet '%s' has no ANSWER OPTIONS column", sheet_name)
             continue
@@ -118,6 +127,12 @@ def _map_dynamic_lists_from_answer_options(
                 target_sheet,
                 len(values),
             )
+            letter = column_letter(col)
+            source_columns[target_sheet] = {
+                "list_code": letter,
+                "value": letter,
+                "lang_SYS": letter,
+            }
             for i, v in enumerate(values, start=1):
                 key = (list_code, v)
                 if key in seen:
@@ -130,6 +145,8 @@ def _map_dynamic_lists_from_answer_options(
                         "order": i,
                         "lang_SYS": v,
                         "parent": None,
+                        SOURCE_SHEET: target_sheet,
+                        SOURCE_ROW: start_row + i,
                     }
                 )
 
@@ -139,7 +156,9 @@ def _map_dynamic_lists_from_answer_options(
         len(seen),
     )
 
-    return pd.DataFrame(rows)
+    dynamic_df = pd.DataFrame(rows)
+    dynamic_df.attrs[SOURCE_COLUMNS_ATTR] = source_columns
+    return dynamic_df
 
 def map_lists(
     sheets: Dict[str, pd.DataFrame],
@@ -219,7 +238,10 @@ def map_lists(
             f"LISTS missing required columns: {required_columns}"
         )
 
-    lists_df = lists_df[list(required_columns)]
+    lists_df = lists_df[
+        list(required_columns)
+        + [c for c in SOURCE_COLUMNS if c in lists_df.columns]
+    ]
 
     if lists_df.duplicated(subset=["list_code", "value"]).any():
         duplicates = lists_df[
@@ -245,5 +267,6 @@ def map_lists(
         by=["list_code", "order"],
         ignore_index=True,
     )
+    lists_df.attrs[SOURCE_COLUMNS_ATTR] = merge_source_columns(dfs)
 
     return lists_df
\ No newline at end of file
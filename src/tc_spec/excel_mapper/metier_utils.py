@@ -8,13 +8,6 @@ import pandas as pd
 
 QUESTION_SHEET_HEADER_NEEDLES = {"Question #", "Question / Action Detail", "ID"}
 
-ANSWER_OPTIONS_COLS = [
-    "ANSWER OPTIONS",
-    "Answer Options",
-    "Answer options",
-    "answer options",
-]
-
 _SHEET_CELL_RE = re.compile(
     r"^(?P<sheet>.+?)!\s*(?P<cell>\$?[A-Z]+\$?\d+)(?:\s*:\s*(?P<cell2>\$?[A-Z]+\$?\d+))?$"
 )
@@ -51,11 +44,15 @@ def normalize_sheet_df(raw_df: pd.DataFrame) -> pd.DataFrame:
     return df.dropna(axis=1, how="all")
 
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def answer_options_is_yes_no(value: object) -> bool:
-    if value is None or pd.isna(value):
-        return False
-    s = str(value).strip().lower()
-    s = re.sub(r"\s+", "", s)
+    if type(value) is not str:
+        if value is None or pd.isna(value):
+            return False
+        value = str(value)
+    s = _WHITESPACE_RE.sub("", value.lower())
     return s in {"yes/no", "yesno"}
 
 
@@ -10,8 +10,14 @@ from typing import Dict, List
 import logging
 import pandas as pd
 
+from tc_spec.excel.provenance import (
+    SOURCE_COLUMNS_ATTR,
+    SOURCE_ROW,
+    SOURCE_SHEET,
+    field_columns,
+)
+from tc_spec.excel_mapper.columns import QUESTION_COLUMNS
 from tc_spec.excel_mapper.metier_utils import (
-    ANSWER_OPTIONS_COLS,
     answer_options_is_yes_no,
     parse_sheet_cell_ref,
     slugify_list_code,
@@ -51,68 +57,12 @@ QUESTION_SHEETS_EXCLUDE = {
     "Obs",  # Observation/reference sheet, not a question sheet
 }
 
-QUESTION_CODE_COLS = [
-    "Code",
-    "Q_CODE",
-    "QuestionCode",
-    "Question",
-    "Question #",
-    "ID",
-]
-QUESTION_LABEL_COLS = [
-    "Label",
-    "Question Label",
-    "Text",
-    "Description",
-    "Question / Action Detail",
-    "QUESTION WORDING EN",
-    "QUESTION WORDING FR",
-]
-QUESTION_TYPE_COLS = ["Type", "Q_TYPE", "ANSWER TYPE"]
-QUESTION_LIST_COLS = ["List", "ListCode", "LIST_CODE"]
-QUESTION_ROLES_COLS = ["Roles", "ROLE"]
-QUESTION_VISIBLE_ENUMERATOR_COLS = [
-    "Visible ENUMERATOR",
-    "Visible Enumerator",
-    "VISIBLE ENUMERATOR",
-    "visible enumerator",
-]
-QUESTION_VISIBLE_BC_COLS = [
-    "VISIBLE BC",
-    "Visible BC",
-    "Visible BackChecker",
-    "visible bc",
-]
-QUESTION_PREFILLED_FOR_BC_COLS = [
-    "PREFILLED FOR BC",
-    "Prefilled for BC",
-    "Prefield BC",
-    "PREFIELD BC",
-    "prefilled for bc",
-]
-QUESTION_MANDATORY_COLS = ["Mandatory", "Required"]
-
-QUESTION_PRIORITY_COLS = [
-    "Question Priority  1 Keep 0 Discuss -1 remove ?",
-    "Question Priority 1 Keep 0 Discuss -1 remove ?",
-    "Question Priority",
-]
-
-QUESTION_VISIBILITY_COLS = [
-    "Visibility rule",
-    "Visibility",
-    "visibility rule",
-]
-
 def is_question_sheet(sheet_name: str) -> bool:
     """
     Détermine si une feuille est une feuille de questions.
     """
     return sheet_name not in QUESTION_SHEETS_EXCLUDE
 
-def _has_any_column(df: pd.DataFrame, candidates: List[str]) -> bool:
-    return any(c in df.columns for c in candidates)
-
 def map_questions(
     sheets: Dict[str, pd.DataFrame]
 ) -> pd.DataFrame:
@@ -134,6 +84,8 @@ def map_questions(
     
     # Store section visibility rules (will be added to pipeline later)
     section_visibility_rules: Dict[str, list] = {}
+    # Colonne Excel de chaque champ, par feuille (provenance des erreurs)
+    source_columns: Dict[str, Dict[str, str]] = {}
 
     for sheet_name, df in question_sheets.items():
         if df.empty:
@@ -143,70 +95,43 @@ def map_questions(
         if all(isinstance(c, int) for c in df.columns):
             df = with_detected_header(df)
 
+        cols = QUESTION_COLUMNS.resolve(df)
+
         # Skip sheets that clearly aren't question sheets (e.g. Profile)
-        if df.empty or not _has_any_column(df, QUESTION_CODE_COLS) or not _has_any_column(df, QUESTION_LABEL_COLS):
+        if df.empty or "code" not in cols or "label" not in cols:
             logger.debug("Questions: sheet '%s' ignored (not a question sheet or header not detected)", sheet_name)
             continue
 
         order = 1
-        code_col = next(
-            (c for c in QUESTION_CODE_COLS if c in df.columns),
-            None
-        )
-        label_col = next(
-            (c for c in QUESTION_LABEL_COLS if c in df.columns),
-            None
-        )
-
-        if not code_col or not label_col:
-            continue
-
-        type_col = next(
-            (c for c in QUESTION_TYPE_COLS if c in df.columns),
-            None
-        )
-        list_col = next(
-            (c for c in QUESTION_LIST_COLS if c in df.columns),
-            None
-        )
-        answer_options_col = next(
-            (c for c in ANSWER_OPTIONS_COLS if c in df.columns),
-            None
-        )
+        code_col = cols["code"]
+        label_col = cols["label"]
+        type_col = cols.get("type")
+        list_col = cols.get("list")
+        answer_options_col = cols.get("answer_options")
         if answer_options_col:
             logger.debug("Questions: sheet '%s' has ANSWER OPTIONS column '%s'", sheet_name, answer_options_col)
-        roles_col = next(
-            (c for c in QUESTION_ROLES_COLS if c in df.columns),
-            None
-        )
-        visible_enum_col = next(
-            (c for c in QUESTION_VISIBLE_ENUMERATOR_COLS if c in df.columns),
-            None
-        )
-        visible_bc_col = next(
-            (c for c in QUESTION_VISIBLE_BC_COLS if c in df.columns),
-            None
-        )
-        prefilled_bc_col = next(
-            (c for c in QUESTION_PREFILLED_FOR_BC_COLS if c in df.columns),
-            None
-        )
-        mandatory_col = next(
-            (c for c in QUESTION_MANDATORY_COLS if c in df.columns),
-            None
-        )
-
-        priority_col = next(
-            (c for c in QUESTION_PRIORITY_COLS if c in df.columns),
-            None
-        )
-        
-        visibility_col = next(
-            (c for c in QUESTION_VISIBILITY_COLS if c in df.columns),
-            None
-        )
-        
-        for _, row in df.iterrows():
+        roles_col = cols.get("roles")
+        visible_enum_col = cols.get("visible_enumerator")
+        visible_bc_col = cols.get("visible_bc")
+        prefilled_bc_col = cols.get("prefilled_bc")
+        mandatory_col = cols.get("mandatory")
+        priority_col = cols.get("priority")
+        visibility_col = cols.get("visibility")
+
+        source_columns[sheet_name] = field_columns(df, {
+            "section": code_col,
+            "q_num": code_col,
+            "label": code_col,
+            "lang_SYS": label_col,
+            "type": type_col,
+            "answer_type": type_col,
+            "list_code": list_col or answer_options_col,
+            "roles": roles_col or visible_enum_col,
+            "mandatory": mandatory_col,
+            "visibility": visibility_col,
+        })
+
+        for raw_idx, row in df.iterrows():
             if priority_col and is_removed_by_priority(row.get(priority_col)):
                 continue
 
@@ -232,7 +157,8 @@ def map_questions(
             if not refs or not text:
                 continue
 
-            q_type = map_metier_type_to_code(row.get(type_col)) if type_col else "T"
+            answer_type = normalize_str(row.get(type_col)) if type_col else None
+            q_type = map_metier_type_to_code(answer_type)
             list_code = normalize_str(row.get(list_col)) if list_col else None
 
             if not list_code and answer_options_col:
@@ -327,12 +253,15 @@ def map_questions(
                     "q_num": q_num,
                     "label": ref,
                     "type": q_type,
+                    "answer_type": answer_type,
                     "order": order,
                     "lang_SYS": text,
                     "list_code": list_code,
                     "roles": ",".join(roles) if roles else None,
                     "mandatory": "Y" if mandatory else "N",
                     "visibility": visibility_rule,
+                    SOURCE_SHEET: sheet_name,
+                    SOURCE_ROW: int(raw_idx) + 1,
                 })
 
                 order += 1
@@ -345,5 +274,6 @@ def map_questions(
     
     # Store section visibility rules as DataFrame attribute for later use
     questions_df.attrs['section_visibility_rules'] = section_visibility_rules
+    questions_df.attrs[SOURCE_COLUMNS_ATTR] = source_columns
 
     return questions_df
@@ -1,22 +1,30 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import AbstractSet, List, Optional
 
 import pandas as pd
 
+from tc_spec.excel.provenance import COLUMN_POSITIONS_ATTR, column_positions
 from tc_spec.utils.helpers import normalize_str
 
 
 def normalize_header_value(value: object) -> Optional[str]:
+    if type(value) is str:
+        return value.strip() or None
     if value is None or pd.isna(value):
         return None
     s = str(value).strip()
     return s if s else None
 
 
-def detect_header_row(raw_df: pd.DataFrame) -> Optional[int]:
+QUESTION_HEADER_NEEDLES = frozenset({"Question #", "Question / Action Detail", "ID"})
+
+
+def detect_header_row(
+    raw_df: pd.DataFrame,
+    needles: AbstractSet[str] = QUESTION_HEADER_NEEDLES,
+) -> Optional[int]:
     # Heuristic for metier files: look for a row that contains a known header label.
-    needles = {"Question #", "Question / Action Detail", "ID"}
     max_rows = min(30, len(raw_df))
     for i in range(max_rows):
         row = raw_df.iloc[i]
@@ -30,8 +38,11 @@ def detect_header_row(raw_df: pd.DataFrame) -> Optional[int]:
     return None
 
 
-def with_detected_header(raw_df: pd.DataFrame) -> pd.DataFrame:
-    header_row = detect_header_row(raw_df)
+def with_detected_header(
+    raw_df: pd.DataFrame,
+    needles: AbstractSet[str] = QUESTION_HEADER_NEEDLES,
+) -> pd.DataFrame:
+    header_row = detect_header_row(raw_df, needles)
     if header_row is None:
         return pd.DataFrame()
 
@@ -44,6 +55,9 @@ def with_detected_header(raw_df: pd.DataFrame) -> pd.DataFrame:
     df = raw_df.iloc[header_row + 1 :].copy()
     df.columns = header_values
 
+    # Position d'origine de chaque en-tête, pour la provenance des cellules
+    df.attrs[COLUMN_POSITIONS_ATTR] = column_positions(header_values)
+
     # Drop columns that are fully empty
     df = df.dropna(axis=1, how="all")
     return df
@@ -110,15 +124,20 @@ def map_metier_type_to_code(raw_type: object) -> str:
 
 
 def is_removed_by_priority(priority_value: object) -> bool:
-    if priority_value is None or pd.isna(priority_value):
+    if priority_value is None:
         return False
 
+    # Chemin rapide : cellule numérique conservée par normalize_frame
     if isinstance(priority_value, (int, float)):
         try:
             return int(priority_value) == -1
         except Exception:
+            # NaN / inf
             return False
 
+    if pd.isna(priority_value):
+        return False
+
     s = normalize_str(priority_value)
     if not s:
         return False
@@ -129,8 +148,13 @@ def is_removed_by_priority(priority_value: object) -> bool:
         return False
 
 
+_YES_VALUES = frozenset({"Y", "YES"})
+
+
 def is_yes(value: object) -> bool:
+    if type(value) is str:
+        return value.strip().upper() in _YES_VALUES
     s = normalize_str(value)
     if not s:
         return False
-    return s.strip().upper() in {"Y", "YES"}
+    return s.upper() in _YES_VALUES
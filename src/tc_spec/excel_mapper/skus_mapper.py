@@ -1,18 +1,42 @@
 """
 SKU Mapper
 
-Transforme les feuilles SKU (V70 / V80 / V90 ...)
-en entrées LISTS machine-first.
+Transforme les feuilles SKU (V70 / V80 / V90 ...) et les catalogues
+SKU (ex: "Volume & Price List") en entrées LISTS machine-first.
 """
 
 from typing import Dict, List
+import logging
+import re
 import pandas as pd
 
-from tc_spec.utils.helpers import normalize_str
+from tc_spec.excel.provenance import (
+    SOURCE_COLUMNS,
+    SOURCE_COLUMNS_ATTR,
+    field_columns,
+    merge_source_columns,
+    tag_source,
+)
+from tc_spec.excel_mapper.columns import SKU_COLUMN_ALIASES, SKU_COLUMNS
+from tc_spec.excel_mapper.questions_utils import with_detected_header
+from tc_spec.utils.helpers import normalize_str_series
 from tc_spec.utils.errors import ExcelValidationError
 
+logger = logging.getLogger(__name__)
+
 LIST_CODE_TEMPLATE = "LST-SKU-{code}"
 
+SKU_HEADER_NEEDLES = frozenset(SKU_COLUMN_ALIASES["code"])
+
+SKU_CATALOG_SHEET_PATTERN = re.compile(
+    r"(price\s*list|sku\s*list|sku\s*catalog)$",
+    re.IGNORECASE,
+)
+# Ligne d'en-tête d'un bloc catalogue : "V-60 | Tobacco | ..."
+CATALOG_BLOCK_REF_PATTERN = r"[A-Z]+-\d+"
+
+LISTS_COLUMNS = ["list_code", "value", "order", "lang_SYS", "parent"]
+
 def is_sku_sheet(sheet_name: str) -> bool:
     """
     Détecte si une feuille correspond à une feuille SKU.
@@ -25,6 +49,121 @@ def is_sku_sheet(sheet_name: str) -> bool:
         and sheet_name.endswith("SKU")
         and sheet_name.split()[0][1:].isdigit()
     )
+
+def is_sku_catalog_sheet(sheet_name: str) -> bool:
+    """
+    Détecte une feuille catalogue regroupant plusieurs listes SKU.
+    Exemples valides :
+    - Volume & Price List
+    - SKU Catalog
+    """
+    return bool(SKU_CATALOG_SHEET_PATTERN.search(sheet_name.strip()))
+
+def _to_lists_frame(
+    list_codes: pd.Series,
+    values: pd.Series,
+    labels: pd.Series,
+    sheet_name: str,
+    letters: Dict[str, str],
+) -> pd.DataFrame:
+    lists_df = tag_source(pd.DataFrame({
+        "list_code": list_codes,
+        "value": values,
+        "lang_SYS": labels,
+    }), sheet_name, values.index).reset_index(drop=True)
+    lists_df["order"] = lists_df.groupby("list_code", sort=False).cumcount() + 1
+    lists_df["parent"] = None
+    lists_df = lists_df[LISTS_COLUMNS + SOURCE_COLUMNS]
+    lists_df.attrs[SOURCE_COLUMNS_ATTR] = {sheet_name: letters}
+    return lists_df
+
+def _map_sku_sheet(sheet_name: str, df: pd.DataFrame) -> pd.DataFrame:
+    # Exemple: "V70 SKU" → V70
+    sku_code = sheet_name.split()[0]
+    list_code = LIST_CODE_TEMPLATE.format(code=sku_code)
+
+    # In excel-mode metier, sheets are loaded with header=None.
+    if all(isinstance(c, int) for c in df.columns):
+        df = with_detected_header(df, SKU_HEADER_NEEDLES)
+    if df.empty:
+        return pd.DataFrame(columns=LISTS_COLUMNS)
+
+    # Colonnes candidates (on s’adapte au réel)
+    cols = SKU_COLUMNS.resolve(df)
+    code_col = cols.get("code")
+    label_col = cols.get("label")
+
+    if not code_col or not label_col:
+        raise ExcelValidationError(
+            f"SKU sheet '{sheet_name}' must contain a code and label column"
+        )
+
+    values = normalize_str_series(df[code_col])
+    labels = normalize_str_series(df[label_col])
+
+    # lignes vides ignorées proprement
+    keep = values.notna() & labels.notna()
+
+    return _to_lists_frame(
+        pd.Series(list_code, index=values.index)[keep],
+        values[keep],
+        labels[keep],
+        sheet_name,
+        field_columns(df, {
+            "list_code": code_col,
+            "value": code_col,
+            "lang_SYS": label_col,
+        }),
+    )
+
+def _map_sku_catalog_sheet(sheet_name: str, raw_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Un catalogue est découpé en blocs, chacun ouvert par une ligne
+    d'en-tête portant la référence de question en colonne A :
+
+        V-60     | Tobacco | ... | Company | Category
+        V60SKU1  | Aspen   | ... | JTI
+        V60SKU2  | Winston | ... | JTI
+
+    Chaque bloc devient la liste LST-SKU-<ref sans tiret>.
+    """
+    if raw_df.shape[1] < 2:
+        return pd.DataFrame(columns=LISTS_COLUMNS)
+
+    values = normalize_str_series(raw_df.iloc[:, 0])
+    labels = normalize_str_series(raw_df.iloc[:, 1])
+
+    is_block_header = (
+        values.astype("string")
+        .str.fullmatch(CATALOG_BLOCK_REF_PATTERN)
+        .fillna(False)
+        .astype(bool)
+    )
+    block_ref = values.where(is_block_header).ffill()
+
+    keep = (
+        ~is_block_header
+        & block_ref.notna()
+        & values.notna()
+        & labels.notna()
+    )
+
+    list_codes = "LST-SKU-" + block_ref[keep].str.replace("-", "", regex=False)
+
+    logger.debug(
+        "SKU catalog: sheet '%s' has %d blocks",
+        sheet_name,
+        int(is_block_header.sum()),
+    )
+
+    return _to_lists_frame(
+        list_codes,
+        values[keep],
+        labels[keep],
+        sheet_name,
+        {"list_code": "A", "value": "A", "lang_SYS": "B"},
+    )
+
 def map_skus_to_lists(
     sheets: Dict[str, pd.DataFrame]
 ) -> pd.DataFrame:
@@ -34,58 +173,27 @@ def map_skus_to_lists(
     sku_sheets = {
         name: df
         for name, df in sheets.items()
-        if is_sku_sheet(name)
+        if is_sku_sheet(name) or is_sku_catalog_sheet(name)
     }
 
     if not sku_sheets:
         raise ExcelValidationError(
-            "No SKU sheets found (expected sheets like 'V70 SKU')"
+            "No SKU sheets found (expected sheets like 'V70 SKU' or 'Volume & Price List')"
         )
-    rows: List[dict] = []
+    frames: List[pd.DataFrame] = []
 
     for sheet_name, df in sku_sheets.items():
-        # Exemple: "V70 SKU" → V70
-        sku_code = sheet_name.split()[0]
-        list_code = LIST_CODE_TEMPLATE.format(code=sku_code)
         if df.empty:
             continue
 
-        # Colonnes candidates (on s’adapte au réel)
-        possible_code_cols = ["SKU", "Code", "SKU Code"]
-        possible_label_cols = ["Label", "Name", "Description"]
-
-        code_col = next(
-            (c for c in possible_code_cols if c in df.columns),
-            None
-        )
-        label_col = next(
-            (c for c in possible_label_cols if c in df.columns),
-            None
-        )
+        if is_sku_sheet(sheet_name):
+            frames.append(_map_sku_sheet(sheet_name, df))
+        else:
+            frames.append(_map_sku_catalog_sheet(sheet_name, df))
 
-        if not code_col or not label_col:
-            raise ExcelValidationError(
-                f"SKU sheet '{sheet_name}' must contain a code and label column"
-            )
-        order = 1
-
-        for _, row in df.iterrows():
-            value = normalize_str(row.get(code_col))
-            label = normalize_str(row.get(label_col))
-
-            if not value or not label:
-                continue  # lignes vides ignorées proprement
-
-            rows.append({
-                "list_code": list_code,
-                "value": value,
-                "order": order,
-                "lang_SYS": label,
-                "parent": None,
-            })
-
-            order += 1
-    lists_df = pd.DataFrame(rows)
+    frames = [f for f in frames if not f.empty]
+    lists_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    lists_df.attrs[SOURCE_COLUMNS_ATTR] = merge_source_columns(frames)
 
     if lists_df.empty:
         raise ExcelValidationError(
@@ -16,6 +16,16 @@ from typing import List, Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Référence de question, éventuellement suivie d'un spécificateur de cellule
+# de matrice : A-10, V-50-'1', V-60-'2'-1
+_REF = r"[A-Z]+-\d+(?:-'[^']*')?(?:-\d+)?"
+
+# Patterns compilés une seule fois (appelés pour chaque règle du classeur)
+_LIST_LOGIC_RE = re.compile(rf'^({_REF})\s+([!=e])-(\w+)\s+\[(.+)\]$')
+_LIST_RE = re.compile(rf'^({_REF})\s+([!=e])\s+\[(.+)\]$')
+_COMPARE_RE = re.compile(rf'^({_REF})\s*([!=<>]+)\s*(.+)$')
+_REF_PREFIX_RE = re.compile(r'^[A-Z]+-\d+')
+
 
 def parse_visibility_rule(rule: str) -> Optional[List[Dict[str, Any]]]:
     """
@@ -61,6 +71,18 @@ def parse_visibility_rule(rule: str) -> Optional[List[Dict[str, Any]]]:
         return None
 
 
+def parse_condition(condition: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse une condition atomique (sans 'or' / 'and' de premier niveau).
+
+    Utilisé lorsque les opérandes viennent de colonnes séparées
+    (ex: feuille Anomalies) et ne doivent pas être redécoupés.
+    """
+    if not condition or not isinstance(condition, str):
+        return None
+    return _parse_single_condition(condition)
+
+
 def _parse_or_conditions(rule: str) -> List[Dict[str, Any]]:
     """Parse conditions separated by 'or'."""
     parts = rule.split(' or ')
@@ -118,7 +140,7 @@ def _parse_single_condition(condition: str) -> Optional[Dict[str, Any]]:
     
     # Pattern: Q-10 OPERATOR-LOGIC ["V1", "V2", ...]
     # e.g., W-10 e-or ["WCU-1", "WCU-2"]
-    match = re.match(r'^([A-Z]+-\d+)\s+([!=e])-(\w+)\s+\[(.+)\]$', condition)
+    match = _LIST_LOGIC_RE.match(condition)
     if match:
         question_id = match.group(1)
         operator = match.group(2)
@@ -153,7 +175,7 @@ def _parse_single_condition(condition: str) -> Optional[Dict[str, Any]]:
     
     # Pattern: Q-10 e ["V1"]
     # Single value in array
-    match = re.match(r'^([A-Z]+-\d+)\s+([!=e])\s+\[(.+)\]$', condition)
+    match = _LIST_RE.match(condition)
     if match:
         question_id = match.group(1)
         operator = match.group(2)
@@ -179,7 +201,7 @@ def _parse_single_condition(condition: str) -> Optional[Dict[str, Any]]:
     
     # Pattern: Q-10 OPERATOR "VALUE" or Q-10 OPERATOR VALUE
     # e.g., I-40 = "CO-1", I-60 > 1000, I-80 = Yes
-    match = re.match(r'^([A-Z]+-\d+)\s*([!=<>]+)\s*(.+)$', condition)
+    match = _COMPARE_RE.match(condition)
     if match:
         question_id = match.group(1)
         operator = match.group(2)
@@ -199,7 +221,7 @@ def _parse_single_condition(condition: str) -> Optional[Dict[str, Any]]:
         return None
     
     # Only log warning for conditions that look like they should be valid
-    if re.match(r'^[A-Z]+-\d+', condition):
+    if _REF_PREFIX_RE.match(condition):
         logger.warning(f"Could not parse condition: {condition}")
     
     return None
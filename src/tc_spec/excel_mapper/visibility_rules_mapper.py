@@ -8,6 +8,7 @@ VISIBILITY_RULES machine-first.
 from typing import Dict, List
 import pandas as pd
 
+from tc_spec.excel_mapper.columns import LOGIC_COLUMNS
 from tc_spec.utils.helpers import normalize_str
 from tc_spec.utils.errors import ExcelValidationError
 
@@ -43,12 +44,13 @@ def map_visibility_rules(
         if df.empty:
             continue
 
-        if not {"DependsOn", "ShowIfValue"}.issubset(df.columns):
+        cols = LOGIC_COLUMNS.resolve(df)
+        if not {"depends_on", "show_if_value"}.issubset(cols):
             continue
         for _, row in df.iterrows():
-            target = normalize_str(row.get("Code"))
-            depends_on = normalize_str(row.get("DependsOn"))
-            show_value = normalize_str(row.get("ShowIfValue"))
+            target = normalize_str(row.get(cols.get("code")))
+            depends_on = normalize_str(row.get(cols["depends_on"]))
+            show_value = normalize_str(row.get(cols["show_if_value"]))
 
             if not target or not depends_on or not show_value:
                 continue
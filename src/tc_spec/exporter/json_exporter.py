@@ -8,6 +8,7 @@ def export_spec_to_json(
     spec: Spec,
     output_path: str | Path,
     pretty: bool = True,
+    fingerprint: bool = False,
 ) -> None:
     """
     Exporte un Spec TC Insight vers un fichier JSON.
@@ -15,6 +16,7 @@ def export_spec_to_json(
     :param spec: objet Spec valide
     :param output_path: chemin du fichier de sortie
     :param pretty: JSON indenté si True
+    :param fingerprint: ajoute l'empreinte du spec ("meta": {"fp": ...})
     """
 
     if not isinstance(spec, Spec):
@@ -30,6 +32,8 @@ def export_spec_to_json(
         )
     try:
         data = spec.to_dict()
+        if fingerprint:
+            data = {**data, "meta": {"fp": spec.fingerprint()}}
     except Exception as e:
         raise SpecError(
             f"Failed to serialize Spec: {e}"
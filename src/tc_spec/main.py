@@ -10,12 +10,19 @@ from tc_spec.builder import (
     build_sections,
     build_lists,
     build_anomalies,
+    build_back_checks,
 )
+from tc_spec.builder.interning import RuleInterner
 from tc_spec.model.spec import Spec
 from tc_spec.validation import (
+    validate_cross_references,
     validate_excel,
     validate_spec_schema,
 )
+from tc_spec.validation.schema_levels import (
+    DEFAULT_SAMPLE_RATE,
+    validate_spec_level,
+)
 from tc_spec.exporter import export_spec_to_json
 from tc_spec.utils.errors import SpecError
 
@@ -25,6 +32,11 @@ def generate_spec(
     schema_path: str | Path,
     excel_mode: str = "metier",  # "metier" | "machine"
     validate_only: bool = False,
+    check_references: bool = False,
+    report_path: Optional[str | Path] = None,
+    schema_validation: str = "off",
+    sample_rate: float = DEFAULT_SAMPLE_RATE,
+    fingerprint: bool = False,
 ) -> Optional[dict]:
     """
     Génère un Spec TC Insight à partir d'un fichier Excel.
@@ -33,9 +45,25 @@ def generate_spec(
     :param output_path: chemin du JSON de sortie
     :param schema_path: chemin du JSON Schema
     :param validate_only: si True, ne génère pas le fichier
+    :param check_references: si True, vérifie les références croisées
+        (règles, valeurs de liste, codes de liste)
+    :param report_path: mode rapport : toutes les étapes de validation
+        sont exécutées, les problèmes écrits dans ce fichier (JSON ou
+        CSV) avec leur cellule Excel, puis la génération échoue s'il y
+        a des erreurs
+    :param schema_validation: niveau de validation du spec généré :
+        off | structural | full | subtree | sampled (voir validation.schema_levels)
+    :param sample_rate: part des questions et listes validées en "sampled"
+    :param fingerprint: écrit l'empreinte du spec dans le JSON ("meta.fp")
     :return: spec sérialisé (dict) si validate_only=True
     """
 
+    if report_path is not None:
+        return _generate_with_report(
+            excel_path, output_path, schema_path, excel_mode,
+            validate_only, report_path, fingerprint,
+        )
+
     try:
         if excel_mode == "metier":
             raw_sheets = load_excel_all(excel_path)
@@ -47,22 +75,29 @@ def generate_spec(
                 f"Invalid excel_mode '{excel_mode}' (expected 'metier' or 'machine')"
             )
 
-        validate_excel(sheets)
-        rules = build_rules(sheets["VISIBILITY_RULES"])
+        # Jeton : lignes validées en bloc, pas de contrôle par objet
+        token = validate_excel(sheets)
+
+        # Conditions, règles et libellés partagés entre builders
+        interner = RuleInterner()
+        rules = build_rules(sheets["VISIBILITY_RULES"], interner)
 
         questions = build_questions(
             sheets["QUESTIONS"],
             sheets["QUESTION_TYPES"],
             rules,
+            interner,
+            token=token,
         )
 
         sections = build_sections(
             sheets["SECTIONS"],
             questions,
             rules,
+            interner,
         )
 
-        lists = build_lists(sheets["LISTS"])
+        lists = build_lists(sheets["LISTS"], interner, token=token)
 
         anomalies = {}
         if "ANOMALIES" in sheets and not sheets["ANOMALIES"].empty:
@@ -70,19 +105,36 @@ def generate_spec(
                 sheets["ANOMALIES"],
                 rules,
             )
+
+        back_checks = None
+        if "BACK_CHECKS" in sheets and not sheets["BACK_CHECKS"].empty:
+            back_checks = build_back_checks(sheets["BACK_CHECKS"])
+
         spec = Spec(
             name="TC Insight Spec",
             version="2.0.0",
             sections=sections,
             lists=lists,
             anomalies=anomalies,
+            back_checks=back_checks,
         )
+        if check_references:
+            validate_cross_references(spec)
+
+        validate_spec_level(
+            spec,
+            schema_path,
+            level=schema_validation,
+            sample_rate=sample_rate,
+        )
+
         if validate_only:
             return spec.to_dict()
 
         export_spec_to_json(
             spec,
             output_path,
+            fingerprint=fingerprint,
         )
 
         return None
@@ -93,3 +145,31 @@ def generate_spec(
         raise SpecError(
             f"Unexpected error during spec generation: {e}"
         ) from e
+
+
+def _generate_with_report(
+    excel_path: str | Path,
+    output_path: str | Path,
+    schema_path: str | Path,
+    excel_mode: str,
+    validate_only: bool,
+    report_path: str | Path,
+    fingerprint: bool = False,
+) -> Optional[dict]:
+    from tc_spec.reporting import collect_validation_report
+
+    report, spec = collect_validation_report(excel_path, schema_path, excel_mode)
+    report.write(report_path)
+
+    errors = report.errors
+    if errors or spec is None:
+        raise SpecError(
+            f"Validation failed with {len(errors)} error(s), "
+            f"see report '{report_path}':\n{report.summary()}"
+        )
+
+    if validate_only:
+        return spec.to_dict()
+
+    export_spec_to_json(spec, output_path, fingerprint=fingerprint)
+    return None
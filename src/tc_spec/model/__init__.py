@@ -3,6 +3,10 @@ TC Insight – Modèle métier (Spec V2)
 
 Ce module contient l'ensemble des entités métier utilisées pour
 construire un Spec TC Insight conforme au JSON Schema V2.
+
+Les entités déclarent leurs attributs dans __slots__ (pas de __dict__
+par instance) : un spec avec de grosses listes AREA / SKU crée des
+dizaines de milliers de ListItem et de Condition.
 """
 
 from tc_spec.model.spec import Spec
@@ -10,7 +14,8 @@ from tc_spec.model.section import Section
 from tc_spec.model.question import Question
 from tc_spec.model.rule import Rule, Condition
 from tc_spec.model.anomaly import Anomaly
-from tc_spec.model.list import SpecList, ListItem
+from tc_spec.model.list import ColumnarSpecList, SpecList, ListItem
+from tc_spec.model.back_check import BackCheckRules
 
 __all__ = [
     "Spec",
@@ -20,5 +25,7 @@ __all__ = [
     "Condition",
     "Anomaly",
     "SpecList",
+    "ColumnarSpecList",
     "ListItem",
+    "BackCheckRules",
 ]
@@ -1,13 +1,16 @@
 from typing import List
 
+from tc_spec.model.fingerprint import Fingerprinted
 from tc_spec.model.rule import Rule
 from tc_spec.utils.errors import SpecError
 
-class Anomaly:
+class Anomaly(Fingerprinted):
     """
     Représente une anomalie TC Insight conforme au JSON Schema V2.
     """
 
+    __slots__ = ("code", "weight", "rules")
+
     def __init__(
         self,
         code: str,
@@ -50,7 +53,9 @@ class Anomaly:
         Retourne une représentation dict conforme au JSON Schema.
         """
 
-        return {
+        if self._fragment is not None:
+            return self._fragment
+        return self._cached(lambda: {
             "w": self.weight,
             "r": [rule.to_dict() for rule in self.rules],
-        }
+        })
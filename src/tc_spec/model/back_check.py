@@ -0,0 +1,75 @@
+from typing import Dict, Optional, Union
+
+from tc_spec.model.fingerprint import Fingerprinted
+from tc_spec.utils.errors import SpecError
+
+BackCheckValue = Union[str, int, float, bool]
+
+class BackCheckRules(Fingerprinted):
+    """
+    Règles de back-check TC Insight (rôles b / bp).
+
+    Les règles globales s'appliquent à toutes les questions ; les règles
+    d'une question complètent ou surchargent les règles globales.
+    """
+
+    __slots__ = ("rules", "by_question", "_resolved")
+
+    def __init__(
+        self,
+        rules: Dict[str, BackCheckValue],
+        by_question: Optional[Dict[str, Dict[str, BackCheckValue]]] = None,
+    ):
+        self.rules = rules                      # ex: {"field_bc": False}
+        self.by_question = by_question or {}    # ex: {"V-50": {...}}
+
+        self._validate_internal()
+        self._resolved: Dict[str, Dict[str, BackCheckValue]] = {}
+
+    def _validate_internal(self):
+        scopes = [("global", self.rules)] + list(self.by_question.items())
+        for scope, rules in scopes:
+            if not isinstance(rules, dict):
+                raise SpecError(
+                    f"Back checks '{scope}': rules must be a dict"
+                )
+            for key, value in rules.items():
+                if not key or not isinstance(key, str):
+                    raise SpecError(
+                        f"Back checks '{scope}': rule key must be a non-empty string"
+                    )
+                if not isinstance(value, (str, int, float, bool)):
+                    raise SpecError(
+                        f"Back checks '{scope}': invalid value for rule '{key}'"
+                    )
+
+    def for_question(self, ref: str) -> Dict[str, BackCheckValue]:
+        """
+        Règles applicables à une question (globales + spécifiques).
+        """
+        resolved = self._resolved.get(ref)
+        if resolved is None:
+            specific = self.by_question.get(ref)
+            resolved = {**self.rules, **specific} if specific else self.rules
+            self._resolved[ref] = resolved
+        return resolved
+
+    def __bool__(self) -> bool:
+        return bool(self.rules or self.by_question)
+
+    def to_dict(self) -> dict:
+        """
+        Retourne une représentation dict conforme au JSON Schema.
+        """
+        if self._fragment is not None:
+            return self._fragment
+        return self._cached(self._build_dict)
+
+    def _build_dict(self) -> dict:
+        data = {"r": dict(self.rules)}
+        if self.by_question:
+            data["q"] = {
+                ref: dict(rules)
+                for ref, rules in self.by_question.items()
+            }
+        return data
@@ -0,0 +1,64 @@
+"""
+TC Insight – Empreintes de contenu (arbre de Merkle)
+
+Chaque nœud du modèle (question, section, liste, anomalie, spec) expose
+fingerprint() : un hash stable de sa sérialisation canonique. Les
+parents hashent les empreintes de leurs enfants et non leur contenu :
+deux specs sont égaux si leurs empreintes le sont, et un diff ne
+descend que dans les sous-arbres dont l'empreinte diffère.
+
+L'empreinte est gardée avec le fragment to_dict() qui l'a produite :
+elle n'est recalculée que pour les objets modifiés et leurs ancêtres.
+"""
+
+import hashlib
+import json
+from typing import Any
+
+from tc_spec.model.fragments import CachedFragment
+
+FINGERPRINT_SIZE = 16  # octets (32 caractères hexadécimaux)
+
+
+def content_hash(value: Any) -> str:
+    """
+    Hash blake2b de la sérialisation JSON canonique (clés triées,
+    sans espaces) d'une valeur.
+    """
+    payload = json.dumps(
+        value,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=repr,
+    )
+    return hashlib.blake2b(
+        payload.encode("utf-8"),
+        digest_size=FINGERPRINT_SIZE,
+    ).hexdigest()
+
+
+class Fingerprinted(CachedFragment):
+    """
+    Mixin : empreinte de contenu en cache, liée au fragment courant.
+    """
+
+    __slots__ = ("_digest",)
+
+    def fingerprint(self) -> str:
+        fragment = self._node_fragment()
+        cached = getattr(self, "_digest", None)
+        if cached is None or cached[0] is not fragment:
+            cached = (fragment, content_hash(self._digest_payload(fragment)))
+            self._digest = cached
+        return cached[1]
+
+    def _node_fragment(self) -> Any:
+        return self.to_dict()
+
+    def _digest_payload(self, fragment: Any) -> Any:
+        """
+        Contenu hashé : le fragment pour une feuille, les empreintes des
+        enfants (et les champs propres) pour un parent.
+        """
+        return fragment
@@ -0,0 +1,141 @@
+"""
+TC Insight – Fragments sérialisés en cache
+
+Chaque entité garde le dict produit par son to_dict() et le réutilise
+tant qu'aucun de ses champs n'a été réaffecté (le setter remet le cache
+à zéro). Un parent réutilise son fragment si les fragments de ses
+enfants sont les mêmes objets que lors de sa construction : un appel
+répété à Spec.to_dict() ne reconstruit que les objets modifiés et leurs
+ancêtres.
+
+Les fragments sont en lecture seule (FrozenDict / FrozenList, sous-classes
+de dict / list, donc sérialisables en JSON et validables tels quels) :
+un appelant ne peut pas corrompre un fragment partagé. copy.deepcopy()
+ou thaw() en donnent une copie modifiable.
+
+Les mutations en place (question.texts["EN"] = …, section.questions.append)
+ne sont pas détectées : réaffecter le champ ou appeler invalidate().
+"""
+
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is read-only (use thaw() for a copy)")
+
+
+class FrozenDict(dict):
+    """
+    dict en lecture seule.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        # copy / deepcopy / pickle : dict modifiable
+        return dict, (dict(self),)
+
+
+class FrozenList(list):
+    """
+    list en lecture seule.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+def freeze(value: Any) -> Any:
+    """
+    Copie en lecture seule des dict / list (les fragments déjà figés
+    sont réutilisés tels quels).
+    """
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Copie modifiable (dict / list natifs) d'un fragment.
+    """
+    if isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [thaw(v) for v in value]
+    return value
+
+
+def _same(one: Tuple, two: Tuple) -> bool:
+    return len(one) == len(two) and all(a is b for a, b in zip(one, two))
+
+
+# Incrémenté à chaque réaffectation d'un champ d'entité : tant qu'il n'a
+# pas bougé, un fragment parent est à jour sans parcourir ses enfants.
+_generation = 0
+
+
+class CachedFragment:
+    """
+    Mixin : fragment to_dict() en cache, invalidé par toute réaffectation
+    d'un champ public.
+    """
+
+    __slots__ = ("_fragment", "_children", "_generation")
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if not name.startswith("_"):
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        Force la reconstruction du fragment (après une mutation en place).
+        """
+        global _generation
+        _generation += 1
+        object.__setattr__(self, "_fragment", None)
+
+    def _fresh(self) -> bool:
+        """
+        True si le fragment est en cache et qu'aucune entité n'a été
+        modifiée depuis sa construction.
+        """
+        return self._fragment is not None and self._generation == _generation
+
+    def _cached(
+        self,
+        build: Callable[[], Any],
+        children: Optional[Sequence[Any]] = None,
+    ) -> Any:
+        """
+        Fragment en cache, reconstruit si invalidé ou si le fragment d'un
+        enfant a changé (children : fragments courants des enfants).
+        """
+        children = tuple(children) if children is not None else ()
+        fragment = self._fragment
+        if fragment is None or not _same(children, self._children):
+            fragment = freeze(build())
+            self._fragment = fragment
+            self._children = children
+        self._generation = _generation
+        return fragment
+
+
+def generation() -> int:
+    """
+    Compteur de modifications du modèle (pour les caches dérivés).
+    """
+    return _generation
@@ -0,0 +1,68 @@
+"""
+TC Insight – Index de recherche d'un Spec
+
+Construits une seule fois à la première requête (Spec.question,
+Spec.dependents, Spec.list_users…) puis réutilisés tant que le modèle
+n'a pas été modifié.
+"""
+
+import re
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from tc_spec.model.question import Question
+
+if TYPE_CHECKING:
+    from tc_spec.model.spec import Spec
+
+# Une référence de règle peut viser une cellule de matrice (V-50-'1'-1) :
+# elle porte sur la question V-50.
+QUESTION_REF_RE = re.compile(r"^[A-Z]+-\d+")
+
+
+def base_question_ref(ref: str) -> Optional[str]:
+    match = QUESTION_REF_RE.match(ref)
+    return match.group() if match else None
+
+
+class SpecIndex:
+    """
+    - ref -> (code de section, position dans la section)
+    - code de liste -> questions qui l'utilisent
+    - ref -> questions dont la visibilité dépend de cette question
+    """
+
+    __slots__ = ("questions", "positions", "list_users", "dependents")
+
+    def __init__(self, spec: "Spec"):
+        self.questions: Dict[str, Question] = {}
+        self.positions: Dict[str, Tuple[str, int]] = {}
+        list_users: Dict[str, List[Question]] = {}
+        dependents: Dict[str, List[Question]] = {}
+
+        for code, section in spec.sections.items():
+            for position, question in enumerate(section.questions):
+                self.questions[question.ref] = question
+                self.positions[question.ref] = (code, position)
+
+                list_code = question.qtype.get("o")
+                if isinstance(list_code, str):
+                    list_users.setdefault(list_code, []).append(question)
+
+                for ref in _rule_refs(question.visibility):
+                    users = dependents.setdefault(ref, [])
+                    if not users or users[-1] is not question:
+                        users.append(question)
+
+        self.list_users = {code: tuple(qs) for code, qs in list_users.items()}
+        self.dependents = {ref: tuple(qs) for ref, qs in dependents.items()}
+
+
+def _rule_refs(rules) -> List[str]:
+    refs = []
+    for rule in rules:
+        conditions = [rule.condition] if rule.condition is not None else rule.or_conditions
+        for condition in conditions:
+            ref = base_question_ref(condition.ref)
+            if ref is not None and ref not in refs:
+                refs.append(ref)
+    return refs
@@ -1,17 +1,40 @@
-from typing import Dict, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
+import pandas as pd
+
+from tc_spec.model.fingerprint import Fingerprinted
+from tc_spec.model.fragments import CachedFragment
+from tc_spec.model.trusted import debug_checks
 from tc_spec.utils.errors import SpecError
 
-class ListItem:
+class ListItem(CachedFragment):
     """
     Représente un élément d'une liste TC Insight.
     """
 
-    def __init__(self, value: str, labels: Dict[str, str]):
+    __slots__ = ("value", "labels", "parent")
+
+    def __init__(
+        self,
+        value: str,
+        labels: Dict[str, str],
+        parent: Optional[str] = None,
+    ):
+        self._assign(value, labels, parent)
+
+        self._validate_internal()
+
+    def _assign(self, value, labels, parent):
         self.value = value      # ex: "SEG1"
         self.labels = labels    # multilingue
+        self.parent = parent    # valeur parente (listes AREA hiérarchiques)
 
-        self._validate_internal()
+    @classmethod
+    def _trusted(cls, value, labels, parent=None) -> "ListItem":
+        # Contrôles déjà faits en bloc (voir model.trusted)
+        item = cls.__new__(cls)
+        item._assign(value, labels, parent)
+        return item
 
     def _validate_internal(self):
         if not self.value or not isinstance(self.value, str):
@@ -28,17 +51,64 @@ class ListItem:
                     f"ListItem '{self.value}': invalid label format"
                 )
 
+        if self.parent is not None and (
+            not self.parent or not isinstance(self.parent, str)
+        ):
+            raise SpecError(
+                f"ListItem '{self.value}': parent must be a non-empty string"
+            )
+
     def to_dict(self) -> dict:
-        return {
-            "v": self.value,
-            "n": self.labels
-        }
+        if self._fragment is not None:
+            return self._fragment
+        return self._cached(lambda: _item_dict(self.value, self.labels, self.parent))
+
+def _item_dict(value: str, labels: Dict[str, str], parent: Optional[str]) -> dict:
+    item = {"v": value, "n": labels}
+    if parent is not None:
+        item["p"] = parent
+    return item
+
+# Plage [début, fin) des positions des enfants d'une valeur parente
+ChildRange = Tuple[int, int]
 
-class SpecList:
+def _child_ranges(code: str, parents: Iterable[Optional[str]]) -> Dict[str, ChildRange]:
+    """
+    Index parent -> plage des enfants ; les enfants d'un même parent
+    doivent être contigus.
+    """
+    ranges: Dict[str, ChildRange] = {}
+    current, start = None, 0
+    for position, parent in enumerate(parents):
+        if parent == current:
+            continue
+        if current is not None:
+            ranges[current] = (start, position)
+        if parent is not None and parent in ranges:
+            raise SpecError(
+                f"List '{code}': children of parent '{parent}' must be contiguous"
+            )
+        current, start = parent, position
+    if current is not None:
+        ranges[current] = (start, position + 1)
+    return ranges
+
+def _validate_list_code(code: str):
+    if not code or not isinstance(code, str):
+        raise SpecError("List code must be a non-empty string")
+
+    if not code.startswith("LST-"):
+        raise SpecError(
+            f"List '{code}': code must start with 'LST-'"
+        )
+
+class SpecList(Fingerprinted):
     """
     Représente une liste TC Insight conforme au JSON Schema V2.
     """
 
+    __slots__ = ("code", "items")
+
     def __init__(self, code: str, items: List[ListItem]):
         self.code = code        # ex: "LST-SEGMENT"
         self.items = items
@@ -46,13 +116,7 @@ class SpecList:
         self._validate_internal()
 
     def _validate_internal(self):
-        if not self.code or not isinstance(self.code, str):
-            raise SpecError("List code must be a non-empty string")
-
-        if not self.code.startswith("LST-"):
-            raise SpecError(
-                f"List '{self.code}': code must start with 'LST-'"
-            )
+        _validate_list_code(self.code)
 
         if not isinstance(self.items, list) or not self.items:
             raise SpecError(
@@ -72,9 +136,248 @@ class SpecList:
                 )
 
             seen_values.add(item.value)
-            
+
+        self.children_index()
+
+    @classmethod
+    def from_validated_frame(
+        cls,
+        df: pd.DataFrame,
+        validated: bool = False,
+        intern: Callable[[Any], Any] = lambda text: text,
+    ) -> "SpecList":
+        """
+        Liste construite depuis ses lignes LISTS (list_code, value,
+        lang_*, parent éventuel), dans l'ordre du DataFrame.
+
+        `validated` : lignes couvertes par le jeton de validate_excel
+        (voir model.trusted.trusted, vérifié une fois par feuille). Les
+        items sont alors créés sans contrôle individuel : seuls les
+        libellés et parents, non couverts par validate_excel, sont
+        contrôlés en une passe. Résultat et erreurs identiques au chemin
+        contrôlé.
+        """
+        if df.empty:
+            raise SpecError("List: must contain at least one item")
+
+        code = df["list_code"].iloc[0]
+        values = [str(value) for value in df["value"]]
+
+        lang_cols = [c for c in df.columns if str(c).startswith("lang_")]
+        langs = [intern(c.replace("lang_", "")) for c in lang_cols]
+        labels = [
+            {
+                lang: intern(text)
+                for lang, text in zip(langs, texts)
+                if pd.notna(text)
+            }
+            for texts in zip(*(df[c] for c in lang_cols))
+        ] if lang_cols else [{} for _ in values]
+
+        parents = [None] * len(values)
+        if "parent" in df.columns and df["parent"].notna().any():
+            parents = [
+                intern(str(parent)) if pd.notna(parent) else None
+                for parent in df["parent"]
+            ]
+
+        rows = zip(values, labels, parents)
+        if not validated or debug_checks():
+            return cls(code, [ListItem(*row) for row in rows])
+
+        for value, item_labels, parent in zip(values, labels, parents):
+            if not item_labels:
+                raise SpecError(
+                    f"ListItem '{value}': labels must be a non-empty dict"
+                )
+            if not all(isinstance(text, str) for text in item_labels.values()):
+                raise SpecError(
+                    f"ListItem '{value}': invalid label format"
+                )
+            if parent == "":
+                # ListRow ne contrôle pas la colonne parent
+                raise SpecError(
+                    f"ListItem '{value}': parent must be a non-empty string"
+                )
+
+        _validate_list_code(code)
+        spec_list = cls.__new__(cls)
+        spec_list.code = code
+        spec_list.items = [ListItem._trusted(*row) for row in rows]
+        if len(set(values)) != len(values):
+            # Valeurs distinctes dans Excel mais égales une fois converties
+            spec_list._validate_internal()
+        spec_list.children_index()
+        return spec_list
+
+    def children_index(self) -> Dict[str, ChildRange]:
+        """
+        Valeur parente -> plage [début, fin) de ses enfants dans la liste
+        (vide pour une liste non hiérarchique).
+        """
+        return _child_ranges(self.code, (item.parent for item in self.items))
+
+    def to_list(self) -> list:
+        """
+        Retourne la liste d'items conforme au JSON Schema.
+        """
+        if self._fresh():
+            return self._fragment
+        items = [item.to_dict() for item in self.items]
+        return self._cached(lambda: items, items)
+
+    def _node_fragment(self) -> list:
+        return self.to_list()
+
+class ColumnarSpecList(Fingerprinted):
+    """
+    Liste TC Insight stockée en colonnes, pour les très grosses listes
+    (AREA, catalogues SKU) : valeurs, libellés par langue et parents en
+    tableaux parallèles, plus un index valeur -> position.
+
+    Même contrôle et même sortie to_list() que SpecList, sans un objet
+    ListItem ni un dict de libellés par valeur.
+
+    Réaffecter code / values / labels / parents relance les contrôles et
+    reconstruit l'index (la réaffectation est annulée si elle est
+    invalide) ; changer le nombre d'items demande une nouvelle liste.
+    """
+
+    __slots__ = ("code", "values", "labels", "parents", "_positions")
+
+    _CHECKED_FIELDS = frozenset({"code", "values", "labels", "parents"})
+
+    def __init__(
+        self,
+        code: str,
+        values: List[str],
+        labels: Dict[str, List[Optional[str]]],
+        parents: Optional[List[Optional[str]]] = None,
+    ):
+        self.code = code          # ex: "LST-AREA-LV4"
+        self.values = values
+        self.labels = labels      # {"SYS": [...], "EN": [...]} (None = absent)
+        self.parents = parents    # valeur parente de chaque item ou None
+
+        self._validate_internal()
+
+    def __setattr__(self, name, value):
+        if name not in self._CHECKED_FIELDS or not hasattr(self, "_positions"):
+            # Construction en cours : contrôlé une fois par __init__
+            super().__setattr__(name, value)
+            return
+
+        previous = getattr(self, name)
+        super().__setattr__(name, value)
+        try:
+            self._validate_internal()
+        except SpecError:
+            super().__setattr__(name, previous)
+            raise
+
+    def _validate_internal(self):
+        _validate_list_code(self.code)
+
+        if not isinstance(self.values, list) or not self.values:
+            raise SpecError(
+                f"List '{self.code}': must contain at least one item"
+            )
+
+        size = len(self.values)
+        columns = list(self.labels.values())
+        if self.parents is not None:
+            columns.append(self.parents)
+        if any(len(column) != size for column in columns):
+            raise SpecError(
+                f"List '{self.code}': labels and parents must have one entry per value"
+            )
+
+        positions: Dict[str, int] = {}
+        for position, value in enumerate(self.values):
+            if not value or not isinstance(value, str):
+                raise SpecError("ListItem value must be a non-empty string")
+
+            if value in positions:
+                raise SpecError(
+                    f"List '{self.code}': duplicate value '{value}'"
+                )
+            positions[value] = position
+
+        for lang, texts in self.labels.items():
+            if not isinstance(lang, str):
+                raise SpecError(f"List '{self.code}': invalid label format")
+            for position, text in enumerate(texts):
+                if text is not None and not isinstance(text, str):
+                    raise SpecError(
+                        f"ListItem '{self.values[position]}': invalid label format"
+                    )
+
+        for position in range(size):
+            if all(texts[position] is None for texts in self.labels.values()):
+                raise SpecError(
+                    f"ListItem '{self.values[position]}': labels must be a non-empty dict"
+                )
+
+        if self.parents is not None:
+            for position, parent in enumerate(self.parents):
+                if parent is not None and (not parent or not isinstance(parent, str)):
+                    raise SpecError(
+                        f"ListItem '{self.values[position]}': parent must be a non-empty string"
+                    )
+            self.children_index()
+
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, value: str) -> bool:
+        return value in self._positions
+
+    def position(self, value: str) -> Optional[int]:
+        """
+        Position d'une valeur (None si absente), en O(1).
+        """
+        return self._positions.get(value)
+
+    def item_labels(self, position: int) -> Dict[str, str]:
+        return {
+            lang: texts[position]
+            for lang, texts in self.labels.items()
+            if texts[position] is not None
+        }
+
+    def item_parent(self, position: int) -> Optional[str]:
+        return self.parents[position] if self.parents is not None else None
+
+    def children_index(self) -> Dict[str, ChildRange]:
+        """
+        Valeur parente -> plage [début, fin) de ses enfants dans la liste.
+        """
+        if self.parents is None:
+            return {}
+        return _child_ranges(self.code, self.parents)
+
+    @property
+    def items(self) -> Iterator[ListItem]:
+        """
+        Items matérialisés à la demande (compatibilité SpecList).
+        """
+        return (
+            ListItem(value, self.item_labels(position), self.item_parent(position))
+            for position, value in enumerate(self.values)
+        )
+
     def to_list(self) -> list:
         """
         Retourne la liste d'items conforme au JSON Schema.
         """
-        return [item.to_dict() for item in self.items]
+        if self._fragment is not None:
+            return self._fragment
+        return self._cached(lambda: [
+            _item_dict(value, self.item_labels(position), self.item_parent(position))
+            for position, value in enumerate(self.values)
+        ])
+
+    def _node_fragment(self) -> list:
+        return self.to_list()
@@ -1,13 +1,27 @@
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 
+from tc_spec.model.fingerprint import Fingerprinted
 from tc_spec.model.rule import Rule
+from tc_spec.model.trusted import debug_checks
 from tc_spec.utils.errors import SpecError
 
-class Question:
+class Question(Fingerprinted):
     """
     Représente une question TC Insight conforme au JSON Schema V2.
     """
 
+    ALLOWED_ROLES = {"e", "b", "bp", "u", "h"}
+
+    __slots__ = (
+        "ref",
+        "label",
+        "texts",
+        "qtype",
+        "roles",
+        "visibility",
+        "matrix",
+    )
+
     def __init__(
         self,
         ref: str,
@@ -18,31 +32,11 @@ class Question:
         visibility: Optional[List[Rule]] = None,
         matrix: Optional[dict] = None,
     ):
-        self.ref = ref                  # ex: "V-50"
-        self.label = label              # ex: "V-50 Categories"
-        self.texts = texts              # multilingue
-        self.qtype = qtype              # dict UNIQUE (1 type)
-        self.roles = roles or []        # ["e", "b"]
-        self.visibility = visibility or []
-        self.matrix = matrix            # futur (matrices)
+        self._assign(ref, label, texts, qtype, roles, visibility, matrix)
 
         self._validate_internal()
 
-class Question:
-    """
-    Représente une question TC Insight conforme au JSON Schema V2.
-    """
-
-    def __init__(
-        self,
-        ref: str,
-        label: str,
-        texts: Dict[str, str],
-        qtype: Dict[str, Any],
-        roles: Optional[List[str]] = None,
-        visibility: Optional[List[Rule]] = None,
-        matrix: Optional[dict] = None,
-    ):
+    def _assign(self, ref, label, texts, qtype, roles=None, visibility=None, matrix=None):
         self.ref = ref                  # ex: "V-50"
         self.label = label              # ex: "V-50 Categories"
         self.texts = texts              # multilingue
@@ -51,7 +45,41 @@ class Question:
         self.visibility = visibility or []
         self.matrix = matrix            # futur (matrices)
 
-        self._validate_internal()
+    @classmethod
+    def bulk_from_records(
+        cls,
+        records: Iterable[Dict[str, Any]],
+        validated: bool = False,
+    ) -> List["Question"]:
+        """
+        Questions construites depuis des enregistrements (arguments du
+        constructeur), dans l'ordre.
+
+        `validated` : lignes QUESTIONS d'origine couvertes par le jeton
+        de validate_excel (vérifié une fois par feuille). Les contrôles
+        par question sont alors sautés : seuls le libellé et les rôles,
+        non couverts par validate_excel, sont contrôlés en une passe.
+        Résultat et erreurs identiques au chemin contrôlé.
+        """
+        if not validated or debug_checks():
+            return [cls(**record) for record in records]
+
+        records = list(records)
+        for record in records:
+            if not record["label"]:
+                raise SpecError(f"Question {record['ref']}: label is required")
+            for role in record.get("roles") or ():
+                if role not in cls.ALLOWED_ROLES:
+                    raise SpecError(
+                        f"Question {record['ref']}: invalid role '{role}'"
+                    )
+
+        questions = []
+        for record in records:
+            question = cls.__new__(cls)
+            question._assign(**record)
+            questions.append(question)
+        return questions
 
     def _validate_internal(self):
         if not self.ref or not isinstance(self.ref, str):
@@ -71,16 +99,21 @@ class Question:
 
         if self.roles:
             for r in self.roles:
-                if r not in {"e", "b", "bp", "u", "h"}:
+                if r not in self.ALLOWED_ROLES:
                     raise SpecError(
                         f"Question {self.ref}: invalid role '{r}'"
                     )
                     
     def to_dict(self) -> dict:
         """
-        Retourne une représentation dict conforme au JSON Schema.
+        Retourne une représentation dict conforme au JSON Schema
+        (fragment en lecture seule, mis en cache).
         """
+        if self._fragment is not None:
+            return self._fragment
+        return self._cached(self._build_dict)
 
+    def _build_dict(self) -> dict:
         question_dict = {
             "n": self.texts,
             "label": self.label,
@@ -1,13 +1,40 @@
-from typing import Any, List, Optional
+from typing import Any, Optional, Sequence
 
+from tc_spec.model.fragments import FrozenDict, FrozenList
 from tc_spec.utils.errors import SpecError
 
-class Condition:
+def _init_frozen(obj, **attrs) -> None:
+    for name, value in attrs.items():
+        object.__setattr__(obj, name, value)
+    object.__setattr__(obj, "_fragment", None)
+
+
+class _Frozen:
+    # Immuable : le fragment to_dict() est construit une seule fois
+    __slots__ = ("_fragment",)
+
+    def _cache(self, fragment):
+        object.__setattr__(self, "_fragment", fragment)
+        return fragment
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+
+class Condition(_Frozen):
     """
     Condition atomique d'une règle TC Insight.
     Conforme au JSON Schema V2.
+
+    Immuable : une même instance peut être partagée entre plusieurs
+    règles (voir builder.interning).
     """
 
+    __slots__ = ("ref", "operator", "value_type", "value")
+
     ALLOWED_OPERATORS = {"=", "!", ">", "<", ">=", "<=", "e", "!e"}
     ALLOWED_VALUE_TYPES = {"v", "a"}
 
@@ -18,10 +45,13 @@ class Condition:
         value_type: str,
         value: Any,
     ):
-        self.ref = ref
-        self.operator = operator
-        self.value_type = value_type
-        self.value = value
+        _init_frozen(
+            self,
+            ref=ref,
+            operator=operator,
+            value_type=value_type,
+            value=value,
+        )
 
         self._validate_internal()
 
@@ -40,28 +70,36 @@ class Condition:
             )
 
     def to_dict(self) -> dict:
-        return {
+        if self._fragment is not None:
+            return self._fragment
+        return self._cache(FrozenDict({
             "r": self.ref,
             "o": self.operator,
             "t": self.value_type,
             "v": self.value,
-        }
+        }))
 
-class Rule:
+class Rule(_Frozen):
     """
     Représente une règle logique TC Insight.
     Peut être :
     - une condition simple
     - un OR de conditions
+
+    Immuable, comme Condition : les conditions du OR sont gardées en
+    tuple.
     """
 
+    __slots__ = ("condition", "or_conditions")
+
     def __init__(
         self,
         condition: Optional[Condition] = None,
-        or_conditions: Optional[List[Condition]] = None,
+        or_conditions: Optional[Sequence[Condition]] = None,
     ):
-        self.condition = condition
-        self.or_conditions = or_conditions
+        if isinstance(or_conditions, list):
+            or_conditions = tuple(or_conditions)
+        _init_frozen(self, condition=condition, or_conditions=or_conditions)
 
         self._validate_internal()
 
@@ -77,7 +115,7 @@ class Rule:
             )
 
         if self.or_conditions:
-            if not isinstance(self.or_conditions, list) or not self.or_conditions:
+            if not isinstance(self.or_conditions, tuple) or not self.or_conditions:
                 raise SpecError("OR rule must contain at least one condition")
 
             for cond in self.or_conditions:
@@ -85,9 +123,12 @@ class Rule:
                     raise SpecError("OR rule must contain Condition objects only")
                     
     def to_dict(self) -> dict:
+        if self._fragment is not None:
+            return self._fragment
+
         if self.condition:
-            return self.condition.to_dict()
+            return self._cache(self.condition.to_dict())
 
-        return {
-            "or": [cond.to_dict() for cond in self.or_conditions]
-        }
+        return self._cache(FrozenDict({
+            "or": FrozenList(cond.to_dict() for cond in self.or_conditions)
+        }))
@@ -1,14 +1,17 @@
 from typing import List, Optional, Dict
 
+from tc_spec.model.fingerprint import Fingerprinted
 from tc_spec.model.question import Question
 from tc_spec.model.rule import Rule
 from tc_spec.utils.errors import SpecError
 
-class Section:
+class Section(Fingerprinted):
     """
     Représente une section TC Insight conforme au JSON Schema V2.
     """
 
+    __slots__ = ("code", "name", "questions", "visibility")
+
     def __init__(
         self,
         code: str,
@@ -52,9 +55,15 @@ class Section:
 
     def to_dict(self) -> Dict:
         """
-        Retourne une représentation dict conforme au JSON Schema.
+        Retourne une représentation dict conforme au JSON Schema
+        (fragment en lecture seule, reconstruit si une question a changé).
         """
+        if self._fresh():
+            return self._fragment
+        questions = [question.to_dict() for question in self.questions]
+        return self._cached(lambda: self._build_dict(questions), questions)
 
+    def _build_dict(self, questions: List[dict]) -> Dict:
         section_dict = {
             "n": self.name,
             "p": []
@@ -65,9 +74,20 @@ class Section:
                 rule.to_dict() for rule in self.visibility
             ]
 
-        for question in self.questions:
+        for question, fragment in zip(self.questions, questions):
             section_dict["p"].append({
-                question.ref.split("-")[-1]: question.to_dict()
+                question.ref.split("-")[-1]: fragment
             })
 
         return section_dict
+
+    def _digest_payload(self, fragment: Dict) -> Dict:
+        # Empreintes des questions plutôt que leur contenu
+        return {
+            "n": fragment["n"],
+            "v": fragment.get("v"),
+            "p": [
+                [question.ref.split("-")[-1], question.fingerprint()]
+                for question in self.questions
+            ],
+        }
@@ -1,14 +1,30 @@
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from tc_spec.model.fingerprint import Fingerprinted, content_hash
+from tc_spec.model.fragments import generation
+from tc_spec.model.index import SpecIndex, base_question_ref
+from tc_spec.model.question import Question
 from tc_spec.model.section import Section
 from tc_spec.model.anomaly import Anomaly
+from tc_spec.model.back_check import BackCheckRules
 from tc_spec.utils.errors import SpecError
 
-class Spec:
+class Spec(Fingerprinted):
     """
     Représente un Spec TC Insight V2 conforme au JSON Schema officiel.
     """
 
+    __slots__ = (
+        "name",
+        "version",
+        "sections",
+        "lists",
+        "anomalies",
+        "notes",
+        "back_checks",
+        "_index",
+    )
+
     def __init__(
         self,
         name: str,
@@ -17,6 +33,7 @@ class Spec:
         lists: Optional[dict] = None,
         anomalies: Optional[Dict[str, Anomaly]] = None,
         notes: Optional[List[str]] = None,
+        back_checks: Optional[BackCheckRules] = None,
     ):
         self.name = name
         self.version = version
@@ -24,6 +41,7 @@ class Spec:
         self.lists = lists or {}
         self.anomalies = anomalies or {}
         self.notes = notes or []
+        self.back_checks = back_checks
 
         self._validate_internal()
 
@@ -43,42 +61,194 @@ class Spec:
                     f"Section code mismatch: key '{code}' != section.code '{section.code}'"
                 )
                 
+    def _lookup(self) -> SpecIndex:
+        """
+        Index construit à la première requête, reconstruit seulement si
+        le modèle a été modifié depuis.
+        """
+        cached = getattr(self, "_index", None)
+        if cached is None or cached[0] != generation():
+            cached = (generation(), SpecIndex(self))
+            self._index = cached
+        return cached[1]
+
+    def question(self, ref: str) -> Optional[Question]:
+        """
+        Question par ref (une cellule de matrice V-50-'1'-1 désigne V-50).
+        """
+        index = self._lookup()
+        question = index.questions.get(ref)
+        if question is None:
+            base = base_question_ref(ref)
+            question = index.questions.get(base) if base else None
+        return question
+
+    def question_position(self, ref: str) -> Optional[Tuple[str, int]]:
+        """
+        (code de section, position dans la section) d'une question.
+        """
+        return self._lookup().positions.get(ref)
+
+    def dependents(self, ref: str) -> Tuple[Question, ...]:
+        """
+        Questions dont la visibilité dépend de la question `ref`.
+        """
+        return self._lookup().dependents.get(ref, ())
+
+    def list_users(self, code: str) -> Tuple[Question, ...]:
+        """
+        Questions dont le type référence la liste `code`.
+        """
+        return self._lookup().list_users.get(code, ())
+
+    def iter_questions(self):
+        return iter(self._lookup().questions.values())
+
     def to_dict(self) -> dict:
         """
         Retourne une représentation dict strictement conforme
         au JSON Schema spec_v2.schema.json
+
+        Fragment en lecture seule : seuls les objets modifiés depuis
+        l'appel précédent (et leurs parents) sont resérialisés.
         """
+        if self._fresh():
+            return self._fragment
+
+        sections = {
+            code: section.to_dict()
+            for code, section in self.sections.items()
+        }
+        lists = {
+            code: (
+                lst.to_list()
+                if hasattr(lst, "to_list")
+                else lst
+            )
+            for code, lst in self.lists.items()
+        }
+        anomalies = {
+            code: anomaly.to_dict()
+            for code, anomaly in self.anomalies.items()
+        }
+        back_checks = self.back_checks.to_dict() if self.back_checks else None
 
+        children = [
+            *sections.values(),
+            *lists.values(),
+            *anomalies.values(),
+            back_checks,
+        ]
+        return self._cached(
+            lambda: self._build_dict(sections, lists, anomalies, back_checks),
+            children,
+        )
+
+    def _build_dict(self, sections, lists, anomalies, back_checks) -> dict:
         spec_dict = {
             "n": self.name,
             "v": self.version,
-            "s": {
-                code: section.to_dict()
-                for code, section in self.sections.items()
-            }
+            "s": sections,
         }
 
         if self.notes:
             spec_dict["notes"] = self.notes
 
-        if self.lists:
-            spec_dict["l"] = {
-                code: (
-                    lst.to_list()
-                    if hasattr(lst, "to_list")
-                    else lst
-                )
-                for code, lst in self.lists.items()
-            }
+        if lists:
+            spec_dict["l"] = lists
+
+        list_children = self._list_children()
+        if list_children:
+            spec_dict["lc"] = list_children
 
-        if self.anomalies:
-            spec_dict["a"] = {
-                code: anomaly.to_dict()
-                for code, anomaly in self.anomalies.items()
-            }
+        if anomalies:
+            spec_dict["a"] = anomalies
+
+        if back_checks is not None:
+            spec_dict["bc"] = back_checks
 
         return spec_dict
 
+    def _list_children(self) -> dict:
+        """
+        Index des listes hiérarchiques : {liste: {parent: [début, fin)}}.
+        Les enfants d'un parent sont contigus, un terminal lit
+        directement la plage (sélecteurs en cascade en O(enfants)).
+        """
+        list_children = {}
+        for code, lst in self.lists.items():
+            if not hasattr(lst, "children_index"):
+                continue
+            ranges = lst.children_index()
+            if ranges:
+                list_children[code] = {
+                    parent: [start, end]
+                    for parent, (start, end) in ranges.items()
+                }
+        return list_children
+
+    def _digest_payload(self, fragment: dict) -> dict:
+        # Empreintes des enfants ; "lc" découle des listes
+        return {
+            "n": self.name,
+            "v": self.version,
+            "notes": fragment.get("notes"),
+            "s": _fingerprints(self.sections),
+            "l": _fingerprints(self.lists),
+            "a": _fingerprints(self.anomalies),
+            "bc": self.back_checks.fingerprint() if self.back_checks else None,
+        }
+
+    def changed_nodes(self, other: "Spec") -> List[str]:
+        """
+        Chemins des nœuds qui diffèrent de `other` ("n", "s/V",
+        "s/V/V-50", "l/LST-A", "a/ANO-1", "bc"...). Seuls les sous-arbres
+        dont l'empreinte diffère sont parcourus.
+        """
+        if self.fingerprint() == other.fingerprint():
+            return []
+
+        changed = [
+            key
+            for key, mine, theirs in (
+                ("n", self.name, other.name),
+                ("v", self.version, other.version),
+                ("notes", self.notes, other.notes),
+            )
+            if mine != theirs
+        ]
+
+        sections = _fingerprints(self.sections)
+        other_sections = _fingerprints(other.sections)
+        for code in _changed_keys(sections, other_sections):
+            changed.append(f"s/{code}")
+            if code in self.sections and code in other.sections:
+                questions = _fingerprints({
+                    q.ref: q for q in self.sections[code].questions
+                })
+                other_questions = _fingerprints({
+                    q.ref: q for q in other.sections[code].questions
+                })
+                changed.extend(
+                    f"s/{code}/{ref}"
+                    for ref in _changed_keys(questions, other_questions)
+                )
+
+        for key, mine, theirs in (
+            ("l", self.lists, other.lists),
+            ("a", self.anomalies, other.anomalies),
+        ):
+            changed.extend(
+                f"{key}/{code}"
+                for code in _changed_keys(_fingerprints(mine), _fingerprints(theirs))
+            )
+
+        back_checks = _fingerprints({"bc": self.back_checks})
+        other_back_checks = _fingerprints({"bc": other.back_checks})
+        changed.extend(_changed_keys(back_checks, other_back_checks))
+
+        return changed
+
     def validate_against_schema(self, schema: dict):
         """
         Valide le spec courant contre un JSON Schema donné.
@@ -89,3 +259,26 @@ class Spec:
             validate(instance=self.to_dict(), schema=schema)
         except ValidationError as e:
             raise SpecError(f"Schema validation failed: {e.message}") from e
+
+
+def _fingerprints(nodes: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """
+    Empreinte de chaque nœud (listes brutes : hash de leur contenu).
+    """
+    return {
+        key: (
+            node.fingerprint()
+            if hasattr(node, "fingerprint")
+            else None if node is None else content_hash(node)
+        )
+        for key, node in nodes.items()
+    }
+
+
+def _changed_keys(mine: Dict[str, Any], theirs: Dict[str, Any]) -> List[str]:
+    """
+    Clés ajoutées, supprimées ou dont la valeur diffère (ordre de `mine`,
+    puis clés propres à `theirs`).
+    """
+    keys = list(mine) + [key for key in theirs if key not in mine]
+    return [key for key in keys if mine.get(key) != theirs.get(key)]
@@ -0,0 +1,60 @@
+"""
+TC Insight – Construction en masse de confiance
+
+validate_excel contrôle déjà les feuilles machine-first en bloc (lignes
+pydantic, doublons, libellés). Les builders vérifient le jeton qu'il
+retourne une fois par feuille (trusted) ; si la feuille est couverte,
+les constructeurs en masse (SpecList.from_validated_frame,
+Question.bulk_from_records) ne relancent pas _validate_internal objet
+par objet. Seuls les contrôles non couverts par validate_excel restent
+faits, en une passe sur le bloc.
+
+TC_SPEC_DEBUG_CHECKS=1 réactive les contrôles par objet (même résultat
+que le chemin contrôlé, erreurs comprises).
+"""
+
+import os
+from typing import Dict, Optional
+
+import pandas as pd
+
+DEBUG_CHECKS_ENV = "TC_SPEC_DEBUG_CHECKS"
+
+
+def debug_checks() -> bool:
+    return os.getenv(DEBUG_CHECKS_ENV, "").strip().lower() in {"1", "true", "yes"}
+
+
+class ValidationToken:
+    """
+    Preuve qu'un ensemble de feuilles a passé la validation en bloc.
+    Émis par validate_excel (mode fail fast) ; lié aux DataFrame validés
+    eux-mêmes (identité, coût nul) : une copie, une sous-table ou un
+    autre DataFrame n'est pas couvert. Les feuilles ne doivent pas être
+    modifiées en place entre validate_excel et les builders.
+    """
+
+    __slots__ = ("_sheets",)
+
+    def __init__(self, sheets: Dict[str, pd.DataFrame]):
+        self._sheets = dict(sheets)
+
+    def covers(self, sheet: str, df: pd.DataFrame) -> bool:
+        """
+        True si `df` est la feuille validée.
+        """
+        return self._sheets.get(sheet) is df
+
+
+def trusted(
+    token: Optional[ValidationToken],
+    sheet: str,
+    df: Optional[pd.DataFrame],
+) -> bool:
+    """
+    Les contrôles par objet de la feuille `df` peuvent-ils être sautés ?
+    À vérifier une fois par feuille, avant de la découper.
+    """
+    if token is None or df is None or debug_checks():
+        return False
+    return token.covers(sheet, df)
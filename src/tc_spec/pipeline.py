@@ -9,11 +9,17 @@ from typing import Dict
 import pandas as pd
 
 from tc_spec.excel_mapper import (
+    map_anomalies,
+    map_back_checks,
+    map_constraints,
     map_lists,
     map_questions,
     map_visibility_rules,
 )
+from tc_spec.excel.provenance import SOURCE_COLUMNS, SOURCE_COLUMNS_ATTR
+from tc_spec.excel_mapper.constraints_mapper import join_constraints
 from tc_spec.utils.errors import ExcelValidationError
+from tc_spec.utils.helpers import normalize_frame
 
 def map_excel_to_machine_first(
     sheets: Dict[str, pd.DataFrame]
@@ -25,6 +31,13 @@ def map_excel_to_machine_first(
     :return: dictionnaire normalisé prêt pour le générateur
     """
 
+    # Normalisation des cellules une seule fois par feuille
+    # (espaces, vides/NaN -> None) avant tous les mappers.
+    sheets = {
+        name: normalize_frame(df)
+        for name, df in sheets.items()
+    }
+
     lists_df = map_lists(sheets)
 
     if lists_df.empty:
@@ -46,9 +59,16 @@ def map_excel_to_machine_first(
 
     # Include list_code and other type-related columns for question types
     type_cols = ["section", "q_num", "type"]
-    if "list_code" in questions_df.columns:
-        type_cols.append("list_code")
-    question_types_df = questions_df[type_cols].copy()
+    for optional_col in ("list_code", "answer_type", *SOURCE_COLUMNS):
+        if optional_col in questions_df.columns:
+            type_cols.append(optional_col)
+    question_types_df = join_constraints(
+        questions_df[type_cols].copy(),
+        map_constraints(sheets),
+    )
+    question_types_df.attrs[SOURCE_COLUMNS_ATTR] = questions_df.attrs.get(
+        SOURCE_COLUMNS_ATTR, {}
+    )
 
     if "section" not in questions_df.columns:
         raise ExcelValidationError(
@@ -62,6 +82,7 @@ def map_excel_to_machine_first(
     # Build a mapping from section codes to the sheets that generated them
     # by checking which sheets actually contain questions for each section
     from tc_spec.excel_mapper.questions_mapper import QUESTION_SHEETS_EXCLUDE
+    from tc_spec.excel_mapper.columns import QUESTION_COLUMNS
     from tc_spec.excel_mapper.metier_utils import normalize_sheet_df
     from tc_spec.excel_mapper.questions_utils import parse_question_refs
     
@@ -103,8 +124,7 @@ def map_excel_to_machine_first(
                 continue
             
             # Look for question codes in the ID/Code column specifically
-            code_cols = ["Code", "Q_CODE", "QuestionCode", "Question", "Question #", "ID"]
-            code_col = next((c for c in code_cols if c in df.columns), None)
+            code_col = QUESTION_COLUMNS.column(df, "code")
             
             if code_col:
                 # Check if this sheet contains any of the sample question codes in the code column
@@ -156,13 +176,24 @@ def map_excel_to_machine_first(
     # Store section visibility rules in sections_df attributes
     sections_df.attrs['section_visibility_rules'] = section_visibility_by_code
 
-    anomalies_df = pd.DataFrame(columns=["anomaly_code", "weight"])
+    anomalies_df, anomaly_rules_df = map_anomalies(sheets)
+    if not anomaly_rules_df.empty:
+        rules_df = pd.concat([rules_df, anomaly_rules_df], ignore_index=True)
+        rules_df.attrs = dict(anomaly_rules_df.attrs)
+
+    back_checks_df = map_back_checks(sheets)
 
-    return {
+    mapped = {
         "QUESTIONS": questions_df.reset_index(drop=True),
         "QUESTION_TYPES": question_types_df.reset_index(drop=True),
         "SECTIONS": sections_df.reset_index(drop=True),
         "LISTS": lists_df.reset_index(drop=True),
         "VISIBILITY_RULES": rules_df.reset_index(drop=True),
         "ANOMALIES": anomalies_df,
+        "BACK_CHECKS": back_checks_df,
     }
+    # Feuilles issues du mapping : provenance (éventuellement vide)
+    # à la place des coordonnées machine-first
+    for df in mapped.values():
+        df.attrs.setdefault(SOURCE_COLUMNS_ATTR, {})
+    return mapped
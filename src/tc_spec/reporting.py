@@ -0,0 +1,205 @@
+"""
+TC Insight – Mode rapport
+
+Exécute toutes les étapes de validation sans s'arrêter à la première
+erreur : structure Excel, construction du modèle, références croisées
+et JSON Schema. Chaque problème est rattaché à sa feuille et à sa
+cellule A1 d'origine (provenance suivie depuis load_excel_all à travers
+les mappers), pour corriger un modèle en un seul aller-retour.
+
+Seules les erreurs qui empêchent de poursuivre (fichier illisible,
+mapping impossible, constructeur dont dépendent les suivants) arrêtent
+la collecte ; elles figurent aussi dans le rapport.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+from tc_spec.builder import (
+    build_anomalies,
+    build_back_checks,
+    build_lists,
+    build_questions,
+    build_rules,
+    build_sections,
+)
+from tc_spec.builder.interning import RuleInterner
+from tc_spec.excel import load_excel, load_excel_all
+from tc_spec.excel.provenance import find_source_cell
+from tc_spec.model.spec import Spec
+from tc_spec.pipeline import map_excel_to_machine_first
+from tc_spec.utils.errors import SpecError
+from tc_spec.utils.report import ValidationReport
+from tc_spec.validation import validate_excel
+from tc_spec.validation.cross_references import iter_cross_reference_issues
+from tc_spec.validation.schema_validation import iter_schema_errors
+
+logger = logging.getLogger(__name__)
+
+# Clé d'entrée dans le spec ("t", "n"…) -> champ QUESTIONS d'origine
+_QUESTION_FIELDS = {
+    "n": "lang_SYS",
+    "label": "label",
+    "t": "type",
+    "o": "roles",
+    "v": "visibility",
+}
+
+# Propriétaire d'une référence croisée -> (feuille, colonne clé)
+_OWNER_SHEETS = {
+    "question": ("QUESTIONS", "label"),
+    "section": ("SECTIONS", "section_code"),
+    "anomaly": ("ANOMALIES", "anomaly_code"),
+}
+
+
+def _stage(
+    report: ValidationReport,
+    stage: str,
+    func: Callable[..., Any],
+    *args,
+    **kwargs,
+) -> Optional[Any]:
+    """
+    Exécute une étape ; une erreur est ajoutée au rapport (résultat None).
+    """
+    try:
+        return func(*args, **kwargs)
+    except SpecError as e:
+        report.add(stage, str(e))
+    except Exception as e:
+        report.add(stage, f"Unexpected error: {e}")
+    return None
+
+
+def _load_sheets(
+    report: ValidationReport,
+    excel_path: str | Path,
+    excel_mode: str,
+) -> Optional[Dict[str, pd.DataFrame]]:
+    if excel_mode == "metier":
+        raw_sheets = _stage(report, "load", load_excel_all, excel_path)
+        if raw_sheets is None:
+            return None
+        return _stage(report, "mapping", map_excel_to_machine_first, raw_sheets)
+    if excel_mode == "machine":
+        return _stage(report, "load", load_excel, excel_path)
+    report.add(
+        "load",
+        f"Invalid excel_mode '{excel_mode}' (expected 'metier' or 'machine')",
+    )
+    return None
+
+
+def _build_spec(
+    report: ValidationReport,
+    sheets: Dict[str, pd.DataFrame],
+) -> Optional[Spec]:
+    interner = RuleInterner()
+    rules = _stage(report, "build", build_rules, sheets["VISIBILITY_RULES"], interner)
+    lists = _stage(report, "build", build_lists, sheets["LISTS"], interner)
+
+    sections = None
+    anomalies: Optional[dict] = {}
+    if rules is not None:
+        questions = _stage(
+            report, "build", build_questions,
+            sheets["QUESTIONS"], sheets["QUESTION_TYPES"], rules, interner,
+        )
+        if questions is not None:
+            sections = _stage(
+                report, "build", build_sections,
+                sheets["SECTIONS"], questions, rules, interner,
+            )
+        if "ANOMALIES" in sheets and not sheets["ANOMALIES"].empty:
+            anomalies = _stage(
+                report, "build", build_anomalies,
+                sheets["ANOMALIES"], rules,
+            )
+
+    back_checks = None
+    if "BACK_CHECKS" in sheets and not sheets["BACK_CHECKS"].empty:
+        back_checks = _stage(report, "build", build_back_checks, sheets["BACK_CHECKS"])
+
+    if sections is None or lists is None or anomalies is None:
+        return None
+
+    return _stage(
+        report, "build", Spec,
+        name="TC Insight Spec",
+        version="2.0.0",
+        sections=sections,
+        lists=lists,
+        anomalies=anomalies,
+        back_checks=back_checks,
+    )
+
+
+def _check_cross_references(
+    report: ValidationReport,
+    sheets: Dict[str, pd.DataFrame],
+    spec: Spec,
+) -> None:
+    for kind, code, field, problem in iter_cross_reference_issues(spec):
+        sheet, key_column = _OWNER_SHEETS[kind]
+        source_sheet, cell = find_source_cell(
+            sheets[sheet], sheet, key_column, code, field,
+        )
+        report.add("references", f"{kind} '{code}': {problem}", source_sheet, cell)
+
+
+def _check_schema(
+    report: ValidationReport,
+    sheets: Dict[str, pd.DataFrame],
+    spec: Spec,
+    schema_path: str | Path,
+) -> None:
+    errors = _stage(report, "schema", iter_schema_errors, spec.to_dict(), schema_path)
+    for error_path, message in errors or []:
+        path = ".".join(str(p) for p in error_path)
+        sheet, cell = None, None
+
+        # s.<section>.p.<i>.<numéro>.<clé>… -> question d'origine
+        if len(error_path) >= 5 and error_path[0] == "s" and error_path[2] == "p":
+            ref = f"{error_path[1]}-{error_path[4]}"
+            field = _QUESTION_FIELDS.get(error_path[5]) if len(error_path) > 5 else None
+            sheet, cell = find_source_cell(
+                sheets["QUESTIONS"], "QUESTIONS", "label", ref, field,
+            )
+
+        report.add(
+            "schema",
+            f"at '{path}': {message}" if path else f"at root: {message}",
+            sheet,
+            cell,
+        )
+
+
+def collect_validation_report(
+    excel_path: str | Path,
+    schema_path: str | Path,
+    excel_mode: str = "metier",
+) -> Tuple[ValidationReport, Optional[Spec]]:
+    """
+    Exécute toutes les étapes de validation en collectant les erreurs.
+
+    :return: (rapport, spec construit ou None si la construction a échoué)
+    """
+    report = ValidationReport()
+
+    sheets = _load_sheets(report, excel_path, excel_mode)
+    if sheets is None:
+        return report, None
+
+    validate_excel(sheets, report)
+
+    spec = _build_spec(report, sheets)
+    if spec is not None:
+        _check_cross_references(report, sheets, spec)
+        _check_schema(report, sheets, spec, schema_path)
+
+    logger.info("Report: %d issue(s) collected", len(report))
+    return report, spec
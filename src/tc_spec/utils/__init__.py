@@ -16,6 +16,8 @@ from tc_spec.utils.errors import (
 
 from tc_spec.utils.helpers import (
     normalize_str,
+    normalize_str_series,
+    normalize_frame,
     safe_int,
     safe_number,
     parse_csv,
@@ -34,6 +36,8 @@ __all__ = [
 
     # Helpers
     "normalize_str",
+    "normalize_str_series",
+    "normalize_frame",
     "safe_int",
     "safe_number",
     "parse_csv",
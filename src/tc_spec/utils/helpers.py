@@ -7,6 +7,8 @@ Aucune logique métier ne doit apparaître ici.
 
 from typing import Any, Iterable, List, Optional
 
+import pandas as pd
+
 def normalize_str(value: Any) -> Optional[str]:
     """
     Convertit une valeur en string normalisée.
@@ -15,12 +17,59 @@ def normalize_str(value: Any) -> Optional[str]:
     if value is None:
         return None
 
+    # Chemin rapide : cellule texte (déjà normalisée par normalize_frame ou non)
+    if type(value) is str:
+        return value.strip() or None
+
     if isinstance(value, float) and value != value:  # NaN
         return None
 
     s = str(value).strip()
     return s if s else None
 
+def normalize_str_series(values: pd.Series) -> pd.Series:
+    """
+    Version vectorisée de normalize_str pour une colonne entière.
+    Retourne une Series object où les valeurs vides ou NaN valent None.
+    """
+    s = values.astype("string").str.strip().replace("", pd.NA)
+    return s.astype(object).where(s.notna(), None)
+
+def normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normalise toutes les cellules d'une feuille en une seule passe vectorisée :
+    - texte : espaces retirés, chaîne vide -> None
+    - NaN / vide -> None
+    - cellules numériques conservées telles quelles
+    """
+    normalized = []
+    for i in range(df.shape[1]):
+        col = df.iloc[:, i]
+        if isinstance(col.dtype, pd.StringDtype):
+            col = col.astype(object)
+        elif col.dtype != object:
+            normalized.append(col)
+            continue
+
+        try:
+            stripped = col.str.strip()
+        except AttributeError:
+            # Aucune cellule texte dans la colonne
+            stripped = None
+
+        if stripped is not None:
+            col = col.where(stripped.isna(), stripped)
+
+        normalized.append(col.where(col.notna() & (col != ""), None))
+
+    if not normalized:
+        return df.copy()
+
+    out = pd.concat(normalized, axis=1)
+    out.columns = df.columns
+    out.attrs = dict(df.attrs)
+    return out
+
 def safe_int(value: Any, field_name: str = "") -> Optional[int]:
     """
     Convertit une valeur en int de manière sûre.
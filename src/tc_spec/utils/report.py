@@ -0,0 +1,92 @@
+"""
+TC Insight – Rapport de validation
+
+Collecte des problèmes de toutes les étapes (Excel, construction,
+références croisées, schéma) au lieu de s'arrêter au premier, avec la
+feuille et la cellule A1 d'origine quand elles sont connues.
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import Iterator, List, NamedTuple, Optional
+
+REPORT_FIELDS = ["stage", "severity", "sheet", "cell", "message"]
+
+
+class Issue(NamedTuple):
+    stage: str
+    message: str
+    sheet: Optional[str] = None
+    cell: Optional[str] = None
+    severity: str = "error"
+
+    @property
+    def location(self) -> str:
+        if self.sheet and self.cell:
+            return f"'{self.sheet}'!{self.cell}"
+        return self.sheet or ""
+
+    def to_dict(self) -> dict:
+        return {field: getattr(self, field) for field in REPORT_FIELDS}
+
+
+class ValidationReport:
+    """
+    Liste ordonnée des problèmes rencontrés, exportable en JSON ou CSV.
+    """
+
+    def __init__(self):
+        self.issues: List[Issue] = []
+
+    def add(
+        self,
+        stage: str,
+        message: str,
+        sheet: Optional[str] = None,
+        cell: Optional[str] = None,
+        severity: str = "error",
+    ) -> None:
+        self.issues.append(Issue(stage, message, sheet, cell, severity))
+
+    @property
+    def errors(self) -> List[Issue]:
+        return [issue for issue in self.issues if issue.severity == "error"]
+
+    def __iter__(self) -> Iterator[Issue]:
+        return iter(self.issues)
+
+    def __len__(self) -> int:
+        return len(self.issues)
+
+    def write(self, path: str | Path) -> Path:
+        """
+        Écrit le rapport : CSV si l'extension est .csv, JSON sinon.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if path.suffix.lower() == ".csv":
+            with path.open("w", encoding="utf-8", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+                writer.writeheader()
+                writer.writerows(issue.to_dict() for issue in self.issues)
+        else:
+            payload = {
+                "errors": len(self.errors),
+                "issues": [issue.to_dict() for issue in self.issues],
+            }
+            path.write_text(
+                json.dumps(payload, ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
+        return path
+
+    def summary(self, limit: int = 20) -> str:
+        lines = [
+            f"- {issue.location + ': ' if issue.location else ''}{issue.message}"
+            for issue in self.errors[:limit]
+        ]
+        if len(self.errors) > limit:
+            lines.append(f"- ... and {len(self.errors) - limit} more")
+        return "\n".join(lines)
@@ -5,10 +5,20 @@ Ce module expose les fonctions de validation officielles du
 générateur de Specs TC Insight (V2).
 """
 
+from tc_spec.validation.cross_references import validate_cross_references
 from tc_spec.validation.excel_validation import validate_excel
-from tc_spec.validation.schema_validation import validate_spec_schema
+from tc_spec.validation.schema_validation import (
+    clear_schema_cache,
+    get_schema_validator,
+    validate_spec_schema,
+)
+from tc_spec.validation.streaming_validation import validate_spec_file
 
 __all__ = [
     "validate_excel",
     "validate_spec_schema",
+    "validate_spec_file",
+    "validate_cross_references",
+    "get_schema_validator",
+    "clear_schema_cache",
 ]
@@ -0,0 +1,169 @@
+"""
+TC Insight – Validation des références croisées
+
+Le JSON Schema ne peut pas exprimer les liens entre parties du spec :
+une règle qui cible une question inexistante, une valeur absente de la
+liste de la question cible ou un code de liste inconnu ne se voient
+qu'à l'exécution sur les terminaux.
+
+Une table des symboles est construite une seule fois (sections, listes
+et leurs valeurs ; les questions viennent des index du Spec), puis
+chaque référence est résolue par simple lookup. Toutes les erreurs
+sont remontées en une passe.
+"""
+
+import logging
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from tc_spec.model.list import ColumnarSpecList
+from tc_spec.model.question import Question
+from tc_spec.model.rule import Condition, Rule
+from tc_spec.model.spec import Spec
+from tc_spec.utils.errors import ModelError
+
+logger = logging.getLogger(__name__)
+
+# (type de propriétaire, code, champ source, problème)
+CrossReferenceIssue = Tuple[str, str, str, str]
+
+# Opérateurs dont la valeur doit appartenir à la liste de la question cible
+MEMBERSHIP_OPERATORS = {"=", "!", "e", "!e"}
+
+
+class SymbolTable:
+    """
+    Symboles d'un Spec : codes de section, valeurs de chaque liste et
+    liste associée à chaque question (questions résolues par Spec.question).
+    """
+
+    def __init__(self, spec: Spec):
+        self.spec = spec
+        self.sections: FrozenSet[str] = frozenset(spec.sections)
+        self.lists: Dict[str, FrozenSet[str]] = {
+            code: frozenset(_list_values(lst))
+            for code, lst in spec.lists.items()
+        }
+        self.question_lists: Dict[str, str] = {
+            question.ref: question.qtype["o"]
+            for question in spec.iter_questions()
+            if isinstance(question.qtype.get("o"), str)
+        }
+
+    def resolve_question(self, ref: str) -> Optional[Question]:
+        return self.spec.question(ref)
+
+
+def _list_values(lst) -> Iterator[str]:
+    if isinstance(lst, ColumnarSpecList):
+        return iter(lst.values)
+    return _item_values(lst)
+
+
+def _item_values(lst) -> Iterator[str]:
+    # SpecList (modèle) ou liste d'items déjà sérialisée
+    items = getattr(lst, "items", lst)
+    for item in items:
+        value = item.get("v") if isinstance(item, dict) else item.value
+        yield str(value)
+
+
+def _iter_conditions(rules: Iterable[Rule]) -> Iterator[Condition]:
+    for rule in rules:
+        if rule.condition is not None:
+            yield rule.condition
+        else:
+            yield from rule.or_conditions
+
+
+def _iter_rule_owners(spec: Spec) -> Iterator[Tuple[str, str, List[Rule]]]:
+    for code, section in spec.sections.items():
+        if section.visibility:
+            yield "section", code, section.visibility
+        for question in section.questions:
+            if question.visibility:
+                yield "question", question.ref, question.visibility
+    for code, anomaly in spec.anomalies.items():
+        yield "anomaly", code, anomaly.rules
+
+
+def _condition_errors(condition: Condition, symbols: SymbolTable) -> Iterator[str]:
+    target = symbols.resolve_question(condition.ref)
+    if target is None:
+        yield f"unknown question '{condition.ref}'"
+        return
+
+    if condition.value_type == "a":
+        # La valeur est la réponse d'une autre question
+        if symbols.resolve_question(str(condition.value)) is None:
+            yield f"unknown answer reference '{condition.value}' (rule on '{condition.ref}')"
+        return
+
+    if condition.operator not in MEMBERSHIP_OPERATORS:
+        return
+
+    list_code = symbols.question_lists.get(target.ref)
+    values = symbols.lists.get(list_code) if list_code else None
+    if values is None:
+        return
+
+    if str(condition.value) not in values:
+        yield (
+            f"value {condition.value!r} is not in list '{list_code}' "
+            f"of question '{target.ref}'"
+        )
+
+
+def iter_cross_reference_issues(spec: Spec) -> List[CrossReferenceIssue]:
+    """
+    Retourne toutes les références croisées cassées du spec, sous la
+    forme (type de propriétaire, code, champ, problème) :
+    - ref de chaque condition de règle (sections, questions, anomalies)
+    - valeurs =, !, e, !e contre la liste de la question cible
+    - code de liste "o" de chaque type de question
+    """
+    symbols = SymbolTable(spec)
+    issues: List[CrossReferenceIssue] = []
+
+    for ref, list_code in symbols.question_lists.items():
+        if list_code not in symbols.lists:
+            issues.append(("question", ref, "list_code", f"unknown list '{list_code}'"))
+
+    for kind, code, rules in _iter_rule_owners(spec):
+        field = "visibility" if kind != "anomaly" else "r_ref"
+        for condition in _iter_conditions(rules):
+            issues.extend(
+                (kind, code, field, problem)
+                for problem in _condition_errors(condition, symbols)
+            )
+
+    logger.debug(
+        "Cross references: %d questions, %d lists, %d error(s)",
+        sum(len(section.questions) for section in spec.sections.values()),
+        len(symbols.lists),
+        len(issues),
+    )
+    return issues
+
+
+def iter_cross_reference_errors(spec: Spec) -> List[str]:
+    """
+    Messages des références croisées cassées (voir iter_cross_reference_issues).
+    """
+    return [
+        f"{kind} '{code}': {problem}"
+        for kind, code, _, problem in iter_cross_reference_issues(spec)
+    ]
+
+
+def validate_cross_references(spec: Spec) -> None:
+    """
+    Valide les références croisées du spec.
+
+    :raises ModelError: avec la liste complète des références cassées
+    """
+    errors = iter_cross_reference_errors(spec)
+    if errors:
+        raise ModelError(
+            f"Broken cross references ({len(errors)} error(s)):\n"
+            + "\n".join(f"- {e}" for e in errors)
+        )
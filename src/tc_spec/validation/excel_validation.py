@@ -5,23 +5,32 @@ Ce module expose une API officielle pour valider la structure
 des fichiers Excel machine-first utilisés par le générateur.
 """
 
-from typing import Dict
+from typing import Dict, Optional
 
 import pandas as pd
 
 from tc_spec.excel.validators import validate_excel_structure
+from tc_spec.model.trusted import ValidationToken
 from tc_spec.utils.errors import ExcelValidationError
+from tc_spec.utils.report import ValidationReport
 
-def validate_excel(sheets: Dict[str, pd.DataFrame]) -> None:
+def validate_excel(
+    sheets: Dict[str, pd.DataFrame],
+    report: Optional[ValidationReport] = None,
+) -> Optional[ValidationToken]:
     """
     Valide la structure d'un Excel déjà chargé.
 
     :param sheets: dictionnaire {sheet_name: DataFrame}
+    :param report: si fourni, les erreurs y sont collectées au lieu
+        d'être levées
+    :return: jeton de validation (None en mode rapport), qui permet aux
+        builders de ne pas recontrôler chaque objet
     :raises ExcelValidationError: si l'Excel est invalide
     """
 
     try:
-        validate_excel_structure(sheets)
+        return validate_excel_structure(sheets, report)
     except ExcelValidationError:
         # on relance tel quel (déjà métier)
         raise
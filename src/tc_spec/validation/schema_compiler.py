@@ -0,0 +1,586 @@
+"""
+TC Insight – Compilation du JSON Schema
+
+Transforme un JSON Schema en module Python autonome dont les contrôles
+sont écrits en clair (pas de parcours dynamique du schéma) :
+
+    tc-spec compile-schema schemas/spec_v2.schema.json
+
+Le module généré expose iter_errors(instance) -> [(path, message)],
+avec les mêmes chemins et messages que jsonschema. Il embarque
+l'empreinte sha256 du schéma source : validate_spec_schema ne l'utilise
+que s'il correspond au schéma courant.
+
+Seuls les mots-clés utilisés par les schémas TC Insight sont supportés ;
+tout autre mot-clé fait échouer la compilation plutôt que d'être ignoré.
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from tc_spec.utils.errors import SchemaValidationError
+
+# Mots-clés sans effet sur la validation
+_ANNOTATIONS = {
+    "$schema",
+    "$id",
+    "$defs",
+    "$comment",
+    "title",
+    "description",
+    "default",
+    "examples",
+}
+
+_SUPPORTED = _ANNOTATIONS | {
+    "$ref",
+    "type",
+    "required",
+    "properties",
+    "patternProperties",
+    "additionalProperties",
+    "const",
+    "enum",
+    "items",
+    "minItems",
+    "maxItems",
+    "minProperties",
+    "maxProperties",
+    "minLength",
+    "maxLength",
+    "pattern",
+    "oneOf",
+    "anyOf",
+    "allOf",
+}
+
+_TYPE_CHECKS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "integer": "_is_integer({v})",
+    "number": "_is_number({v})",
+}
+
+_RUNTIME = '''
+def _is_number(value):
+    return isinstance(value, numbers.Number) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (
+        isinstance(value, float) and value.is_integer()
+    )
+
+
+def _equal(one, two):
+    # Égalité JSON : bool distinct des nombres, récursive
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(
+            _equal(i, j) for i, j in zip(one, two)
+        )
+    if isinstance(one, dict) and isinstance(two, dict):
+        return len(one) == len(two) and all(
+            key in two and _equal(value, two[key])
+            for key, value in one.items()
+        )
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+'''
+
+
+def schema_digest_of(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+def compiled_validator_path(schema_path: str | Path) -> Path:
+    """
+    Emplacement par défaut du module généré :
+    schemas/spec_v2.schema.json -> schemas/spec_v2_schema.py
+    """
+    schema_path = Path(schema_path)
+    stem = schema_path.name.removesuffix(".json")
+    return schema_path.with_name(re.sub(r"\W", "_", stem) + ".py")
+
+
+def resolve_local_ref(root: Any, ref: str) -> Any:
+    """
+    Résout une référence locale ("#/$defs/question") dans `root`.
+    """
+    if not ref.startswith("#"):
+        raise SchemaValidationError(
+            f"Cannot compile schema: only local $ref are supported ({ref!r})"
+        )
+    node = root
+    for part in ref[1:].split("/")[1:]:
+        part = part.replace("~1", "/").replace("~0", "~")
+        try:
+            node = node[int(part)] if isinstance(node, list) else node[part]
+        except (KeyError, IndexError, ValueError, TypeError):
+            raise SchemaValidationError(
+                f"Cannot compile schema: unresolvable $ref {ref!r}"
+            )
+    return node
+
+
+def oneof_discriminator(
+    root: Any,
+    one_of: List[Any],
+) -> Optional[Tuple[str, Dict[str, int]]]:
+    """
+    Détecte un discriminant dans un oneOf : une propriété requise par
+    chaque branche et fixée par un "const" texte distinct (ex: "t" des
+    questionType). Retourne (propriété, {valeur: index de branche}).
+    """
+    branches = []
+    for branch in one_of:
+        while isinstance(branch, dict) and set(branch) == {"$ref"}:
+            branch = resolve_local_ref(root, branch["$ref"])
+        if not isinstance(branch, dict):
+            return None
+        branches.append(branch)
+
+    if len(branches) < 2:
+        return None
+
+    candidates = set(branches[0].get("required", []))
+    for branch in branches:
+        candidates &= set(branch.get("required", []))
+
+    for prop in sorted(candidates):
+        tags: Dict[str, int] = {}
+        for index, branch in enumerate(branches):
+            subschema = branch.get("properties", {}).get(prop)
+            tag = subschema.get("const") if isinstance(subschema, dict) else None
+            if not isinstance(tag, str) or tag in tags:
+                break
+            tags[tag] = index
+        else:
+            return prop, tags
+    return None
+
+
+class _Emitter:
+    def __init__(self, root: Any):
+        self.root = root
+        self.constants: List[str] = []
+        self.functions: List[List[str]] = []
+        self.names: Dict[int, str] = {}
+        self.pending: List[Any] = []
+        self.counter = 0
+        # Les $defs gardent leur nom : _def_question, _def_sections...
+        self.def_names: Dict[int, str] = {}
+        if isinstance(root, dict):
+            for def_name, definition in root.get("$defs", {}).items():
+                self.def_names[id(definition)] = def_name
+
+    # -- helpers ---------------------------------------------------------
+
+    def _fresh(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def constant(self, value_source: str, prefix: str = "_C") -> str:
+        name = self._fresh(prefix)
+        self.constants.append(f"{name} = {value_source}")
+        return name
+
+    def resolve(self, ref: str) -> Any:
+        return resolve_local_ref(self.root, ref)
+
+    def function_for(self, schema: Any, name: Optional[str] = None) -> str:
+        """
+        Nom de la fonction validant `schema` ; un $ref seul est appelé
+        directement.
+        """
+        while isinstance(schema, dict) and set(schema) == {"$ref"}:
+            schema = self.resolve(schema["$ref"])
+
+        key = id(schema)
+        if key not in self.names:
+            if name is None and key in self.def_names:
+                name = "_def_" + re.sub(r"\W", "_", self.def_names[key])
+            self.names[key] = name or self._fresh("_schema_")
+            self.pending.append(schema)
+        return self.names[key]
+
+    # -- code generation -------------------------------------------------
+
+    def emit_function(self, schema: Any):
+        name = self.names[id(schema)]
+        lines = [f"def {name}(x, path, errors):"]
+        body = self.body(schema, "x", "path", 1)
+        lines.extend(body or ["    pass"])
+        self.functions.append(lines)
+
+    def body(self, schema: Any, var: str, path: str, depth: int) -> List[str]:
+        ind = "    " * depth
+        if schema is True or schema == {}:
+            return []
+        if schema is False:
+            return [
+                f"{ind}errors.append(({path}, "
+                f"'False schema does not allow ' + repr({var})))"
+            ]
+        if not isinstance(schema, dict):
+            raise SchemaValidationError(
+                f"Cannot compile schema: invalid subschema {schema!r}"
+            )
+
+        unsupported = set(schema) - _SUPPORTED
+        if unsupported:
+            raise SchemaValidationError(
+                f"Cannot compile schema: unsupported keyword(s) {sorted(unsupported)}"
+            )
+
+        lines: List[str] = []
+        for keyword, value in schema.items():
+            emit = getattr(self, "kw_" + keyword.lstrip("$"), None)
+            if emit is not None:
+                lines.extend(emit(value, schema, var, path, depth))
+        return lines
+
+    def error(self, path: str, message: str, depth: int) -> str:
+        return f"{'    ' * depth}errors.append(({path}, {message}))"
+
+    def kw_ref(self, ref, schema, var, path, depth):
+        target = self.function_for({"$ref": ref})
+        return [f"{'    ' * depth}{target}({var}, {path}, errors)"]
+
+    def kw_type(self, types, schema, var, path, depth):
+        types = [types] if isinstance(types, str) else types
+        checks = " or ".join(_TYPE_CHECKS[t].format(v=var) for t in types)
+        reprs = ", ".join(repr(t) for t in types)
+        return [
+            f"{'    ' * depth}if not ({checks}):",
+            self.error(path, f"repr({var}) + {' is not of type ' + reprs!r}", depth + 1),
+        ]
+
+    def kw_required(self, required, schema, var, path, depth):
+        ind = "    " * depth
+        lines = [f"{ind}if isinstance({var}, dict):"]
+        for prop in required:
+            lines.append(f"{ind}    if {prop!r} not in {var}:")
+            lines.append(self.error(path, repr(f"{prop!r} is a required property"), depth + 2))
+        return lines
+
+    def kw_properties(self, properties, schema, var, path, depth):
+        ind = "    " * depth
+        lines = [f"{ind}if isinstance({var}, dict):"]
+        for prop, subschema in properties.items():
+            item = self._fresh("v")
+            sub = self.body(subschema, item, f"{path} + ({prop!r},)", depth + 2)
+            if not sub:
+                continue
+            lines.append(f"{ind}    if {prop!r} in {var}:")
+            lines.append(f"{ind}        {item} = {var}[{prop!r}]")
+            lines.extend(sub)
+        return lines if len(lines) > 1 else []
+
+    def kw_patternProperties(self, patterns, schema, var, path, depth):
+        ind = "    " * depth
+        lines = [f"{ind}if isinstance({var}, dict):"]
+        for pattern, subschema in patterns.items():
+            regex = self.constant(f"re.compile({pattern!r})", "_P")
+            key, item = self._fresh("k"), self._fresh("v")
+            sub = self.body(subschema, item, f"{path} + ({key},)", depth + 3)
+            lines.append(f"{ind}    for {key}, {item} in {var}.items():")
+            lines.append(f"{ind}        if {regex}.search({key}):")
+            lines.extend(sub or [f"{ind}            pass"])
+        return lines
+
+    def kw_additionalProperties(self, additional, schema, var, path, depth):
+        if additional is True or additional == {}:
+            return []
+
+        ind = "    " * depth
+        known = self.constant(repr(frozenset(schema.get("properties", {}))), "_K")
+        patterns = "|".join(schema.get("patternProperties", {}))
+        key = self._fresh("k")
+        is_extra = f"{key} not in {known}"
+        if patterns:
+            regex = self.constant(f"re.compile({patterns!r})", "_P")
+            is_extra += f" and not {regex}.search({key})"
+
+        if additional is False:
+            extras = self._fresh("extras")
+            lines = [
+                f"{ind}if isinstance({var}, dict):",
+                f"{ind}    {extras} = [{key} for {key} in {var} if {is_extra}]",
+                f"{ind}    if {extras}:",
+            ]
+            if "patternProperties" in schema:
+                regexes = ", ".join(repr(p) for p in sorted(schema["patternProperties"]))
+                message = (
+                    f"', '.join(repr(e) for e in sorted({extras}))"
+                    f" + (' does' if len({extras}) == 1 else ' do')"
+                    f" + {' not match any of the regexes: ' + regexes!r}"
+                )
+            else:
+                message = (
+                    "'Additional properties are not allowed ('"
+                    f" + ', '.join(repr(e) for e in sorted({extras}, key=str))"
+                    f" + (' was' if len({extras}) == 1 else ' were')"
+                    " + ' unexpected)'"
+                )
+            lines.append(self.error(path, message, depth + 2))
+            return lines
+
+        item = self._fresh("v")
+        sub = self.body(additional, item, f"{path} + ({key},)", depth + 3)
+        if not sub:
+            return []
+        return [
+            f"{ind}if isinstance({var}, dict):",
+            f"{ind}    for {key}, {item} in {var}.items():",
+            f"{ind}        if {is_extra}:",
+            *sub,
+        ]
+
+    def kw_items(self, items, schema, var, path, depth):
+        ind = "    " * depth
+        index, item = self._fresh("i"), self._fresh("v")
+        sub = self.body(items, item, f"{path} + ({index},)", depth + 2)
+        if not sub:
+            return []
+        return [
+            f"{ind}if isinstance({var}, list):",
+            f"{ind}    for {index}, {item} in enumerate({var}):",
+            *sub,
+        ]
+
+    def kw_const(self, const, schema, var, path, depth):
+        message = repr(f"{const!r} was expected")
+        if isinstance(const, str):
+            check = f"{var} != {const!r}"
+        else:
+            check = f"not _equal({var}, {self.constant(repr(const))})"
+        return [f"{'    ' * depth}if {check}:", self.error(path, message, depth + 1)]
+
+    def kw_enum(self, enum, schema, var, path, depth):
+        suffix = repr(f" is not one of {enum!r}")
+        if all(isinstance(e, str) for e in enum):
+            values = self.constant(repr(frozenset(enum)), "_E")
+            check = f"not (isinstance({var}, str) and {var} in {values})"
+        else:
+            values = self.constant(repr(list(enum)), "_E")
+            check = f"not any(_equal(e, {var}) for e in {values})"
+        return [
+            f"{'    ' * depth}if {check}:",
+            self.error(path, f"repr({var}) + {suffix}", depth + 1),
+        ]
+
+    def _size(self, py_type, limit, too_small, var, path, depth, empty_msg, other_msg):
+        compare = "<" if too_small else ">"
+        message = empty_msg if limit == (1 if too_small else 0) else other_msg
+        return [
+            f"{'    ' * depth}if isinstance({var}, {py_type}) and len({var}) {compare} {limit}:",
+            self.error(path, f"repr({var}) + {' ' + message!r}", depth + 1),
+        ]
+
+    def kw_minItems(self, limit, schema, var, path, depth):
+        return self._size("list", limit, True, var, path, depth, "should be non-empty", "is too short")
+
+    def kw_maxItems(self, limit, schema, var, path, depth):
+        return self._size("list", limit, False, var, path, depth, "is expected to be empty", "is too long")
+
+    def kw_minLength(self, limit, schema, var, path, depth):
+        return self._size("str", limit, True, var, path, depth, "should be non-empty", "is too short")
+
+    def kw_maxLength(self, limit, schema, var, path, depth):
+        return self._size("str", limit, False, var, path, depth, "is expected to be empty", "is too long")
+
+    def kw_minProperties(self, limit, schema, var, path, depth):
+        return self._size("dict", limit, True, var, path, depth, "should be non-empty", "does not have enough properties")
+
+    def kw_maxProperties(self, limit, schema, var, path, depth):
+        return self._size("dict", limit, False, var, path, depth, "is expected to be empty", "has too many properties")
+
+    def kw_pattern(self, pattern, schema, var, path, depth):
+        regex = self.constant(f"re.compile({pattern!r})", "_P")
+        return [
+            f"{'    ' * depth}if isinstance({var}, str) and not {regex}.search({var}):",
+            self.error(path, f"repr({var}) + {' does not match ' + repr(pattern)!r}", depth + 1),
+        ]
+
+    def kw_allOf(self, subschemas, schema, var, path, depth):
+        return [
+            f"{'    ' * depth}{self.function_for(sub)}({var}, {path}, errors)"
+            for sub in subschemas
+        ]
+
+    def _branches(self, subschemas) -> str:
+        names = ", ".join(self.function_for(sub) for sub in subschemas)
+        return self.constant(f"({names},)", "_B")
+
+    def kw_anyOf(self, subschemas, schema, var, path, depth):
+        ind = "    " * depth
+        branches = self._branches(subschemas)
+        return [
+            f"{ind}if not _valid_branches({branches}, {var}, stop_at=1):",
+            self.error(path, f"repr({var}) + ' is not valid under any of the given schemas'", depth + 1),
+        ]
+
+    def kw_oneOf(self, subschemas, schema, var, path, depth):
+        discriminator = oneof_discriminator(self.root, subschemas)
+        if discriminator is None:
+            return self._one_of(subschemas, var, path, depth)
+
+        ind = "    " * depth
+
+        # Aiguillage direct sur la branche désignée par le discriminant
+        prop, tags = discriminator
+        targets = ", ".join(
+            f"{tag!r}: {self.function_for(subschemas[index])}"
+            for tag, index in tags.items()
+        )
+        dispatch = self.constant(f"{{{targets}}}", "_D")
+        tag, branch = self._fresh("tag"), self._fresh("branch")
+        unknown = repr(f" is not one of {list(tags)!r}")
+        return [
+            f"{ind}if isinstance({var}, dict):",
+            f"{ind}    if {prop!r} not in {var}:",
+            self.error(path, repr(f"{prop!r} is a required property"), depth + 2),
+            f"{ind}    else:",
+            f"{ind}        {tag} = {var}[{prop!r}]",
+            f"{ind}        {branch} = {dispatch}.get({tag}) if isinstance({tag}, str) else None",
+            f"{ind}        if {branch} is None:",
+            self.error(f"{path} + ({prop!r},)", f"repr({tag}) + {unknown}", depth + 3),
+            f"{ind}        else:",
+            f"{ind}            {branch}({var}, {path}, errors)",
+            f"{ind}else:",
+            *self._one_of(subschemas, var, path, depth + 1),
+        ]
+
+    def _one_of(self, subschemas, var, path, depth):
+        ind = "    " * depth
+        branches = self._branches(subschemas)
+        reprs = self.constant(repr(tuple(repr(sub) for sub in subschemas)), "_R")
+        valid = self._fresh("valid")
+        return [
+            f"{ind}{valid} = _valid_branches({branches}, {var})",
+            f"{ind}if not {valid}:",
+            self.error(path, f"repr({var}) + ' is not valid under any of the given schemas'", depth + 1),
+            f"{ind}elif len({valid}) > 1:",
+            self.error(
+                path,
+                f"repr({var}) + ' is valid under each of ' + ', '.join("
+                f"{reprs}[i] for i in {valid}[1:] + {valid}[:1])",
+                depth + 1,
+            ),
+        ]
+
+    # -- module ----------------------------------------------------------
+
+    def module_source(self, digest: str, source_name: str) -> str:
+        self.function_for(self.root, "_validate_root")
+        defs = {
+            def_name: self.function_for(definition)
+            for def_name, definition in (
+                self.root.get("$defs", {}).items()
+                if isinstance(self.root, dict) else ()
+            )
+        }
+        while self.pending:
+            self.emit_function(self.pending.pop(0))
+
+        parts = [
+            f'"""\nValidateur généré depuis {source_name} par `tc-spec compile-schema`.\n'
+            'Ne pas modifier : relancer la compilation après toute modification du schéma.\n"""',
+            "",
+            "import numbers",
+            "import re",
+            "",
+            f"SCHEMA_SHA256 = {digest!r}",
+            "",
+            _RUNTIME.strip("\n"),
+            "",
+            "",
+            "def _valid_branches(branches, x, stop_at=None):",
+            "    valid = []",
+            "    for index, branch in enumerate(branches):",
+            "        scratch = []",
+            "        branch(x, (), scratch)",
+            "        if not scratch:",
+            "            valid.append(index)",
+            "            if stop_at and len(valid) >= stop_at:",
+            "                break",
+            "    return valid",
+            "",
+        ]
+        for function in self.functions:
+            parts.append("")
+            parts.extend(function)
+            parts.append("")
+        parts.append("")
+        parts.extend(self.constants)
+        parts.extend([
+            "",
+            "# Validateur de chaque $defs (validation par sous-arbre)",
+            "DEFS = {",
+            *(f"    {name!r}: {function}," for name, function in defs.items()),
+            "}",
+        ])
+        parts.extend([
+            "",
+            "",
+            "def iter_errors(instance):",
+            '    """',
+            "    Retourne toutes les erreurs sous forme de (path, message).",
+            '    """',
+            "    errors = []",
+            "    _validate_root(instance, (), errors)",
+            "    return errors",
+            "",
+        ])
+        return "\n".join(parts)
+
+
+def compile_schema_source(raw: bytes, source_name: str = "schema") -> str:
+    """
+    Génère le code source du validateur pour le schéma `raw`.
+    """
+    try:
+        schema = json.loads(raw)
+    except Exception as e:
+        raise SchemaValidationError(
+            f"Unable to load schema '{source_name}': {e}"
+        ) from e
+    return _Emitter(schema).module_source(schema_digest_of(raw), source_name)
+
+
+def compile_schema(
+    schema_path: str | Path,
+    output_path: Optional[str | Path] = None,
+) -> Path:
+    """
+    Compile un JSON Schema en module Python et retourne son chemin.
+
+    :raises SchemaValidationError: si le schéma est invalide ou utilise
+        un mot-clé non supporté
+    """
+    from tc_spec.validation.schema_validation import get_schema_validator
+
+    schema_path = Path(schema_path)
+    # Le schéma lui-même est vérifié avant toute génération
+    get_schema_validator(schema_path)
+
+    source = compile_schema_source(schema_path.read_bytes(), schema_path.name)
+    # Le code généré doit au minimum être syntaxiquement valide
+    compile(source, str(output_path or schema_path), "exec")
+
+    output_path = Path(output_path) if output_path else compiled_validator_path(schema_path)
+    output_path.write_text(source, encoding="utf-8")
+    return output_path
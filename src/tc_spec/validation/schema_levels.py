@@ -0,0 +1,209 @@
+"""
+TC Insight – Niveaux de validation du spec généré
+
+Compromis coût / couverture sélectionnable (generate --schema-validation) :
+
+- off        : aucune validation (défaut)
+- structural : références croisées + discriminant des types de question
+               (valeur "t" connue et propriétés requises de la branche),
+               sans JSON Schema
+- full       : JSON Schema complet (validateur compilé / mis en cache)
+- subtree    : JSON Schema complet, section / liste / anomalie une à
+               une avec cache par empreinte (voir subtree_validation) :
+               seuls les sous-arbres modifiés sont revalidés
+- sampled    : JSON Schema sur un échantillon aléatoire de questions et
+               de listes, pour les boucles de développement
+
+Chaque niveau journalise sa durée (logger INFO).
+"""
+
+import logging
+import math
+import random
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from tc_spec.model.spec import Spec
+from tc_spec.utils.errors import SchemaValidationError
+from tc_spec.validation.cross_references import iter_cross_reference_errors
+from tc_spec.validation.schema_compiler import oneof_discriminator, resolve_local_ref
+from tc_spec.validation.schema_validation import (
+    format_schema_errors,
+    get_schema_validator,
+    validate_spec_schema,
+)
+from tc_spec.validation.subtree_validation import SchemaIssue, def_errors
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VALIDATION_LEVELS = ("off", "structural", "full", "subtree", "sampled")
+DEFAULT_SAMPLE_RATE = 0.1
+
+QUESTION_TYPE_DEF = "questionType"
+QUESTION_DEF = "question"
+LISTS_DEF = "lists"
+
+
+def check_sample_rate(sample_rate: float) -> float:
+    """
+    Part échantillonnée en "sampled" : nombre dans ]0, 1].
+
+    :raises SchemaValidationError: si hors bornes (NaN compris)
+    """
+    if (
+        isinstance(sample_rate, bool)
+        or not isinstance(sample_rate, (int, float))
+        or not 0 < sample_rate <= 1
+    ):
+        raise SchemaValidationError(
+            f"Invalid sample rate {sample_rate!r} (expected 0 < rate <= 1)"
+        )
+    return float(sample_rate)
+
+
+def _question_type_branches(schema_path: str | Path) -> Optional[tuple]:
+    """
+    (propriété, {tag: propriétés requises}) du oneOf questionType.
+    """
+    root = get_schema_validator(schema_path).schema
+    definition = root.get("$defs", {}).get(QUESTION_TYPE_DEF, {})
+    one_of = definition.get("oneOf")
+    if not one_of:
+        return None
+
+    try:
+        discriminator = oneof_discriminator(root, one_of)
+    except SchemaValidationError:
+        return None
+    if discriminator is None:
+        return None
+
+    prop, tags = discriminator
+    required = {}
+    for tag, index in tags.items():
+        branch = one_of[index]
+        if set(branch) == {"$ref"}:
+            branch = resolve_local_ref(root, branch["$ref"])
+        required[tag] = branch.get("required", [])
+    return prop, required
+
+
+def _structural_errors(spec: Spec, schema_path: str | Path) -> List[str]:
+    errors = iter_cross_reference_errors(spec)
+
+    branches = _question_type_branches(schema_path)
+    if branches is None:
+        return errors
+
+    prop, required = branches
+    for section in spec.sections.values():
+        for question in section.questions:
+            tag = question.qtype.get(prop)
+            if tag not in required:
+                errors.append(
+                    f"question '{question.ref}': unknown type {prop}={tag!r} "
+                    f"(expected one of {sorted(required)})"
+                )
+                continue
+            missing = [key for key in required[tag] if key not in question.qtype]
+            if missing:
+                errors.append(
+                    f"question '{question.ref}': type {tag!r} requires {missing}"
+                )
+    return errors
+
+
+def _sampled_errors(
+    spec_dict: Dict[str, Any],
+    schema_path: str | Path,
+    sample_rate: float,
+    seed: Optional[int],
+) -> List[SchemaIssue]:
+    rng = random.Random(seed)
+
+    def sample(items: list) -> list:
+        if not items:
+            return []
+        k = min(len(items), max(1, math.ceil(len(items) * sample_rate)))
+        return rng.sample(items, k)
+
+    questions = [
+        (("s", code, "p", index, number), question)
+        for code, section in spec_dict.get("s", {}).items()
+        for index, block in enumerate(section.get("p", []))
+        for number, question in block.items()
+    ]
+    lists = list(spec_dict.get("l", {}).items())
+
+    sampled_questions = sample(questions)
+    sampled_lists = sample(lists)
+    logger.debug(
+        "Schema: sampled %d/%d questions and %d/%d lists",
+        len(sampled_questions),
+        len(questions),
+        len(sampled_lists),
+        len(lists),
+    )
+
+    schema_path = str(schema_path)
+    errors: List[SchemaIssue] = []
+    for prefix, question in sampled_questions:
+        errors.extend(
+            (prefix + path, message)
+            for path, message in def_errors(schema_path, QUESTION_DEF, question)
+        )
+    for code, items in sampled_lists:
+        errors.extend(
+            (("l",) + path, message)
+            for path, message in def_errors(schema_path, LISTS_DEF, {code: items})
+        )
+
+    return sorted(errors, key=lambda e: [str(p) for p in e[0]])
+
+
+def validate_spec_level(
+    spec: Spec,
+    schema_path: str | Path,
+    level: str = "full",
+    sample_rate: float = DEFAULT_SAMPLE_RATE,
+    seed: Optional[int] = None,
+) -> float:
+    """
+    Valide le spec au niveau demandé et retourne la durée (secondes).
+
+    :raises SchemaValidationError: si invalide, niveau inconnu ou
+        sample_rate hors de ]0, 1] en "sampled"
+    """
+    if level not in SCHEMA_VALIDATION_LEVELS:
+        raise SchemaValidationError(
+            f"Invalid schema validation level '{level}' "
+            f"(expected one of {', '.join(SCHEMA_VALIDATION_LEVELS)})"
+        )
+    if level == "off":
+        return 0.0
+    if level == "sampled":
+        sample_rate = check_sample_rate(sample_rate)
+
+    start = time.perf_counter()
+    try:
+        if level == "structural":
+            errors = _structural_errors(spec, schema_path)
+            if errors:
+                raise SchemaValidationError(
+                    f"Structural validation failed ({len(errors)} error(s)):\n"
+                    + "\n".join(f"- {e}" for e in errors)
+                )
+        elif level == "full":
+            validate_spec_schema(spec.to_dict(), schema_path)
+        elif level == "subtree":
+            validate_spec_schema(spec.to_dict(), schema_path, by_subtree=True)
+        else:
+            errors = _sampled_errors(spec.to_dict(), schema_path, sample_rate, seed)
+            if errors:
+                raise SchemaValidationError(format_schema_errors(errors))
+    finally:
+        elapsed = time.perf_counter() - start
+        logger.info("Schema validation (%s): %.1f ms", level, elapsed * 1000)
+
+    return elapsed
@@ -3,61 +3,308 @@ TC Insight – Validation JSON Schema
 
 Ce module valide un Spec TC Insight sérialisé
 contre le JSON Schema officiel (V2).
+
+Les validateurs sont compilés une seule fois par schéma : le registre
+est indexé par chemin + mtime/taille, puis par empreinte du contenu,
+si bien qu'un fichier simplement « touché » réutilise le validateur
+existant. Le draft est celui déclaré par "$schema" (2020-12 par défaut).
+
+Si un validateur compilé (`tc-spec compile-schema`) est présent à côté
+du schéma et correspond à son empreinte, il remplace jsonschema.
 """
 
+import hashlib
+import importlib.util
 import json
+import logging
+import threading
 from pathlib import Path
-from typing import Any, Dict
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
 
-from jsonschema import Draft7Validator
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import SchemaError, ValidationError
+from jsonschema.protocols import Validator
+from jsonschema.validators import extend, validator_for
 
 from tc_spec.utils.errors import SchemaValidationError
+from tc_spec.validation.schema_compiler import (
+    compiled_validator_path,
+    oneof_discriminator,
+)
 
-def validate_spec_schema(
-    spec: Dict[str, Any],
-    schema_path: str | Path,
-) -> None:
-    """
-    Valide un Spec sérialisé contre le JSON Schema officiel.
+logger = logging.getLogger(__name__)
 
-    :param spec: dictionnaire Python (Spec.to_dict())
-    :param schema_path: chemin vers le fichier schema JSON
-    :raises SchemaValidationError: si invalide
+# (chemin résolu, mtime_ns, taille) -> empreinte sha256 du contenu
+_SCHEMA_HASHES: Dict[Tuple[str, int, int], str] = {}
+# empreinte sha256 -> validateur compilé (schéma vérifié)
+_VALIDATORS: Dict[str, Validator] = {}
+# (empreinte, nom du $defs) -> validateur du sous-schéma
+_DEF_VALIDATORS: Dict[Tuple[str, str], Validator] = {}
+# (module résolu, mtime_ns, taille) -> module compilé chargé
+_COMPILED: Dict[Tuple[str, int, int], ModuleType] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def _with_discriminators(validator_cls, schema: Any):
+    """
+    Étend `validator_cls` : un oneOf dont chaque branche fixe une même
+    propriété requise par un "const" (ex: "t" des questionType) est
+    validé directement contre la branche désignée, au lieu d'essayer
+    toutes les branches. Une valeur inconnue produit une seule erreur
+    sur la propriété discriminante.
     """
+    generic_one_of = validator_cls.VALIDATORS["oneOf"]
+    discriminators: Dict[int, Any] = {}
 
-    schema_path = Path(schema_path)
+    def one_of(validator, one_of_schemas, instance, subschema):
+        key = id(one_of_schemas)
+        if key not in discriminators:
+            try:
+                discriminators[key] = oneof_discriminator(schema, one_of_schemas)
+            except SchemaValidationError:
+                discriminators[key] = None
+        discriminator = discriminators[key]
 
-    if not schema_path.exists():
-        raise SchemaValidationError(
-            f"Schema file not found: {schema_path}"
+        if discriminator is None or not validator.is_type(instance, "object"):
+            yield from generic_one_of(validator, one_of_schemas, instance, subschema)
+            return
+
+        prop, tags = discriminator
+        if prop not in instance:
+            yield ValidationError(f"{prop!r} is a required property")
+            return
+
+        tag = instance[prop]
+        index = tags.get(tag) if isinstance(tag, str) else None
+        if index is None:
+            yield from validator.descend(tag, {"enum": list(tags)}, path=prop)
+            return
+
+        yield from validator.descend(
+            instance,
+            one_of_schemas[index],
+            schema_path=index,
         )
 
+    return extend(validator_cls, {"oneOf": one_of})
+
+
+def _build_validator(raw: bytes, schema_path: Path) -> Validator:
     try:
-        with schema_path.open("r", encoding="utf-8") as f:
-            schema = json.load(f)
+        schema = json.loads(raw)
     except Exception as e:
         raise SchemaValidationError(
             f"Unable to load schema '{schema_path}': {e}"
         ) from e
 
-    validator = Draft7Validator(schema)
+    validator_cls = validator_for(schema, default=Draft202012Validator)
 
-    errors = sorted(
-        validator.iter_errors(spec),
-        key=lambda e: e.path
-    )
-    if errors:
-        messages = []
+    try:
+        validator_cls.check_schema(schema)
+    except SchemaError as e:
+        raise SchemaValidationError(
+            f"Invalid schema '{schema_path}': {e.message}"
+        ) from e
 
-        for error in errors:
-            path = ".".join(str(p) for p in error.path)
-            location = f"at '{path}'" if path else "at root"
+    return _with_discriminators(validator_cls, schema)(schema)
 
-            messages.append(
-                f"{location}: {error.message}"
-            )
 
+def _file_key(path: Path) -> Optional[Tuple[str, int, int]]:
+    try:
+        resolved = path.resolve()
+        stat = resolved.stat()
+    except OSError:
+        return None
+    return (str(resolved), stat.st_mtime_ns, stat.st_size)
+
+
+def get_schema_validator(schema_path: str | Path) -> Validator:
+    """
+    Retourne le validateur compilé d'un schéma (mis en cache).
+
+    :raises SchemaValidationError: si le schéma est introuvable ou invalide
+    """
+    schema_path = Path(schema_path)
+
+    key = _file_key(schema_path)
+    if key is None:
         raise SchemaValidationError(
-            "Schema validation failed:\n"
-            + "\n".join(f"- {m}" for m in messages)
+            f"Schema file not found: {schema_path}"
+        )
+
+    with _REGISTRY_LOCK:
+        digest = _SCHEMA_HASHES.get(key)
+        if digest is not None:
+            return _VALIDATORS[digest]
+
+        try:
+            raw = schema_path.read_bytes()
+        except OSError as e:
+            raise SchemaValidationError(
+                f"Unable to load schema '{schema_path}': {e}"
+            ) from e
+
+        digest = hashlib.sha256(raw).hexdigest()
+        validator = _VALIDATORS.get(digest)
+        if validator is None:
+            validator = _build_validator(raw, schema_path)
+            _VALIDATORS[digest] = validator
+
+        _SCHEMA_HASHES[key] = digest
+        return validator
+
+
+def schema_digest(schema_path: str | Path) -> str:
+    """
+    Empreinte sha256 du schéma (mise en cache avec son validateur).
+    """
+    schema_path = Path(schema_path)
+    get_schema_validator(schema_path)
+    return _SCHEMA_HASHES[_file_key(schema_path)]
+
+
+def get_def_validator(schema_path: str | Path, def_name: str) -> Validator:
+    """
+    Validateur d'un sous-schéma "$defs/<def_name>" ; les $ref internes
+    restent résolus contre le schéma complet.
+    """
+    root_validator = get_schema_validator(schema_path)
+    key = (schema_digest(schema_path), def_name)
+
+    with _REGISTRY_LOCK:
+        validator = _DEF_VALIDATORS.get(key)
+        if validator is None:
+            root = root_validator.schema
+            if def_name not in root.get("$defs", {}):
+                raise SchemaValidationError(
+                    f"Schema '{schema_path}' has no $defs/{def_name}"
+                )
+            wrapper = {"$defs": root["$defs"], "$ref": f"#/$defs/{def_name}"}
+            if "$schema" in root:
+                wrapper["$schema"] = root["$schema"]
+            validator_cls = validator_for(root, default=Draft202012Validator)
+            validator = _with_discriminators(validator_cls, wrapper)(wrapper)
+            _DEF_VALIDATORS[key] = validator
+        return validator
+
+
+def get_compiled_validator(schema_path: str | Path) -> Optional[ModuleType]:
+    """
+    Retourne le module généré par `tc-spec compile-schema` pour ce
+    schéma, ou None s'il est absent ou périmé.
+    """
+    schema_path = Path(schema_path)
+    digest = schema_digest(schema_path)
+
+    module_path = compiled_validator_path(schema_path)
+    key = _file_key(module_path)
+    if key is None:
+        return None
+
+    with _REGISTRY_LOCK:
+        module = _COMPILED.get(key)
+        if module is None:
+            spec = importlib.util.spec_from_file_location(
+                f"_tc_spec_compiled_{hashlib.sha1(key[0].encode()).hexdigest()}",
+                module_path,
+            )
+            module = importlib.util.module_from_spec(spec)
+            try:
+                spec.loader.exec_module(module)
+            except Exception as e:
+                logger.warning(
+                    "Schema: ignoring compiled validator '%s' (%s)",
+                    module_path,
+                    e,
+                )
+                return None
+            _COMPILED[key] = module
+
+    if getattr(module, "SCHEMA_SHA256", None) != digest:
+        logger.info(
+            "Schema: compiled validator '%s' is out of date, using jsonschema",
+            module_path,
+        )
+        return None
+    return module
+
+
+def clear_schema_cache() -> None:
+    """
+    Vide le registre des validateurs compilés.
+    """
+    with _REGISTRY_LOCK:
+        _SCHEMA_HASHES.clear()
+        _VALIDATORS.clear()
+        _DEF_VALIDATORS.clear()
+        _COMPILED.clear()
+
+
+def iter_schema_errors(
+    spec: Dict[str, Any],
+    schema_path: str | Path,
+) -> List[Tuple[Tuple[Any, ...], str]]:
+    """
+    Retourne les erreurs (path, message) triées par chemin, via le
+    validateur compilé s'il est à jour, sinon via jsonschema.
+    """
+    compiled = get_compiled_validator(schema_path)
+    if compiled is not None:
+        errors = compiled.iter_errors(spec)
+    else:
+        validator = get_schema_validator(schema_path)
+        errors = [
+            (tuple(error.path), error.message)
+            for error in validator.iter_errors(spec)
+        ]
+    return sorted(errors, key=lambda e: [str(p) for p in e[0]])
+
+
+def format_schema_errors(errors: List[Tuple[Tuple[Any, ...], str]]) -> str:
+    """
+    Message d'erreur lisible, une ligne par erreur (path, message).
+    """
+    messages = []
+
+    for error_path, message in errors:
+        path = ".".join(str(p) for p in error_path)
+        location = f"at '{path}'" if path else "at root"
+
+        messages.append(
+            f"{location}: {message}"
+        )
+
+    return (
+        "Schema validation failed:\n"
+        + "\n".join(f"- {m}" for m in messages)
+    )
+
+
+def validate_spec_schema(
+    spec: Dict[str, Any],
+    schema_path: str | Path,
+    by_subtree: bool = False,
+    workers: Optional[int] = None,
+) -> None:
+    """
+    Valide un Spec sérialisé contre le JSON Schema officiel.
+
+    :param spec: dictionnaire Python (Spec.to_dict())
+    :param schema_path: chemin vers le fichier schema JSON
+    :param by_subtree: valide sections / listes / anomalies une à une,
+        avec cache par contenu et pool de processus (voir
+        subtree_validation)
+    :param workers: taille du pool en mode by_subtree
+    :raises SchemaValidationError: si invalide
+    """
+
+    if by_subtree:
+        from tc_spec.validation.subtree_validation import (
+            iter_subtree_schema_errors,
         )
+        errors = iter_subtree_schema_errors(spec, schema_path, workers)
+    else:
+        errors = iter_schema_errors(spec, schema_path)
+    if errors:
+        raise SchemaValidationError(format_schema_errors(errors))
@@ -0,0 +1,254 @@
+"""
+TC Insight – Validation JSON Schema en flux
+
+Valide un spec JSON sur disque sans le charger en entier : le fichier
+est lu par blocs, et chaque entrée des tables découpables (s.<code>,
+l.<code>, a.<code>) est décodée, validée contre son $defs puis
+abandonnée dès qu'elle est complète. La mémoire reste bornée par le
+plus gros sous-arbre (ex: une liste SKU / AREA), pas par le fichier.
+
+Le reste du spec (squelette : n, v, extra…) est validé à la fin contre
+le schéma racine, les tables découpées y étant remplacées par {}.
+"""
+
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Dict, List, TextIO
+
+from tc_spec.utils.errors import SchemaValidationError
+from tc_spec.validation.schema_validation import (
+    format_schema_errors,
+    get_schema_validator,
+    iter_schema_errors,
+)
+from tc_spec.validation.subtree_validation import (
+    SchemaIssue,
+    def_errors,
+    root_errors,
+    subtree_defs,
+)
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = " \t\n\r"
+# Caractères structurants d'un objet / tableau, et fin d'une chaîne
+_STRUCTURAL_RE = re.compile(r'["{}\[\]]')
+_STRING_END_RE = re.compile(r'["\\]')
+_SCALAR_END_RE = re.compile(r"[,\]}\s]")
+
+
+class _JsonStream:
+    """
+    Lecteur JSON incrémental minimal : délimite une valeur complète dans
+    le tampon (chaînes et imbrication), puis la décode avec json.
+    Seul le préfixe déjà consommé est libéré lors des lectures.
+    """
+
+    def __init__(self, fp: TextIO, source: str, chunk_size: int = CHUNK_SIZE):
+        self._fp = fp
+        self._source = source
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        # Octets (UTF-8) du préfixe déjà libéré, pour situer les erreurs
+        self._consumed = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._fp.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._consumed += len(self._buf[:self._pos].encode("utf-8"))
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _error(self, message: str, offset: int = 0) -> SchemaValidationError:
+        return SchemaValidationError(
+            f"Invalid JSON in '{self._source}' at byte offset "
+            f"{self._consumed + len(self._buf[:self._pos + offset].encode('utf-8'))}: "
+            f"{message}"
+        )
+
+    def peek(self) -> str:
+        """Premier caractère significatif suivant ('' en fin de fichier)."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise self._error(f"expected {char!r}, found {found or 'end of file'!r}")
+        self._pos += 1
+
+    def _search(self, pattern: re.Pattern, offset: int) -> re.Match | None:
+        # Recherche à partir de `offset` (relatif à la valeur en cours),
+        # en lisant de nouveaux blocs si nécessaire.
+        while True:
+            match = pattern.search(self._buf, self._pos + offset)
+            if match is not None:
+                return match
+            offset = max(offset, len(self._buf) - self._pos)
+            if not self._fill():
+                return None
+
+    def _string_end(self, offset: int) -> int:
+        while True:
+            match = self._search(_STRING_END_RE, offset)
+            if match is None:
+                raise self._error("unterminated string")
+            offset = match.start() - self._pos
+            if match.group() == '"':
+                return offset + 1
+            # Échappement : le caractère suivant est ignoré
+            offset += 2
+
+    def _value_end(self) -> int:
+        first = self.peek()
+        if not first:
+            raise self._error("unexpected end of file")
+
+        if first == '"':
+            return self._string_end(1)
+
+        if first not in "{[":
+            match = self._search(_SCALAR_END_RE, 1)
+            return (match.start() - self._pos) if match else len(self._buf) - self._pos
+
+        depth = 0
+        offset = 0
+        while True:
+            match = self._search(_STRUCTURAL_RE, offset)
+            if match is None:
+                raise self._error("unexpected end of file")
+            offset = match.start() - self._pos
+            char = match.group()
+            if char == '"':
+                offset = self._string_end(offset + 1)
+                continue
+            depth += 1 if char in "{[" else -1
+            offset += 1
+            if depth == 0:
+                return offset
+
+    def value(self) -> Any:
+        """Décode la valeur suivante et avance après elle."""
+        end = self._value_end()
+        text = self._buf[self._pos:self._pos + end]
+        try:
+            value, index = self._decoder.raw_decode(text)
+        except json.JSONDecodeError as e:
+            raise self._error(e.msg, e.pos) from e
+        if index != len(text):
+            raise self._error("unexpected data", index)
+        self._pos += end
+        return value
+
+    def members(self):
+        """Itère les clés d'un objet ; l'appelant lit chaque valeur."""
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise self._error("expected property name")
+            key = self.value()
+            self.expect(":")
+            yield key
+            separator = self.peek()
+            if separator == "}":
+                self._pos += 1
+                return
+            self.expect(",")
+
+    def end(self) -> None:
+        if self.peek():
+            raise self._error("extra data after JSON document")
+
+
+def iter_file_schema_errors(
+    json_path: str | Path,
+    schema_path: str | Path,
+    chunk_size: int = CHUNK_SIZE,
+) -> List[SchemaIssue]:
+    """
+    Valide un spec JSON en flux et retourne les erreurs (path, message)
+    triées par chemin, identiques à celles d'une validation complète.
+
+    :raises SchemaValidationError: si le fichier est illisible ou n'est
+        pas du JSON valide
+    """
+    json_path = Path(json_path)
+    schema_path = str(schema_path)
+    root = get_schema_validator(schema_path).schema
+    splittable = subtree_defs(root)
+
+    try:
+        fp = json_path.open("r", encoding="utf-8")
+    except OSError as e:
+        raise SchemaValidationError(f"Unable to read '{json_path}': {e}") from e
+
+    errors: List[SchemaIssue] = []
+    with fp:
+        stream = _JsonStream(fp, str(json_path), chunk_size)
+
+        if stream.peek() != "{":
+            # Document non-objet : rien à découper
+            document = stream.value()
+            stream.end()
+            return iter_schema_errors(document, schema_path)
+
+        skeleton: Dict[str, Any] = {}
+        subtrees = 0
+        for key in stream.members():
+            def_name = splittable.get(key)
+            if def_name is None or stream.peek() != "{":
+                skeleton[key] = stream.value()
+                continue
+
+            skeleton[key] = {}
+            for code in stream.members():
+                entry = {code: stream.value()}
+                errors.extend(
+                    ((key,) + path, message)
+                    for path, message in def_errors(schema_path, def_name, entry)
+                )
+                subtrees += 1
+        stream.end()
+
+    errors.extend(root_errors(schema_path, skeleton))
+    logger.debug(
+        "Schema: streamed %d subtrees from '%s'",
+        subtrees,
+        json_path,
+    )
+    return sorted(errors, key=lambda e: [str(p) for p in e[0]])
+
+
+def validate_spec_file(
+    json_path: str | Path,
+    schema_path: str | Path,
+    chunk_size: int = CHUNK_SIZE,
+) -> None:
+    """
+    Valide un fichier spec JSON contre le JSON Schema officiel, en flux.
+
+    :raises SchemaValidationError: si invalide
+    """
+    errors = iter_file_schema_errors(json_path, schema_path, chunk_size)
+    if errors:
+        raise SchemaValidationError(format_schema_errors(errors))
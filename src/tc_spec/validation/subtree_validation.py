@@ -0,0 +1,198 @@
+"""
+TC Insight – Validation JSON Schema par sous-arbre
+
+Les grandes collections du spec (s, l, a) sont découpées par entrée :
+chaque section, liste ou anomalie est validée seule contre son $defs
+(sections, lists, anomalies), le reste du spec (squelette) contre le
+schéma racine.
+
+Le résultat de chaque sous-arbre est mis en cache par empreinte de son
+contenu : une section inchangée n'est pas revalidée. Les sous-arbres
+absents du cache sont validés dans un pool de processus lorsqu'ils sont
+assez nombreux. Les erreurs sont ré-enracinées sur le chemin complet
+(ex: s.V.p.0.50.t.0).
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from tc_spec.model.fingerprint import content_hash
+from tc_spec.validation.schema_validation import (
+    get_compiled_validator,
+    get_def_validator,
+    get_schema_validator,
+    schema_digest,
+)
+
+logger = logging.getLogger(__name__)
+
+SchemaIssue = Tuple[Tuple[Any, ...], str]
+
+# En dessous de ce nombre de sous-arbres à valider, le coût de démarrage
+# du pool dépasse le gain.
+PARALLEL_MIN_SUBTREES = 64
+SUBTREE_CACHE_SIZE = 16384
+
+# (empreinte schéma, $defs, empreinte contenu) -> erreurs relatives
+_SUBTREE_CACHE: "OrderedDict[Tuple[str, str, str], Tuple[SchemaIssue, ...]]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def subtree_defs(root: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Propriétés racine découpables : celles qui référencent un $defs de
+    type « table » (entrées indépendantes, sans contrainte globale).
+    """
+    splittable = {}
+    for prop, subschema in root.get("properties", {}).items():
+        ref = subschema.get("$ref", "") if isinstance(subschema, dict) else ""
+        if not ref.startswith("#/$defs/") or len(subschema) != 1:
+            continue
+        def_name = ref[len("#/$defs/"):]
+        definition = root.get("$defs", {}).get(def_name, {})
+        is_table = (
+            "patternProperties" in definition
+            or isinstance(definition.get("additionalProperties"), dict)
+        )
+        has_global_constraint = any(
+            k in definition
+            for k in ("properties", "required", "minProperties", "maxProperties", "propertyNames")
+        )
+        if is_table and not has_global_constraint:
+            splittable[prop] = def_name
+    return splittable
+
+
+def def_errors(schema_path: str, def_name: str, instance: Any) -> List[SchemaIssue]:
+    """
+    Erreurs d'une instance validée contre la définition $defs/def_name
+    (validateur compilé s'il existe), chemins relatifs à l'instance.
+    """
+    compiled = get_compiled_validator(schema_path)
+    if compiled is not None and def_name in getattr(compiled, "DEFS", {}):
+        errors: List[SchemaIssue] = []
+        compiled.DEFS[def_name](instance, (), errors)
+        return errors
+
+    validator = get_def_validator(schema_path, def_name)
+    return [(tuple(e.path), e.message) for e in validator.iter_errors(instance)]
+
+
+def root_errors(schema_path: str, instance: Any) -> List[SchemaIssue]:
+    """
+    Erreurs d'une instance validée contre la racine du schéma.
+    """
+    compiled = get_compiled_validator(schema_path)
+    if compiled is not None:
+        return compiled.iter_errors(instance)
+    validator = get_schema_validator(schema_path)
+    return [(tuple(e.path), e.message) for e in validator.iter_errors(instance)]
+
+
+def _validate_batch(
+    schema_path: str,
+    batch: List[Tuple[str, Any]],
+) -> List[List[SchemaIssue]]:
+    # Exécuté dans un processus du pool : chaque entrée est validée
+    # comme une table à une seule clé.
+    return [
+        def_errors(schema_path, def_name, entry)
+        for def_name, entry in batch
+    ]
+
+
+def _cache_get(key):
+    with _CACHE_LOCK:
+        errors = _SUBTREE_CACHE.get(key)
+        if errors is not None:
+            _SUBTREE_CACHE.move_to_end(key)
+        return errors
+
+
+def _cache_put(key, errors):
+    with _CACHE_LOCK:
+        _SUBTREE_CACHE[key] = tuple(errors)
+        _SUBTREE_CACHE.move_to_end(key)
+        while len(_SUBTREE_CACHE) > SUBTREE_CACHE_SIZE:
+            _SUBTREE_CACHE.popitem(last=False)
+
+
+def clear_subtree_cache() -> None:
+    with _CACHE_LOCK:
+        _SUBTREE_CACHE.clear()
+
+
+def iter_subtree_schema_errors(
+    spec: Dict[str, Any],
+    schema_path: str | Path,
+    workers: Optional[int] = None,
+) -> List[SchemaIssue]:
+    """
+    Valide le spec sous-arbre par sous-arbre et retourne les erreurs
+    (path, message) sur leur chemin complet, triées par chemin.
+
+    :param workers: taille du pool pour les sous-arbres hors cache
+        (défaut: nombre de CPU ; 1 = séquentiel)
+    """
+    schema_path = str(schema_path)
+    digest = schema_digest(schema_path)
+    root = get_schema_validator(schema_path).schema
+    splittable = subtree_defs(root) if isinstance(spec, dict) else {}
+
+    # Squelette : les tables découpées sont remplacées par des tables vides
+    skeleton = dict(spec) if isinstance(spec, dict) else spec
+    entries: List[Tuple[Tuple[Any, ...], str, Dict[str, Any]]] = []
+    for prop, def_name in splittable.items():
+        table = spec.get(prop)
+        if not isinstance(table, dict):
+            continue
+        skeleton[prop] = {}
+        for code, value in table.items():
+            entries.append(((prop,), def_name, {code: value}))
+
+    errors: List[SchemaIssue] = list(root_errors(schema_path, skeleton))
+
+    misses = []
+    for prefix, def_name, entry in entries:
+        key = (digest, def_name, content_hash(entry))
+        cached = _cache_get(key)
+        if cached is None:
+            misses.append((prefix, def_name, entry, key))
+        else:
+            errors.extend((prefix + path, message) for path, message in cached)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    batch = [(def_name, entry) for _, def_name, entry, _ in misses]
+    if workers > 1 and len(misses) >= PARALLEL_MIN_SUBTREES:
+        chunk = -(-len(batch) // workers)
+        chunks = [batch[i:i + chunk] for i in range(0, len(batch), chunk)]
+        logger.debug(
+            "Schema: validating %d subtrees in %d workers",
+            len(batch),
+            len(chunks),
+        )
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = [
+                result
+                for chunk_results in pool.map(
+                    _validate_batch,
+                    [schema_path] * len(chunks),
+                    chunks,
+                )
+                for result in chunk_results
+            ]
+    else:
+        results = _validate_batch(schema_path, batch)
+
+    for (prefix, _, _, key), subtree_errors in zip(misses, results):
+        _cache_put(key, subtree_errors)
+        errors.extend((prefix + path, message) for path, message in subtree_errors)
+
+    return sorted(errors, key=lambda e: [str(p) for p in e[0]])
@@ -0,0 +1,89 @@
+import pandas as pd
+import pytest
+
+from tc_spec.model import Condition, ListItem, Question, Rule, Section, Spec, SpecList
+
+
+def _valid_sheets():
+    return {
+        "QUESTIONS": pd.DataFrame([
+            {
+                "section": "V",
+                "q_num": "50",
+                "label": "Q_V_50",
+                "lang_SYS": "How many units?",
+            }
+        ]),
+        "QUESTION_TYPES": pd.DataFrame([
+            {
+                "section": "V",
+                "q_num": "50",
+                "type": "N",
+            }
+        ]),
+        "SECTIONS": pd.DataFrame([
+            {
+                "section_code": "V",
+                "section_label": "Volume",
+                "order": 1,
+            }
+        ]),
+        "LISTS": pd.DataFrame([
+            {
+                "list_code": "LST-TEST",
+                "value": "A",
+                "lang_SYS": "Option A",
+            }
+        ]),
+        "VISIBILITY_RULES": pd.DataFrame([
+            {
+                "target_type": "question",
+                "target_ref": "V-50",
+                "r_ref": "I-10",
+                "operator": "=",
+                "value_type": "v",
+                "value": "YES",
+            }
+        ]),
+        "ANOMALIES": pd.DataFrame([
+            {
+                "anomaly_code": "ANO-A1",
+                "weight": 10,
+            }
+        ]),
+    }
+
+
+def _model_spec():
+    questions = [
+        Question("V-10", "V-10", {"SYS": "?"}, {"t": "O", "o": "LST-AB"}),
+        Question(
+            "V-20", "V-20", {"SYS": "?"}, {"t": "N"},
+            visibility=[Rule(condition=Condition("V-10", "=", "v", "A"))],
+        ),
+    ]
+    return Spec(
+        name="Spec",
+        version="2.0.0",
+        sections={
+            "V": Section("V", "Volume", questions),
+            "W": Section("W", "Wholesale", [Question("W-10", "W-10", {"SYS": "?"}, {"t": "N"})]),
+        },
+        lists={"LST-AB": SpecList("LST-AB", [ListItem("A", {"SYS": "A"})])},
+    )
+
+
+@pytest.fixture
+def machine_first_sheets():
+    """
+    Feuilles machine-first minimales et valides (nouvelle copie à chaque appel).
+    """
+    return _valid_sheets
+
+
+@pytest.fixture
+def make_model_spec():
+    """
+    Petit Spec (deux sections, une liste) construit à chaque appel.
+    """
+    return _model_spec
@@ -0,0 +1,72 @@
+import pandas as pd
+
+from tc_spec.builder import build_anomalies, build_rules
+from tc_spec.excel_mapper.anomalies_mapper import map_anomalies
+
+
+def make_anomalies_sheet():
+    # Raw "Anomalies" sheet loaded with header=None
+    rows = [
+        [None, None, None, None, None, None, None],
+        ["ANOMALY ID", "Anomaly\nWeight", "Type", "QUESTION ID", "CONSTRAINT", "VALUE", "COMPARED QUESTION"],
+        ["ANO-A", 1, "AND", "I-130", "=", "ON TRADE", None],
+        [None, None, "(OR", "V-50-'1'", "<", 0, None],
+        [None, None, "OR)", "V-50-'1'", ">", 150, None],
+        [None, None, None, None, None, None, None],
+        ["ANO-G", 2, None, "V-60", ">", None, "I-140"],
+        [None, None, None, None, None, None, None],
+        ["ANO-I", None, None, "I-130", "=", "RTM", None],
+        [None, None, None, None, None, None, None],
+        ["ANO-F", 1, None, "(E-70) - (P-70)", "<", 300, None],
+    ]
+    return pd.DataFrame(rows)
+
+
+def test_map_anomalies_builds_rules_with_or_groups_and_answer_comparisons():
+    anomalies_df, rules_df = map_anomalies({"Anomalies": make_anomalies_sheet()})
+
+    # ANO-I désactivée (pas de poids), ANO-F non exprimable
+    assert anomalies_df["anomaly_code"].tolist() == ["ANO-A", "ANO-G"]
+
+    ano_a = rules_df[rules_df["target_ref"] == "ANO-A"]
+    assert ano_a["r_ref"].tolist() == ["I-130", "V-50-'1'", "V-50-'1'"]
+    assert ano_a["or_group"].isna().tolist() == [True, False, False]
+
+    ano_g = rules_df[rules_df["target_ref"] == "ANO-G"].iloc[0]
+    assert ano_g["value_type"] == "a"
+    assert ano_g["value"] == "I-140"
+
+    anomalies = build_anomalies(anomalies_df, build_rules(rules_df))
+    assert anomalies["ANO-A"].to_dict() == {
+        "w": 1,
+        "r": [
+            {
+                "or": [
+                    {"r": "V-50-'1'", "o": "<", "t": "v", "v": 0},
+                    {"r": "V-50-'1'", "o": ">", "t": "v", "v": 150},
+                ]
+            },
+            {"r": "I-130", "o": "=", "t": "v", "v": "ON TRADE"},
+        ],
+    }
+
+
+def test_range_codes_are_expanded_into_one_anomaly_per_sku(caplog):
+    rows = [
+        ["ANOMALY ID", "Anomaly\nWeight", "Type", "QUESTION ID", "CONSTRAINT", "VALUE", "COMPARED QUESTION"],
+        ["ANO-A1..A3", 1, "AND", "I-130", "=", "ON TRADE", None],
+        [None, None, "(OR", "V-50-'1'", "<", 0, None],
+        [None, None, "OR)", "V-50-'1'", ">", 150, None],
+        [None, None, None, None, None, None, None],
+        ["ANO-B1..B3", 1, None, "V-50-'2'", ">", 300, None],
+    ]
+
+    anomalies_df, rules_df = map_anomalies({"Anomalies": pd.DataFrame(rows)})
+
+    assert anomalies_df["anomaly_code"].tolist() == ["ANO-A1", "ANO-A2", "ANO-A3"]
+    ano_a3 = rules_df[rules_df["target_ref"] == "ANO-A3"]
+    assert ano_a3["r_ref"].tolist() == ["I-130", "V-50-'3'", "V-50-'3'"]
+    assert ano_a3["or_group"].nunique() == 1
+    assert rules_df.groupby("target_ref")["or_group"].first().nunique() == 3
+    # Conditions sur un autre SKU que le premier de la plage : ambigu
+    assert "'ANO-B1..B3' skipped, cannot expand range code" in caplog.text
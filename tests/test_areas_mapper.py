@@ -0,0 +1,54 @@
+import pandas as pd
+import pytest
+
+from tc_spec.excel_mapper.areas_mapper import map_areas_to_lists
+from tc_spec.utils.errors import ExcelValidationError
+
+
+def make_area_sheets(lv2_parents):
+    # Raw AREA sheets loaded with header=None
+    area_lv1_raw = pd.DataFrame(
+        {
+            0: [None, "SEQ ID", 1, 2, 3],
+            1: [None, "ID", "CAM1", " CAM2 ", None],
+            2: [None, "Name -Reporting", "Adamaoua", "Centre", "Orphan"],
+        }
+    )
+    area_lv2_raw = pd.DataFrame(
+        {
+            0: [None, "SEQ ID", 1, 2, 3],
+            1: [None, "ID", "CAM_LV2_1", "CAM_LV2_2", "CAM_LV2_3"],
+            2: [None, "Name -Reporting", "Mayo-Banyo", "Vina", "Mfoundi"],
+            3: [None, "Level 1 ID", *lv2_parents],
+        }
+    )
+    return {
+        "AREA Level 1": area_lv1_raw,
+        "AREA Level 2": area_lv2_raw,
+    }
+
+
+def test_map_areas_to_lists_builds_hierarchy():
+    sheets = make_area_sheets(["CAM1", "CAM1", "CAM2"])
+
+    lists_df = map_areas_to_lists(sheets)
+
+    lv1 = lists_df[lists_df["list_code"] == "LST-AREA-LV1"]
+    assert lv1["value"].tolist() == ["CAM1", "CAM2"]
+    assert lv1["order"].tolist() == [1, 2]
+    assert lv1["parent"].isna().all()
+
+    lv2 = lists_df[lists_df["list_code"] == "LST-AREA-LV2"]
+    assert lv2["parent"].tolist() == ["CAM1", "CAM1", "CAM2"]
+    assert lv2["order"].tolist() == [1, 2, 3]
+
+
+def test_map_areas_to_lists_reports_every_invalid_parent():
+    sheets = make_area_sheets(["CAM9", "CAM1", None])
+
+    with pytest.raises(ExcelValidationError) as exc:
+        map_areas_to_lists(sheets)
+
+    message = str(exc.value)
+    assert "Invalid parent 'CAM9' for 'CAM_LV2_1'" in message
+    assert "Missing parent value in AREA Level 2 for 'CAM_LV2_3'" in message
@@ -0,0 +1,55 @@
+import pandas as pd
+import pytest
+
+from tc_spec.builder import build_back_checks
+from tc_spec.excel_mapper.back_checks_mapper import map_back_checks
+from tc_spec.utils.errors import ExcelValidationError
+
+
+def make_back_checks_sheet(extra_rows=()):
+    # Raw "Back Checking Rules" sheet loaded with header=None
+    rows = [
+        ["Rule", None, "Rule In words", "QUESTION ID"],
+        ["Number of enumerators", "20-25", "Estimated", None],
+        ["Number of team leaders (assigned to 1 team max)", 2, None, None],
+        ["Activate Field Back checkers ", "NO", None, None],
+        ["Activate Field Back checkers", "NO", None, None],
+        ["Tolerance", 10, None, "V-50,60"],
+        ["What devices will be used by sales reps", None, None, None],
+        *extra_rows,
+    ]
+    return pd.DataFrame(rows)
+
+
+def test_back_checks_are_deduplicated_and_indexed_by_question():
+    df = map_back_checks({"Back Checking Rules": make_back_checks_sheet()})
+
+    back_checks = build_back_checks(df)
+
+    assert back_checks.rules == {
+        "enumerators": "20-25",
+        "team_leaders": 2,
+        "field_bc": False,
+    }
+    assert back_checks.by_question == {
+        "V-50": {"tolerance": 10},
+        "V-60": {"tolerance": 10},
+    }
+    assert back_checks.for_question("V-60")["tolerance"] == 10
+    assert back_checks.for_question("V-60")["field_bc"] is False
+    assert back_checks.for_question("A-10") is back_checks.rules
+
+
+def test_conflicting_back_checks_are_reported_together():
+    sheet = make_back_checks_sheet([
+        ["Activate Field Back checkers", "YES", None, None],
+        ["Tolerance", 5, None, "V-60"],
+    ])
+    df = map_back_checks({"Back Checking Rules": sheet})
+
+    with pytest.raises(ExcelValidationError) as exc:
+        build_back_checks(df)
+
+    message = str(exc.value)
+    assert "'field_bc'" in message
+    assert "'tolerance' (V-60)" in message
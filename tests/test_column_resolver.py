@@ -0,0 +1,39 @@
+import pandas as pd
+
+from tc_spec.excel_mapper.columns import ColumnResolver
+from tc_spec.excel_mapper.questions_mapper import map_questions
+
+
+def test_column_resolver_ignores_case_and_whitespace_and_keeps_alias_priority():
+    resolver = ColumnResolver({
+        "code": ["Code", "ID"],
+        "visible_enumerator": ["Visible ENUMERATOR"],
+    })
+    df = pd.DataFrame(columns=["ID", "code", "visible   enumerator"])
+
+    cols = resolver.resolve(df)
+
+    assert cols == {"code": "code", "visible_enumerator": "visible   enumerator"}
+    assert resolver.resolve(df) is cols  # cached per header
+    assert resolver.column(df, "missing") is None
+
+
+def test_map_questions_accepts_header_spelling_variants():
+    sheets = {
+        "Sheet1": pd.DataFrame(
+            [
+                {
+                    "ID": "V-50",
+                    "Question / Action Detail": "How many units?",
+                    "answer type": "Numeric",
+                    "VISIBLE  ENUMERATOR": "Yes",
+                    "Visible Bc": "Yes",
+                }
+            ]
+        )
+    }
+
+    df = map_questions(sheets)
+
+    assert df.loc[0, "type"] == "N"
+    assert df.loc[0, "roles"] == "e,b"
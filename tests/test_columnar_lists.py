@@ -0,0 +1,78 @@
+import pandas as pd
+import pytest
+
+from tc_spec.builder import build_lists
+from tc_spec.model import ColumnarSpecList, Question, Section, Spec
+from tc_spec.utils.errors import SpecError
+from tc_spec.validation.cross_references import SymbolTable
+
+
+def make_lists_df():
+    return pd.DataFrame({
+        "list_code": ["LST-AREA"] * 3 + ["LST-YN"] * 2,
+        "value": ["C1", "C2", 3, "Y", "N"],
+        "order": [1, 2, 3, 1, 2],
+        "lang_SYS": ["Centre", "Est", "Nord", "Yes", "No"],
+        "lang_FR": ["Centre", None, "Nord", "Oui", "Non"],
+        "parent": ["R1", "R1", "R2", None, None],
+    })
+
+
+def test_large_lists_are_columnar_with_the_same_output():
+    df = make_lists_df()
+
+    rows = build_lists(df)
+    columnar = build_lists(df, columnar_threshold=2)
+
+    assert isinstance(columnar["LST-AREA"], ColumnarSpecList)
+    assert not isinstance(columnar["LST-YN"], ColumnarSpecList)
+    assert columnar["LST-AREA"].to_list() == rows["LST-AREA"].to_list()
+    assert columnar["LST-AREA"].to_list()[1] == {"v": "C2", "n": {"SYS": "Est"}, "p": "R1"}
+
+
+def test_columnar_list_index_and_parents():
+    lst = build_lists(make_lists_df(), columnar_threshold=0)["LST-AREA"]
+
+    assert len(lst) == 3
+    assert lst.position("3") == 2 and lst.position("X") is None
+    assert "C1" in lst
+    assert lst.parents == ["R1", "R1", "R2"]
+    assert [item.value for item in lst.items] == ["C1", "C2", "3"]
+
+
+def test_columnar_list_keeps_duplicate_and_label_checks():
+    with pytest.raises(SpecError, match="duplicate value 'A'"):
+        ColumnarSpecList("LST-X", ["A", "B", "A"], {"SYS": ["a", "b", "c"]})
+    with pytest.raises(SpecError, match="labels must be a non-empty dict"):
+        ColumnarSpecList("LST-X", ["A", "B"], {"SYS": ["a", None]})
+    with pytest.raises(SpecError, match="one entry per value"):
+        ColumnarSpecList("LST-X", ["A", "B"], {"SYS": ["a"]})
+
+
+def test_columnar_lists_are_used_by_the_symbol_table():
+    lists = build_lists(make_lists_df(), columnar_threshold=0)
+    spec = Spec(
+        name="Spec",
+        version="2.0.0",
+        sections={"V": Section("V", "V", [Question("V-10", "V-10", {"SYS": "?"}, {"t": "N"})])},
+        lists=lists,
+    )
+
+    assert SymbolTable(spec).lists["LST-AREA"] == {"C1", "C2", "3"}
+    assert spec.to_dict()["l"]["LST-YN"][0] == {"v": "Y", "n": {"SYS": "Yes", "FR": "Oui"}}
+
+
+def test_columnar_list_reassignment_is_checked_and_reindexed():
+    lst = ColumnarSpecList("LST-X", ["a", "b"], {"SYS": ["A", "B"]})
+    before = lst.to_list()
+
+    lst.values = ["x", "y"]
+
+    assert "a" not in lst and lst.position("y") == 1
+    assert lst.to_list() != before
+
+    with pytest.raises(SpecError, match="one entry per value"):
+        lst.values = ["x"]
+    with pytest.raises(SpecError, match="duplicate value 'x'"):
+        lst.values = ["x", "x"]
+    assert lst.values == ["x", "y"] and lst.position("x") == 0
@@ -0,0 +1,114 @@
+import pandas as pd
+import pytest
+
+from tc_spec.builder import build_questions
+from tc_spec.excel_mapper.constraints_mapper import (
+    join_constraints,
+    map_constraints,
+    parse_answer_type_constraints,
+)
+from tc_spec.utils.errors import ExcelValidationError
+
+
+def make_constraint_sheet():
+    # Raw "Constraint" sheet loaded with header=None
+    return pd.DataFrame([
+        ["Answer Options", None, "JSON Builders"],
+        ["TEXT", None, "Name"],
+        ["MULTIPLE SELECTION (min 1, max 2)", None, "list-start"],
+        ["MULTIPLE SELECTION\xa0(max 3)", None, None],
+        ["MULITPLE SELECTION (allow to insert numbers)", None, None],
+        ["NUMERICAL (0 to 7)", None, None],
+        ["TEXT (regex ^[0-9]{3,9}$)", None, None],
+    ])
+
+
+def test_constraints_are_joined_on_answer_type():
+    constraints = map_constraints({"Constraint": make_constraint_sheet()})
+    question_types = pd.DataFrame([
+        {"section": "W", "q_num": "10", "type": "C", "answer_type": "Multiple selection (max 3)"},
+        {"section": "W", "q_num": "20", "type": "N", "answer_type": "NUMERICAL (0 to 7)", "max": 5},
+        {"section": "W", "q_num": "30", "type": "T", "answer_type": "TEXT (regex ^[0-9]{3,9}$)"},
+        {"section": "W", "q_num": "40", "type": "T", "answer_type": "TEXT"},
+    ], index=[10, 11, 12, 13])
+
+    joined = join_constraints(question_types, constraints)
+
+    assert joined.index.tolist() == [10, 11, 12, 13]
+    assert pd.isna(joined.loc[10, "min"])
+    assert joined.loc[10, "max"] == 3
+    assert joined.loc[11, "min"] == 0
+    assert joined.loc[11, "max"] == 5  # valeur explicite prioritaire
+    assert joined.loc[12, "regex"] == "^[0-9]{3,9}$"
+    assert joined.loc[13, ["min", "max", "regex"]].isna().all()
+
+
+def test_invalid_regexes_are_reported_together():
+    questions = pd.DataFrame([
+        {"section": "W", "q_num": "10", "label": "W-10", "lang_SYS": "Code"},
+        {"section": "W", "q_num": "20", "label": "W-20", "lang_SYS": "Phone"},
+        {"section": "W", "q_num": "30", "label": "W-30", "lang_SYS": "Zip"},
+    ])
+    question_types = pd.DataFrame([
+        {"section": "W", "q_num": "10", "type": "T", "regex": "[0-9"},
+        {"section": "W", "q_num": "20", "type": "T", "regex": "(+33"},
+        {"section": "W", "q_num": "30", "type": "T", "regex": "^[0-9]{5}$"},
+    ])
+
+    with pytest.raises(ExcelValidationError) as exc:
+        build_questions(questions, question_types, {})
+
+    message = str(exc.value)
+    assert "2 error(s)" in message
+    assert "W-10" in message and "W-20" in message
+
+
+@pytest.mark.parametrize("answer_type, expected", [
+    ("NUMERICAL (0 to 10, default 5)", {"min": 0, "max": 10, "default": 5}),
+    ("NUMERICAL (default 2.5)", {"default": 2.5}),
+    ("TEXT (default N/A)", {"default": "N/A"}),
+    ("SINGLE SELECTION (limit 1)", {"choice_limit": 1}),
+])
+def test_clauses_are_parsed_as_numbers_when_possible(answer_type, expected):
+    assert parse_answer_type_constraints(answer_type) == expected
+
+
+def test_constraints_are_mapped_onto_the_schema_keys_of_each_type():
+    questions = pd.DataFrame([
+        {"section": "W", "q_num": q, "label": f"W-{q}", "lang_SYS": "?"}
+        for q in ("10", "20", "30")
+    ])
+    question_types = pd.DataFrame([
+        {"section": "W", "q_num": "10", "type": "N", "min": 0.0, "max": 10.0, "default": 5},
+        {"section": "W", "q_num": "20", "type": "T", "default": 5, "regex": "^[0-9]+$"},
+        {"section": "W", "q_num": "30", "type": "O", "list_code": "LST-A", "choice_limit": 1.0},
+    ])
+
+    questions = build_questions(questions, question_types, {})
+
+    assert questions["W-10"].qtype == {"t": "N", "-": 0, "+": 10, "d": 5}
+    assert questions["W-20"].qtype == {"t": "T", "d": "5", "regex": "^[0-9]+$"}
+    assert questions["W-30"].qtype == {"t": "O", "c": 1, "o": "LST-A"}
+
+
+def test_constraints_outside_the_schema_are_reported_with_the_regexes():
+    questions = pd.DataFrame([
+        {"section": "W", "q_num": q, "label": f"W-{q}", "lang_SYS": "?"}
+        for q in ("10", "20", "30", "40")
+    ])
+    question_types = pd.DataFrame([
+        {"section": "W", "q_num": "10", "type": "C", "list_code": "LST-A", "choice_limit": 3},
+        {"section": "W", "q_num": "20", "type": "O", "list_code": "LST-A", "choice_limit": 2},
+        {"section": "W", "q_num": "30", "type": "N", "default": "abc"},
+        {"section": "W", "q_num": "40", "type": "T", "regex": "[0-9"},
+    ])
+
+    with pytest.raises(ExcelValidationError) as exc:
+        build_questions(questions, question_types, {})
+
+    message = str(exc.value)
+    assert "4 error(s)" in message
+    assert "W-10: choice_limit 3.0 not allowed for type 'C'" in message
+    assert "W-20: choice_limit 2.0 must be 1" in message
+    assert "W-30: default 'abc' must be a number" in message
+    assert "W-40: invalid regex" in message
@@ -0,0 +1,81 @@
+import pytest
+
+from tc_spec.model import (
+    Anomaly,
+    Condition,
+    ListItem,
+    Question,
+    Rule,
+    Section,
+    Spec,
+    SpecList,
+)
+from tc_spec.utils.errors import ModelError
+from tc_spec.validation import validate_cross_references
+from tc_spec.validation.cross_references import iter_cross_reference_errors
+
+
+def rule(ref, operator="=", value="A", value_type="v"):
+    return Rule(condition=Condition(ref, operator, value_type, value))
+
+
+def make_spec(visibility=None, anomaly_rules=None, list_code="LST-AB"):
+    questions = [
+        Question("V-10", "V-10", {"SYS": "?"}, {"t": "O", "o": list_code}),
+        Question("V-20", "V-20", {"SYS": "?"}, {"t": "N"}, visibility=visibility),
+    ]
+    lists = {
+        "LST-AB": SpecList(
+            "LST-AB",
+            [ListItem("A", {"SYS": "A"}), ListItem("1", {"SYS": "One"})],
+        ),
+    }
+    anomalies = {}
+    if anomaly_rules:
+        anomalies["ANO-1"] = Anomaly("ANO-1", 1, anomaly_rules)
+    return Spec(
+        name="Spec",
+        version="2.0.0",
+        sections={"V": Section("V", "Volume", questions)},
+        lists=lists,
+        anomalies=anomalies,
+    )
+
+
+def test_valid_references_pass():
+    spec = make_spec(
+        visibility=[rule("V-10", "e", "A"), rule("V-10", "=", 1)],
+        anomaly_rules=[rule("V-20", ">", 5), rule("V-10-'1'", "<", 0)],
+    )
+
+    assert iter_cross_reference_errors(spec) == []
+    validate_cross_references(spec)
+
+
+def test_all_broken_references_are_reported_in_one_pass():
+    spec = make_spec(
+        visibility=[
+            rule("X-99"),
+            Rule(or_conditions=[
+                Condition("V-10", "=", "v", "A"),
+                Condition("V-10", "!", "v", "Z"),
+            ]),
+        ],
+        anomaly_rules=[rule("V-20", ">", "W-1", value_type="a")],
+        list_code="LST-MISSING",
+    )
+    spec.lists["LST-MISSING-TOO"] = []
+
+    assert iter_cross_reference_errors(spec) == [
+        "question 'V-10': unknown list 'LST-MISSING'",
+        "question 'V-20': unknown question 'X-99'",
+        "anomaly 'ANO-1': unknown answer reference 'W-1' (rule on 'V-20')",
+    ]
+
+    spec.sections["V"].questions[0].qtype["o"] = "LST-AB"
+    with pytest.raises(ModelError) as exc:
+        validate_cross_references(spec)
+
+    message = str(exc.value)
+    assert "(3 error(s))" in message
+    assert "value 'Z' is not in list 'LST-AB' of question 'V-10'" in message
@@ -94,3 +94,42 @@ def test_invalid_anomaly_weight():
 
     with pytest.raises(ExcelValidationError):
         validate_excel(sheets)
+
+def test_errors_report_first_offending_row():
+    sheets = make_valid_sheets()
+    sheets["VISIBILITY_RULES"] = pd.concat(
+        [sheets["VISIBILITY_RULES"]] * 3,
+        ignore_index=True,
+    )
+    sheets["VISIBILITY_RULES"].loc[1, "value_type"] = "x"
+    sheets["VISIBILITY_RULES"].loc[2, "operator"] = "~"
+
+    with pytest.raises(ExcelValidationError, match=r"Invalid value_type 'x' \(row 1\)"):
+        validate_excel(sheets)
+
+def test_question_without_any_label_fails():
+    sheets = make_valid_sheets()
+    sheets["QUESTIONS"]["lang_EN"] = None
+    sheets["QUESTIONS"].loc[0, "lang_SYS"] = None
+
+    with pytest.raises(ExcelValidationError, match=r"no label in any language \(row 0\)"):
+        validate_excel(sheets)
+
+def test_row_errors_of_a_sheet_are_reported_in_one_pass():
+    sheets = make_valid_sheets()
+    sheets["VISIBILITY_RULES"] = pd.concat(
+        [sheets["VISIBILITY_RULES"]] * 3,
+        ignore_index=True,
+    )
+    sheets["VISIBILITY_RULES"].loc[1, "operator"] = "~"
+    sheets["VISIBILITY_RULES"].loc[2, "target_type"] = "page"
+    sheets["VISIBILITY_RULES"].loc[2, "value_type"] = "x"
+
+    with pytest.raises(ExcelValidationError) as exc:
+        validate_excel(sheets)
+
+    message = str(exc.value)
+    assert "3 invalid value(s)" in message
+    assert "Invalid operator '~' (row 1)" in message
+    assert "Invalid target_type 'page' (row 2)" in message
+    assert "Invalid value_type 'x' (row 2)" in message
@@ -0,0 +1,64 @@
+import json
+
+from tc_spec.exporter import export_spec_to_json
+from tc_spec.model import Condition, ListItem, Question, Rule, Section, SpecList
+from tc_spec.validation.schema_validation import validate_spec_schema
+
+SCHEMA = "schemas/spec_v2.schema.json"
+
+
+def test_equal_content_gives_equal_fingerprints(make_model_spec):
+    one, two = make_model_spec(), make_model_spec()
+
+    assert one.fingerprint() == two.fingerprint()
+    assert len(one.fingerprint()) == 32
+    assert one.sections["V"].fingerprint() != one.sections["W"].fingerprint()
+
+
+def test_a_change_only_rehashes_its_branch(make_model_spec):
+    spec = make_model_spec()
+    before = spec.fingerprint()
+    other_section = spec.sections["W"].fingerprint()
+    untouched = spec.sections["V"].questions[0].fingerprint()
+
+    spec.sections["V"].questions[1].texts = {"SYS": "How many?"}
+
+    assert spec.fingerprint() != before
+    assert spec.sections["W"].fingerprint() == other_section
+    assert spec.sections["V"].questions[0].fingerprint() == untouched
+
+
+def test_section_hash_depends_on_its_question_hashes_and_order(make_model_spec):
+    section = make_model_spec().sections["V"]
+    reordered = Section("V", "Volume", list(reversed(section.questions)))
+
+    assert reordered.fingerprint() != section.fingerprint()
+
+
+def test_changed_nodes_lists_only_mismatched_subtrees(make_model_spec):
+    old, new = make_model_spec(), make_model_spec()
+    new.sections["V"].questions[1].visibility = [
+        Rule(condition=Condition("V-10", "=", "v", "B"))
+    ]
+    new.lists = {
+        "LST-AB": SpecList("LST-AB", [ListItem("A", {"SYS": "A"})]),
+        "LST-C": SpecList("LST-C", [ListItem("C", {"SYS": "C"})]),
+    }
+    new.sections["W"] = Section(
+        "W", "Wholesale", [Question("W-10", "W-10", {"SYS": "?"}, {"t": "N"})]
+    )
+
+    assert old.changed_nodes(make_model_spec()) == []
+    assert old.changed_nodes(new) == ["s/V", "s/V/V-20", "l/LST-C"]
+
+
+def test_fingerprint_is_exported_as_optional_metadata(make_model_spec, tmp_path):
+    spec = make_model_spec()
+    path = tmp_path / "spec.json"
+
+    export_spec_to_json(spec, path, fingerprint=True)
+    data = json.loads(path.read_text(encoding="utf-8"))
+
+    assert data["meta"] == {"fp": spec.fingerprint()}
+    assert "meta" not in spec.to_dict()
+    validate_spec_schema(data, SCHEMA)
@@ -0,0 +1,60 @@
+import copy
+import json
+
+import pytest
+
+from tc_spec.model.fragments import thaw
+
+
+def test_repeated_calls_reuse_the_cached_fragment(make_model_spec):
+    spec = make_model_spec()
+
+    first = spec.to_dict()
+
+    assert spec.to_dict() is first
+    assert json.loads(json.dumps(first)) == first
+
+
+def test_reassigning_a_field_rebuilds_only_the_changed_branch(make_model_spec):
+    spec = make_model_spec()
+    before = spec.to_dict()
+    other_section = before["s"]["W"]
+    items = before["l"]["LST-AB"]
+
+    spec.sections["V"].questions[0].label = "V-10 Brand"
+    after = spec.to_dict()
+
+    assert after is not before
+    assert after["s"]["V"]["p"][0]["10"]["label"] == "V-10 Brand"
+    assert after["s"]["W"] is other_section
+    assert after["l"]["LST-AB"] is items
+    assert after["s"]["V"]["p"][1] == before["s"]["V"]["p"][1]
+
+
+def test_in_place_mutations_need_an_explicit_invalidate(make_model_spec):
+    spec = make_model_spec()
+    spec.to_dict()
+    section = spec.sections["V"]
+
+    section.questions[1].texts["EN"] = "How many?"
+    assert "EN" not in spec.to_dict()["s"]["V"]["p"][1]["20"]["n"]
+
+    section.questions[1].invalidate()
+    assert spec.to_dict()["s"]["V"]["p"][1]["20"]["n"]["EN"] == "How many?"
+
+
+def test_fragments_are_read_only(make_model_spec):
+    data = make_model_spec().to_dict()
+
+    with pytest.raises(TypeError):
+        data["n"] = "Other"
+    with pytest.raises(TypeError):
+        data["s"]["V"]["p"].append({})
+    with pytest.raises(TypeError):
+        data["s"]["V"]["p"][0]["10"]["n"].update(EN="?")
+
+    mutable = thaw(data)
+    mutable["s"]["V"]["p"].append({})
+    copied = copy.deepcopy(data)
+    copied["l"]["LST-AB"].clear()
+    assert len(data["s"]["V"]["p"]) == 2 and data["l"]["LST-AB"]
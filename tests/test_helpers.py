@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+
+from tc_spec.utils.helpers import normalize_frame, normalize_str
+
+
+def test_normalize_frame_strips_text_and_keeps_numbers():
+    raw = pd.DataFrame(
+        {
+            0: ["  A-10 ", np.nan, "", "   ", 1, 2.5],
+            1: [None, "Yes ", " No", None, None, None],
+        },
+        dtype=object,
+    )
+
+    df = normalize_frame(raw)
+
+    assert df[0].tolist() == ["A-10", None, None, None, 1, 2.5]
+    assert df[1].tolist() == [None, "Yes", "No", None, None, None]
+    # Les helpers donnent le même résultat sur l'entrée brute ou normalisée
+    assert [normalize_str(v) for v in raw[0]] == [
+        normalize_str(v) for v in df[0]
+    ]
@@ -0,0 +1,67 @@
+import pandas as pd
+import pytest
+
+from tc_spec.builder import build_rules
+from tc_spec.builder.interning import RuleInterner
+
+
+def test_identical_conditions_and_rules_are_shared():
+    interner = RuleInterner()
+    parsed = [
+        {"r": "A-10", "o": "=", "v": "Yes"},
+        {"or": [{"r": "A-10", "o": "=", "v": "Yes"}, {"r": "A-20", "o": ">", "v": 1}]},
+    ]
+
+    first = interner.from_parsed(parsed)
+    second = interner.from_parsed(parsed)
+
+    assert first[0] is second[0] and first[1] is second[1]
+    assert first[1].or_conditions[0] is first[0].condition
+    assert interner.stats() == {"conditions": 2, "rules": 2}
+    assert [rule.to_dict() for rule in first] == [
+        {"r": "A-10", "o": "=", "t": "v", "v": "Yes"},
+        {"or": [
+            {"r": "A-10", "o": "=", "t": "v", "v": "Yes"},
+            {"r": "A-20", "o": ">", "t": "v", "v": 1},
+        ]},
+    ]
+
+
+def test_values_of_different_types_are_not_merged():
+    interner = RuleInterner()
+
+    conditions = [interner.condition("A-10", "=", "v", v) for v in (1, 1.0, True, "1")]
+
+    assert [c.value for c in conditions] == [1, 1.0, True, "1"]
+    assert [type(c.value) for c in conditions] == [int, float, bool, str]
+
+
+def test_shared_instances_are_immutable():
+    rule = RuleInterner().from_parsed([{"r": "A-10", "o": "=", "v": "Yes"}])[0]
+
+    with pytest.raises(AttributeError):
+        rule.condition.value = "No"
+    with pytest.raises(AttributeError):
+        rule.condition = None
+
+    or_rule = RuleInterner().from_parsed([
+        {"or": [{"r": "A-10", "o": "=", "v": "Yes"}, {"r": "A-20", "o": "=", "v": "No"}]},
+    ])[0]
+    assert isinstance(or_rule.or_conditions, tuple)
+    with pytest.raises(AttributeError):
+        or_rule.or_conditions.append(rule.condition)
+
+
+def test_build_rules_shares_conditions_across_targets():
+    df = pd.DataFrame({
+        "target_type": ["question", "question", "section"],
+        "target_ref": ["V-10", "V-20", "W"],
+        "r_ref": ["A-10"] * 3,
+        "operator": ["="] * 3,
+        "value_type": ["v"] * 3,
+        "value": ["Yes"] * 3,
+    })
+
+    rules = build_rules(df, RuleInterner())
+
+    assert rules["question:V-10"][0] is rules["question:V-20"][0] is rules["section:W"][0]
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from tc_spec.builder import build_lists
+from tc_spec.model import ListItem, Question, Section, Spec, SpecList
+from tc_spec.utils.errors import SpecError
+from tc_spec.validation.schema_validation import iter_schema_errors
+
+SCHEMA_PATH = Path(__file__).parent.parent / "schemas" / "spec_v2.schema.json"
+
+
+def make_area_df():
+    return pd.DataFrame({
+        "list_code": ["LST-AREA-LV1"] * 2 + ["LST-AREA-LV2"] * 4,
+        "value": ["R1", "R2", "D1", "D2", "D3", "D4"],
+        "order": [1, 2, 1, 2, 3, 4],
+        "lang_SYS": ["North", "South", "A", "B", "C", "D"],
+        "parent": [None, None, "R1", "R2", "R1", "R2"],
+    })
+
+
+def make_spec(lists):
+    question = Question("V-10", "V-10", {"SYS": "?"}, {"t": "O", "o": "LST-AREA-LV2"})
+    return Spec(
+        name="Spec",
+        version="2.0.0",
+        sections={"V": Section("V", "Volume", [question])},
+        lists=lists,
+    )
+
+
+@pytest.mark.parametrize("columnar_threshold", [1000, 0])
+def test_children_are_grouped_and_indexed(columnar_threshold):
+    lists = build_lists(make_area_df(), columnar_threshold=columnar_threshold)
+
+    data = make_spec(lists).to_dict()
+
+    assert [(i["v"], i.get("p")) for i in data["l"]["LST-AREA-LV2"]] == [
+        ("D1", "R1"), ("D3", "R1"), ("D2", "R2"), ("D4", "R2"),
+    ]
+    assert "p" not in data["l"]["LST-AREA-LV1"][0]
+    assert data["lc"] == {"LST-AREA-LV2": {"R1": [0, 2], "R2": [2, 4]}}
+    assert list(iter_schema_errors(data, SCHEMA_PATH)) == []
+
+
+def test_children_index_slices_the_list():
+    lst = build_lists(make_area_df())["LST-AREA-LV2"]
+
+    start, end = lst.children_index()["R2"]
+
+    assert [item.value for item in lst.items[start:end]] == ["D2", "D4"]
+
+
+def test_flat_lists_have_no_index():
+    lists = {"LST-YN": SpecList("LST-YN", [ListItem("Y", {"SYS": "Yes"})])}
+
+    assert "lc" not in make_spec(lists).to_dict()
+
+
+def test_scattered_children_are_rejected():
+    items = [
+        ListItem("D1", {"SYS": "A"}, parent="R1"),
+        ListItem("D2", {"SYS": "B"}, parent="R2"),
+        ListItem("D3", {"SYS": "C"}, parent="R1"),
+    ]
+
+    with pytest.raises(SpecError, match="children of parent 'R1' must be contiguous"):
+        SpecList("LST-AREA-LV2", items)
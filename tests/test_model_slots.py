@@ -0,0 +1,54 @@
+import pytest
+
+from tc_spec.model import (
+    Anomaly,
+    BackCheckRules,
+    Condition,
+    ListItem,
+    Question,
+    Rule,
+    Section,
+    Spec,
+    SpecList,
+)
+
+
+def make_objects():
+    condition = Condition("V-10", "=", "v", "A")
+    rule = Rule(condition=condition)
+    item = ListItem("A", {"SYS": "A"})
+    question = Question("V-10", "V-10", {"SYS": "?"}, {"t": "O", "o": "LST-A"})
+    section = Section("V", "Volume", [question])
+    return [
+        condition,
+        rule,
+        item,
+        SpecList("LST-A", [item]),
+        question,
+        section,
+        Anomaly("ANO-1", 1, [rule]),
+        BackCheckRules({"field_bc": False}),
+        Spec(name="Spec", version="2.0.0", sections={"V": section}),
+    ]
+
+
+@pytest.mark.parametrize("obj", make_objects(), ids=lambda o: type(o).__name__)
+def test_model_objects_have_no_instance_dict(obj):
+    assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        obj.unknown_attribute = 1
+
+
+def test_slotted_objects_keep_their_dict_output():
+    question = Question(
+        "V-10", "V-10", {"SYS": "?"}, {"t": "N"},
+        roles=["e"], visibility=[Rule(condition=Condition("V-5", ">", "v", 1))],
+    )
+
+    assert question.to_dict() == {
+        "n": {"SYS": "?"},
+        "label": "V-10",
+        "t": [{"t": "N"}],
+        "o": ["e"],
+        "v": [{"r": "V-5", "o": ">", "t": "v", "v": 1}],
+    }
@@ -0,0 +1,77 @@
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from tc_spec.utils.errors import SchemaValidationError
+from tc_spec.validation import get_schema_validator
+from tc_spec.validation.schema_compiler import compile_schema, compiled_validator_path
+from tc_spec.validation.schema_validation import (
+    get_compiled_validator,
+    iter_schema_errors,
+)
+
+SCHEMA_PATH = Path(__file__).parent.parent / "schemas" / "spec_v2.schema.json"
+
+
+def make_spec():
+    return {
+        "n": "TC Insight Test",
+        "v": "2.0",
+        "extra": True,
+        "s": {
+            "V": {
+                "n": "Volume",
+                "p": [
+                    {"50": {"label": "V-50", "n": {}, "t": [{"t": "N", "+": "x"}]}},
+                    {"60": {"label": "V-60", "n": {"SYS": "?"}, "t": [{"t": "X"}], "o": ["z"]}},
+                    {"70": {"label": "V-70", "n": {"SYS": "?"}, "t": [{"t": "O"}]}},
+                ],
+                "v": [{"r": "V-50", "o": "~", "t": "v", "v": 1}, {"or": []}],
+            },
+            "bad": {"n": "x", "p": []},
+        },
+        "l": {"LST-A": [{"v": "A"}]},
+        "a": {"ANO-1": {"w": 1.0, "r": []}},
+    }
+
+
+@pytest.fixture
+def compiled_schema(tmp_path):
+    schema_file = tmp_path / "spec_v2.schema.json"
+    shutil.copy(SCHEMA_PATH, schema_file)
+    compile_schema(schema_file)
+    return schema_file
+
+
+def test_compiled_validator_reports_same_errors_as_jsonschema(compiled_schema):
+    module = get_compiled_validator(compiled_schema)
+    assert module is not None
+
+    spec = make_spec()
+    expected = sorted(
+        ((tuple(e.path), e.message) for e in get_schema_validator(SCHEMA_PATH).iter_errors(spec)),
+        key=lambda e: [str(p) for p in e[0]],
+    )
+
+    assert expected
+    assert iter_schema_errors(spec, compiled_schema) == expected
+
+
+def test_out_of_date_compiled_validator_is_ignored(compiled_schema):
+    schema = json.loads(compiled_schema.read_text(encoding="utf-8"))
+    schema["properties"]["v"]["pattern"] = "^.*$"
+    compiled_schema.write_text(json.dumps(schema), encoding="utf-8")
+
+    assert compiled_validator_path(compiled_schema).exists()
+    assert get_compiled_validator(compiled_schema) is None
+    assert not any(path == ("v",) for path, _ in iter_schema_errors(make_spec(), compiled_schema))
+
+
+def test_unsupported_keyword_fails_compilation(tmp_path):
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(json.dumps({"type": "object", "if": {"required": ["a"]}}), encoding="utf-8")
+
+    with pytest.raises(SchemaValidationError, match="unsupported keyword"):
+        compile_schema(schema_file)
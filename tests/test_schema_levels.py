@@ -0,0 +1,95 @@
+from pathlib import Path
+
+import pytest
+
+from tc_spec.cli import create_parser
+from tc_spec.utils.errors import SchemaValidationError
+from tc_spec.validation.schema_levels import validate_spec_level
+from tc_spec.validation import subtree_validation
+from tc_spec.validation.schema_validation import iter_schema_errors
+
+SCHEMA_PATH = Path(__file__).parent.parent / "schemas" / "spec_v2.schema.json"
+
+
+@pytest.mark.parametrize("level", ["off", "structural", "full", "subtree", "sampled"])
+def test_valid_spec_passes_every_level(make_model_spec, level):
+    elapsed = validate_spec_level(make_model_spec(), SCHEMA_PATH, level, sample_rate=1.0)
+
+    assert isinstance(elapsed, float) and elapsed >= 0
+
+
+def test_structural_checks_type_discriminator_and_lists(make_model_spec):
+    spec = make_model_spec()
+    spec.sections["V"].questions[0].qtype = {"t": "O"}
+    spec.sections["V"].questions[1].qtype = {"t": "Z"}
+
+    with pytest.raises(SchemaValidationError) as exc:
+        validate_spec_level(spec, SCHEMA_PATH, "structural")
+
+    message = str(exc.value)
+    assert "(2 error(s))" in message
+    assert "question 'V-10': type 'O' requires ['o']" in message
+    assert "question 'V-20': unknown type t='Z'" in message
+
+
+def test_full_sample_reports_the_same_errors_as_full(make_model_spec):
+    spec = make_model_spec()
+    spec.sections["V"].questions[0].qtype = {"t": "O"}
+    expected = [
+        f"at '{'.'.join(str(p) for p in path)}': {message}"
+        for path, message in iter_schema_errors(spec.to_dict(), SCHEMA_PATH)
+    ]
+
+    with pytest.raises(SchemaValidationError) as full:
+        validate_spec_level(spec, SCHEMA_PATH, "full")
+    with pytest.raises(SchemaValidationError) as subtree:
+        validate_spec_level(spec, SCHEMA_PATH, "subtree")
+    with pytest.raises(SchemaValidationError) as sampled:
+        validate_spec_level(spec, SCHEMA_PATH, "sampled", sample_rate=1.0, seed=0)
+
+    assert expected
+    assert str(subtree.value) == str(full.value)
+    for error in expected:
+        assert error in str(full.value)
+        assert error in str(sampled.value)
+
+
+def test_subtree_level_revalidates_only_changed_subtrees(make_model_spec, monkeypatch):
+    subtree_validation.clear_subtree_cache()
+    spec = make_model_spec()
+    validate_spec_level(spec, SCHEMA_PATH, "subtree")
+
+    validated = []
+    original = subtree_validation._validate_batch
+
+    def spy(schema_path, batch):
+        validated.extend(entry for _, entry in batch)
+        return original(schema_path, batch)
+
+    monkeypatch.setattr(subtree_validation, "_validate_batch", spy)
+    spec.sections["W"].name = "Changed"
+
+    validate_spec_level(spec, SCHEMA_PATH, "subtree")
+
+    assert validated == [{"W": spec.to_dict()["s"]["W"]}]
+    subtree_validation.clear_subtree_cache()
+
+
+def test_unknown_level_is_rejected(make_model_spec):
+    with pytest.raises(SchemaValidationError, match="Invalid schema validation level"):
+        validate_spec_level(make_model_spec(), SCHEMA_PATH, "partial")
+
+
+@pytest.mark.parametrize("rate", [0, -0.5, 1.5, float("nan"), "0.5"])
+def test_sampled_level_rejects_rates_outside_zero_one(make_model_spec, rate):
+    with pytest.raises(SchemaValidationError, match="Invalid sample rate"):
+        validate_spec_level(make_model_spec(), SCHEMA_PATH, "sampled", sample_rate=rate)
+
+
+@pytest.mark.parametrize("rate", ["nan", "0", "2", "x"])
+def test_cli_rejects_invalid_sample_rate(rate):
+    with pytest.raises(SystemExit):
+        create_parser().parse_args(
+            ["generate", "--excel", "a.xlsx", "--schema", "s.json", "--out", "o.json",
+             "--sample-rate", rate]
+        )
@@ -1,7 +1,12 @@
+import json
+import os
+
 import pytest
 from pathlib import Path
 
-from tc_spec.validation import validate_spec_schema
+from jsonschema import Draft202012Validator
+
+from tc_spec.validation import get_schema_validator, validate_spec_schema
 from tc_spec.utils.errors import SchemaValidationError
 
 SCHEMA_PATH = Path(__file__).parent.parent / "schemas" / "spec_v2.schema.json"
@@ -93,3 +98,54 @@ def test_invalid_sections_structure():
 
     with pytest.raises(SchemaValidationError):
         validate_spec_schema(invalid_spec, SCHEMA_PATH)
+
+def test_schema_validator_is_compiled_once_per_schema(tmp_path):
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(SCHEMA_PATH.read_text(encoding="utf-8"), encoding="utf-8")
+
+    validator = get_schema_validator(schema_file)
+
+    assert validator.META_SCHEMA == Draft202012Validator.META_SCHEMA
+    assert get_schema_validator(schema_file) is validator
+
+    # Fichier touché sans changement de contenu : même validateur
+    stat = schema_file.stat()
+    os.utime(schema_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert get_schema_validator(schema_file) is validator
+
+    # Contenu modifié : nouveau validateur
+    schema = json.loads(schema_file.read_text(encoding="utf-8"))
+    schema["title"] = "Changed"
+    schema_file.write_text(json.dumps(schema), encoding="utf-8")
+    assert get_schema_validator(schema_file) is not validator
+
+def test_invalid_schema_is_rejected(tmp_path):
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(json.dumps({"type": 12}), encoding="utf-8")
+
+    with pytest.raises(SchemaValidationError, match="Invalid schema"):
+        validate_spec_schema({}, schema_file)
+
+def test_question_type_is_dispatched_on_its_discriminator():
+    def spec_with_type(qtype):
+        return {
+            "n": "Spec",
+            "v": "2.0.0",
+            "s": {"V": {"n": "Volume", "p": [
+                {"50": {"label": "V-50", "n": {"SYS": "?"}, "t": [qtype]}},
+            ]}},
+        }
+
+    with pytest.raises(SchemaValidationError) as exc:
+        validate_spec_schema(spec_with_type({"t": "X"}), SCHEMA_PATH)
+    assert str(exc.value).splitlines()[1:] == [
+        "- at 's.V.p.0.50.t.0.t': 'X' is not one of "
+        "['O', 'T', 'TM', 'N', 'C', 'I', 'A', '-']"
+    ]
+
+    with pytest.raises(SchemaValidationError) as exc:
+        validate_spec_schema(spec_with_type({"t": "O", "c": 2}), SCHEMA_PATH)
+    assert str(exc.value).splitlines()[1:] == [
+        "- at 's.V.p.0.50.t.0': 'o' is a required property",
+        "- at 's.V.p.0.50.t.0.c': 2 is not one of [1]",
+    ]
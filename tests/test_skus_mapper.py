@@ -0,0 +1,42 @@
+import pandas as pd
+
+from tc_spec.excel_mapper.skus_mapper import map_skus_to_lists
+
+
+def test_sku_sheet_loaded_without_header_is_mapped():
+    # Simulate a raw "V70 SKU" sheet loaded with header=None
+    sheets = {
+        "V70 SKU": pd.DataFrame(
+            {
+                0: [None, "SKU", "S1", "S2", None],
+                1: [None, "Label", "Aspen", " Winston ", "Orphan"],
+            }
+        )
+    }
+
+    lists_df = map_skus_to_lists(sheets)
+
+    assert lists_df["list_code"].unique().tolist() == ["LST-SKU-V70"]
+    assert lists_df["value"].tolist() == ["S1", "S2"]
+    assert lists_df["lang_SYS"].tolist() == ["Aspen", "Winston"]
+    assert lists_df["order"].tolist() == [1, 2]
+
+
+def test_sku_catalog_sheet_is_split_into_blocks():
+    sheets = {
+        "Volume & Price List": pd.DataFrame(
+            {
+                0: [None, "V-50", 1, 2, None, "V-60", "V60SKU1", "V60SKU2", 27],
+                1: [None, "Categories", "Tobacco", "Shisa", None, "Tobacco", "Aspen", "Winston", None],
+            }
+        )
+    }
+
+    lists_df = map_skus_to_lists(sheets)
+
+    v50 = lists_df[lists_df["list_code"] == "LST-SKU-V50"]
+    assert v50["value"].tolist() == ["1", "2"]
+
+    v60 = lists_df[lists_df["list_code"] == "LST-SKU-V60"]
+    assert v60["value"].tolist() == ["V60SKU1", "V60SKU2"]
+    assert v60["order"].tolist() == [1, 2]
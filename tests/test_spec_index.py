@@ -0,0 +1,55 @@
+from tc_spec.model import Condition, Question, Rule, Section, Spec
+
+
+def rule(ref, value="A"):
+    return Rule(condition=Condition(ref, "=", "v", value))
+
+
+def make_spec():
+    a10 = Question("A-10", "A-10", {"SYS": "?"}, {"t": "O", "o": "LST-YES-NO"})
+    a20 = Question(
+        "A-20", "A-20", {"SYS": "?"}, {"t": "O", "o": "LST-YES-NO"},
+        visibility=[rule("A-10"), Rule(or_conditions=[
+            Condition("A-10", "=", "v", "B"),
+            Condition("V-50-'1'-1", ">", "v", 0),
+        ])],
+    )
+    v50 = Question("V-50", "V-50", {"SYS": "?"}, {"t": "N"}, visibility=[rule("A-10")])
+    return Spec(
+        name="Spec",
+        version="2.0.0",
+        sections={
+            "A": Section("A", "Start", [a10, a20]),
+            "V": Section("V", "Volume", [v50]),
+        },
+    )
+
+
+def test_questions_are_found_by_ref():
+    spec = make_spec()
+
+    assert spec.question("V-50").ref == "V-50"
+    assert spec.question("V-50-'1'-1").ref == "V-50"
+    assert spec.question("X-99") is None
+    assert spec.question_position("A-20") == ("A", 1)
+
+
+def test_dependents_and_list_users():
+    spec = make_spec()
+
+    assert [q.ref for q in spec.dependents("A-10")] == ["A-20", "V-50"]
+    assert [q.ref for q in spec.dependents("V-50")] == ["A-20"]
+    assert spec.dependents("A-20") == ()
+    assert [q.ref for q in spec.list_users("LST-YES-NO")] == ["A-10", "A-20"]
+    assert spec.list_users("LST-OTHER") == ()
+
+
+def test_indexes_are_built_once_and_follow_mutations():
+    spec = make_spec()
+    index = spec._lookup()
+
+    assert spec._lookup() is index
+
+    spec.sections["V"].questions[0].visibility = []
+    assert spec._lookup() is not index
+    assert [q.ref for q in spec.dependents("A-10")] == ["A-20"]
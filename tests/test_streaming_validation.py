@@ -0,0 +1,60 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from tc_spec.utils.errors import SchemaValidationError
+from tc_spec.validation import validate_spec_file
+from tc_spec.validation.schema_validation import iter_schema_errors
+from tc_spec.validation.streaming_validation import iter_file_schema_errors
+
+SCHEMA_PATH = Path(__file__).parent.parent / "schemas" / "spec_v2.schema.json"
+
+
+def make_spec():
+    return {
+        "n": 'Spec "quoted" \\ {braces} [brackets]',
+        "v": "2.0.0",
+        "extra": {"nested": [1, {"x": None}]},
+        "s": {
+            "V": {
+                "n": "Volume",
+                "p": [
+                    {"50": {"label": "V-50", "n": {"SYS": "é}"}, "t": [{"t": "N"}]}},
+                    {"60": {"label": "V-60", "n": {"SYS": "?"}, "t": [{"t": "O"}]}},
+                ],
+            },
+        },
+        "l": {"LST-A": [{"v": "A", "n": {}}], "LST-B": []},
+        "a": {},
+    }
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1 << 16])
+def test_streamed_errors_match_full_validation(tmp_path, chunk_size):
+    spec = make_spec()
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text(json.dumps(spec, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    errors = iter_file_schema_errors(spec_file, SCHEMA_PATH, chunk_size=chunk_size)
+
+    assert errors == iter_schema_errors(spec, SCHEMA_PATH)
+    assert (("s", "V", "p", 1, "60", "t", 0), "'o' is a required property") in errors
+
+
+def test_malformed_json_reports_offset(tmp_path):
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text('{"n": "x", "s": {"V": [1,}}', encoding="utf-8")
+
+    with pytest.raises(SchemaValidationError, match=r"Invalid JSON in .* at byte offset 25"):
+        validate_spec_file(spec_file, SCHEMA_PATH, chunk_size=4)
+
+
+def test_error_offsets_count_bytes_of_non_ascii_text(tmp_path):
+    spec_file = tmp_path / "spec.json"
+    text = '{"n": "Époque été", "s": {"V": [1,}}'
+    spec_file.write_text(text, encoding="utf-8")
+    offset = len(text[:text.index("}")].encode("utf-8"))
+
+    with pytest.raises(SchemaValidationError, match=rf"at byte offset {offset}:"):
+        validate_spec_file(spec_file, SCHEMA_PATH, chunk_size=4)
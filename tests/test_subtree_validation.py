@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import pytest
+
+from tc_spec.utils.errors import SchemaValidationError
+from tc_spec.validation import validate_spec_schema
+from tc_spec.validation import subtree_validation
+from tc_spec.validation.schema_validation import iter_schema_errors
+from tc_spec.validation.subtree_validation import (
+    clear_subtree_cache,
+    iter_subtree_schema_errors,
+)
+
+SCHEMA_PATH = Path(__file__).parent.parent / "schemas" / "spec_v2.schema.json"
+
+
+def make_spec():
+    sections = {
+        code: {
+            "n": code,
+            "p": [{"10": {"label": f"{code}-10", "n": {"SYS": "?"}, "t": [{"t": "N"}]}}],
+        }
+        for code in ("A", "B", "C")
+    }
+    sections["B"]["p"][0]["10"]["t"] = [{"t": "O"}]
+    return {
+        "n": "Spec",
+        "v": "2.0.0",
+        "extra": 1,
+        "s": sections,
+        "l": {
+            "LST-A": [{"v": "A", "n": {"SYS": "A"}}],
+            "LST-B": [{"v": "B", "n": {}}],
+        },
+        "a": {"ANO-1": {"w": 0.5, "r": []}},
+    }
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_subtree_cache()
+    yield
+    clear_subtree_cache()
+
+
+def test_subtree_errors_match_full_validation_with_full_paths():
+    spec = make_spec()
+
+    errors = iter_subtree_schema_errors(spec, SCHEMA_PATH, workers=1)
+
+    assert errors == iter_schema_errors(spec, SCHEMA_PATH)
+    assert (("s", "B", "p", 0, "10", "t", 0), "'o' is a required property") in errors
+    assert ("l", "LST-B", 0, "n") in [path for path, _ in errors]
+
+
+def test_unchanged_subtrees_are_served_from_cache(monkeypatch):
+    spec = make_spec()
+    iter_subtree_schema_errors(spec, SCHEMA_PATH, workers=1)
+
+    validated = []
+    original = subtree_validation._validate_batch
+
+    def spy(schema_path, batch):
+        validated.extend(entry for _, entry in batch)
+        return original(schema_path, batch)
+
+    monkeypatch.setattr(subtree_validation, "_validate_batch", spy)
+    spec["s"]["C"]["n"] = "Changed"
+
+    iter_subtree_schema_errors(spec, SCHEMA_PATH, workers=1)
+
+    assert validated == [{"C": spec["s"]["C"]}]
+
+
+def test_cache_misses_can_be_validated_in_a_worker_pool(monkeypatch):
+    monkeypatch.setattr(subtree_validation, "PARALLEL_MIN_SUBTREES", 2)
+    spec = make_spec()
+
+    with pytest.raises(SchemaValidationError) as exc:
+        validate_spec_schema(spec, SCHEMA_PATH, by_subtree=True, workers=2)
+
+    assert "at 's.B.p.0.10.t.0': 'o' is a required property" in str(exc.value)
@@ -0,0 +1,153 @@
+import pandas as pd
+import pytest
+
+from tc_spec.builder import build_lists, build_questions
+from tc_spec.model import ListItem, Question
+from tc_spec.model.trusted import DEBUG_CHECKS_ENV, ValidationToken
+from tc_spec.utils.errors import SpecError
+from tc_spec.utils.report import ValidationReport
+from tc_spec.validation import validate_excel
+
+
+@pytest.fixture
+def make_sheets(machine_first_sheets):
+    def make():
+        sheets = machine_first_sheets()
+        sheets["LISTS"] = pd.DataFrame({
+            "list_code": ["LST-TEST"] * 3,
+            "value": ["A", "B", "C"],
+            "order": [1, 2, 3],
+            "lang_SYS": ["Option A", "Option B", "Option C"],
+            "lang_FR": [None, "Choix B", None],
+        })
+        sheets["QUESTIONS"]["roles"] = "e, b"
+        return sheets
+    return make
+
+
+def build(sheets, token):
+    lists = build_lists(sheets["LISTS"], token=token)
+    questions = build_questions(
+        sheets["QUESTIONS"], sheets["QUESTION_TYPES"], {}, token=token,
+    )
+    return lists, questions
+
+
+def forbid_checks(monkeypatch):
+    def fail(self):
+        raise AssertionError("per-object check ran")
+
+    monkeypatch.setattr(ListItem, "_validate_internal", fail)
+    monkeypatch.setattr(Question, "_validate_internal", fail)
+
+
+def test_validate_excel_issues_a_token_only_when_failing_fast(make_sheets):
+    sheets = make_sheets()
+
+    assert validate_excel(sheets) is not None
+    assert validate_excel(sheets, ValidationReport()) is None
+
+
+def test_trusted_path_skips_per_object_checks_with_the_same_result(make_sheets, monkeypatch):
+    sheets = make_sheets()
+    checked_lists, checked_questions = build(sheets, None)
+    token = validate_excel(sheets)
+
+    forbid_checks(monkeypatch)
+    lists, questions = build(sheets, token)
+
+    assert lists["LST-TEST"].to_list() == checked_lists["LST-TEST"].to_list()
+    assert questions["V-50"].to_dict() == checked_questions["V-50"].to_dict()
+
+
+def test_debug_flag_re_enables_per_object_checks(make_sheets, monkeypatch):
+    sheets = make_sheets()
+    token = validate_excel(sheets)
+    forbid_checks(monkeypatch)
+    monkeypatch.setenv(DEBUG_CHECKS_ENV, "1")
+
+    with pytest.raises(AssertionError, match="per-object check ran"):
+        build(sheets, token)
+
+
+def test_rows_outside_the_token_are_checked(make_sheets, monkeypatch):
+    sheets = make_sheets()
+    token = validate_excel(sheets)
+    other = sheets["LISTS"].set_axis([10, 11, 12])
+
+    forbid_checks(monkeypatch)
+    with pytest.raises(AssertionError):
+        build_lists(other, token=token)
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_checks_left_to_the_builder_raise_the_same_errors(make_sheets, trusted):
+    sheets = make_sheets()
+    sheets["LISTS"].loc[1, ["lang_SYS", "lang_FR"]] = None
+    token = validate_excel(sheets) if trusted else None
+
+    with pytest.raises(SpecError, match="ListItem 'B': labels must be a non-empty dict"):
+        build_lists(sheets["LISTS"], token=token)
+
+    sheets = make_sheets()
+    sheets["QUESTIONS"]["roles"] = "e, x"
+    token = validate_excel(sheets) if trusted else None
+
+    with pytest.raises(SpecError, match="Question V-50: invalid role 'x'"):
+        build_questions(sheets["QUESTIONS"], sheets["QUESTION_TYPES"], {}, token=token)
+
+
+@pytest.mark.parametrize("parents, error", [
+    (["P", "P", "Q"], None),
+    (["P", "", "P"], "ListItem 'B': parent must be a non-empty string"),
+    ([None, "P", None], None),
+])
+def test_trusted_and_checked_paths_agree_on_list_edge_cases(make_sheets, parents, error):
+    results = []
+    for trusted in (False, True):
+        sheets = make_sheets()
+        sheets["LISTS"]["parent"] = parents
+        token = validate_excel(sheets) if trusted else None
+        try:
+            lists = build_lists(sheets["LISTS"], token=token)
+            results.append(lists["LST-TEST"].to_list())
+        except SpecError as e:
+            results.append(str(e))
+
+    assert results[0] == results[1]
+    if error:
+        assert results[0] == error
+
+
+def test_frames_edited_after_validation_are_checked(make_sheets):
+    sheets = make_sheets()
+    token = validate_excel(sheets)
+    lists = sheets["LISTS"].copy()
+    lists.loc[1, "value"] = ""
+    questions = sheets["QUESTIONS"].copy()
+    questions[[c for c in questions.columns if c.startswith("lang_")]] = None
+
+    assert build_lists(sheets["LISTS"].copy(), token=token)
+    with pytest.raises(SpecError, match="ListItem value must be a non-empty string"):
+        build_lists(lists, token=token)
+    with pytest.raises(SpecError, match="Question V-50: texts must be a dict"):
+        build_questions(questions, sheets["QUESTION_TYPES"], {}, token=token)
+
+
+def test_token_is_checked_once_per_sheet(make_sheets, monkeypatch):
+    sheets = make_sheets()
+    sheets["LISTS"] = pd.concat([
+        sheets["LISTS"],
+        sheets["LISTS"].assign(list_code="LST-OTHER"),
+    ], ignore_index=True)
+    token = validate_excel(sheets)
+    calls = []
+    covers = ValidationToken.covers
+    monkeypatch.setattr(
+        ValidationToken, "covers",
+        lambda self, sheet, df: calls.append(sheet) or covers(self, sheet, df),
+    )
+
+    build(sheets, token)
+
+    assert calls == ["LISTS", "QUESTIONS"]
@@ -0,0 +1,67 @@
+import csv
+import json
+
+import pandas as pd
+
+from tc_spec.excel.provenance import field_columns, source_cell, tag_source
+from tc_spec.excel_mapper.questions_utils import with_detected_header
+from tc_spec.utils.report import ValidationReport
+from tc_spec.validation import validate_excel
+
+
+def test_all_excel_issues_are_collected_with_machine_first_cells(machine_first_sheets):
+    sheets = machine_first_sheets()
+    sheets["QUESTIONS"] = pd.concat([sheets["QUESTIONS"]] * 2, ignore_index=True)
+    sheets["LISTS"].loc[0, "list_code"] = "TEST"
+    sheets["ANOMALIES"].loc[0, "weight"] = 0
+    report = ValidationReport()
+
+    validate_excel(sheets, report)
+
+    assert [(i.sheet, i.cell) for i in report] == [
+        ("QUESTIONS", "C3"),
+        ("LISTS", "A2"),
+        ("ANOMALIES", "B2"),
+    ]
+    assert report.issues[0].message == "Duplicate question ('V', '50') in QUESTIONS (row 1)"
+    assert all(issue.stage == "excel" for issue in report)
+
+
+def test_mapped_rows_point_back_to_their_workbook_cell():
+    raw = pd.DataFrame([
+        ["Questionnaire", None, None],
+        ["ID", None, "QUESTION WORDING EN"],
+        ["V-50", None, "How many units?"],
+        ["V-60", None, None],
+    ])
+    df = with_detected_header(raw)
+    mapped = tag_source(pd.DataFrame({"label": df["ID"]}), "Volume", df.index)
+    mapped = mapped.reset_index(drop=True)
+    mapped.attrs["source_columns"] = {
+        "Volume": field_columns(df, {"label": "ID", "lang_SYS": "QUESTION WORDING EN"}),
+    }
+
+    assert source_cell(mapped, 1, "label", "QUESTIONS") == ("Volume", "A4")
+    assert source_cell(mapped, 0, "lang_SYS", "QUESTIONS") == ("Volume", "C3")
+    assert source_cell(mapped, 0, "roles", "QUESTIONS") == ("Volume", "3:3")
+
+
+def test_report_is_written_as_json_or_csv(tmp_path):
+    report = ValidationReport()
+    report.add("excel", "Bad value", "Volume", "C3")
+    report.add("schema", "at root: 'n' is a required property")
+
+    payload = json.loads(report.write(tmp_path / "report.json").read_text(encoding="utf-8"))
+    with report.write(tmp_path / "report.csv").open(encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+
+    assert payload["errors"] == 2
+    assert payload["issues"][0] == {
+        "stage": "excel",
+        "severity": "error",
+        "sheet": "Volume",
+        "cell": "C3",
+        "message": "Bad value",
+    }
+    assert rows[1]["stage"] == "schema" and rows[1]["cell"] == ""
+    assert "'Volume'!C3: Bad value" in report.summary()